@@ -1,8 +1,12 @@
 import streamlit as st
-import pandas as pd
 import os
 from src.description import get_course_details
 from src.engine import StudentProfile, check_eligibility
+from src.loader import SchemaError
+from src.cache import EligibilityCache, student_fingerprint
+from src.incremental import IncrementalEvaluator
+from src.reload import DataStore
+from src.stats import RuleStatsRecorder
 
 # --- PAGE SETUP ---
 st.set_page_config(page_title="Semakan TVET (Politeknik & Komuniti)", page_icon="🇲🇾", layout="wide")
@@ -15,65 +19,46 @@ def local_css(file_name):
 # Load the external CSS file
 local_css("assets/style.css")
 
-# --- HELPER FUNCTIONS ---
-def clean_header(text):
-    return str(text).strip().replace("\ufeff", "").lower()
-
 # --- LOAD DATA ---
-@st.cache_data
-def load_data_v20():
-    def load_csv(filename):
-        file_path = os.path.join("data", filename) 
-        try:
-            return pd.read_csv(file_path, encoding="latin1")
-        except UnicodeDecodeError:
-            return pd.read_csv(file_path, encoding="utf-8")
-        except FileNotFoundError:
-            st.error(f"❌ Fail hilang: {filename}. Pastikan fail wujud dalam folder 'data/'.")
-            st.stop()
-
-    courses = load_csv("courses.csv")
-    institutions = load_csv("institutions.csv")
-    reqs = load_csv("requirements.csv")
-    links = load_csv("links.csv")
-    tvet_courses = load_csv("tvet_courses.csv")
-    tvet_inst = load_csv("tvet_institutions.csv")
-    tvet_reqs = load_csv("tvet_requirements.csv")
-
-    all_dfs = [courses, institutions, reqs, links, tvet_courses, tvet_inst, tvet_reqs]
-    for df in all_dfs:
-        df.columns = [clean_header(c) for c in df.columns]
-
-    schema_checks = {
-        "courses.csv": (courses, ['course_id', 'course']),
-        "reqs.csv": (reqs, ['course_id']),
-        "institutions.csv": (institutions, ['institution_id']),
-        "links.csv": (links, ['course_id', 'institution_id']),
-        "tvet_courses.csv": (tvet_courses, ['course_id', 'course']),
-        "tvet_reqs.csv": (tvet_reqs, ['course_id', 'institution_id']),
-        "tvet_inst.csv": (tvet_inst, ['institution_id'])
-    }
-
-    for filename, (df, required_cols) in schema_checks.items():
-        missing = set(required_cols) - set(df.columns)
-        if missing:
-            st.error(f"🛑 Struktur fail '{filename}' salah. Lajur hilang: {missing}")
-            st.stop()
-
-    for df in [courses, reqs, links, tvet_courses, tvet_reqs]:
-        df['course_id'] = df['course_id'].astype(str).str.strip()
-        
-    links['institution_id'] = links['institution_id'].astype(str).str.strip()
-    institutions['institution_id'] = institutions['institution_id'].astype(str).str.strip()
-    tvet_inst['institution_id'] = tvet_inst['institution_id'].astype(str).str.strip()
-    tvet_reqs['institution_id'] = tvet_reqs['institution_id'].astype(str).str.strip()
-
-    poly_dicts = reqs.to_dict('records')
-    tvet_dicts = tvet_reqs.to_dict('records')
-
-    return courses, institutions, reqs, links, tvet_courses, tvet_inst, tvet_reqs, poly_dicts, tvet_dicts
-
-courses_df, inst_df, reqs_df, links_df, t_courses, t_inst, t_reqs, poly_req_list, tvet_req_list = load_data_v20()
+# Typed tables from src/loader.py (read from the binary snapshot in
+# data/snapshot/ unless a CSV changed) and the indexes built from them, held
+# by one DataStore for all sessions. Its thread reloads edited data files
+# and swaps in the new version; see src/reload.py.
+@st.cache_resource
+def get_store():
+    try:
+        store = DataStore("data")
+    except FileNotFoundError as e:
+        st.error(f"❌ Fail hilang: {os.path.basename(e.filename)}. Pastikan fail wujud dalam folder 'data/'.")
+        st.stop()
+    except SchemaError as e:
+        st.error(f"🛑 {e}")
+        st.stop()
+    # The indexes come with the recorded rule order applied (data/rule_stats.json,
+    # from python -m src.cohort --rule-stats or this app with RULE_STATS_SAMPLE set)
+    return store.start()
+
+@st.cache_resource
+def get_result_cache():
+    # One LRU for all sessions: (fingerprint, dataset version) -> eligible ids
+    return EligibilityCache(maxsize=20000)
+
+@st.cache_resource
+def get_rule_recorder():
+    # Opt-in: RULE_STATS_SAMPLE=0.01 adds 1% of this server's checks to
+    # data/rule_stats.json (every 5 minutes and at exit); applied when the indexes are next built
+    sample = float(os.environ.get("RULE_STATS_SAMPLE", "0") or 0)
+    if sample <= 0:
+        return None
+    return RuleStatsRecorder(os.path.join("data", "rule_stats.json"), sample).start()
+
+# One version for the whole run, even if a reload lands halfway through it.
+# Tables are read on first use (src/lazy.py): checking only needs the indexes.
+dataset = get_store().current
+tables = dataset.tables
+poly_index, tvet_index, data_version = dataset.poly_index, dataset.tvet_index, dataset.version
+result_cache = get_result_cache()
+rule_recorder = get_rule_recorder()
 
 # --- SIDEBAR INPUTS ---
 st.sidebar.header("Semakan TVET Malaysia")
@@ -139,13 +124,29 @@ current_student = StudentProfile(
     disability=disability, other_tech=other_tech, other_voc=other_voc
 )
 
-st.sidebar.info(f"📊 Jumlah Kredit Dikira: {current_student.credits}")
-
 def check_gatekeepers():
     if nationality == "Bukan Warganegara": 
         return False, "Maaf, permohonan hanya terbuka kepada Warganegara Malaysia."
     return True, "OK"
 
+# --- LIVE PREVIEW ---
+# Each sidebar change only re-tests the rules that read the changed field
+def live_preview_count():
+    if not check_gatekeepers()[0]:
+        return 0
+    total = 0
+    for name, index in [("preview_poly", poly_index), ("preview_tvet", tvet_index)]:
+        evaluator = st.session_state.get(name)
+        if evaluator is None or evaluator.index is not index:
+            evaluator = st.session_state[name] = IncrementalEvaluator(index, current_student)
+        else:
+            evaluator.sync(current_student)
+        total += evaluator.eligible_count()
+    return total
+
+st.sidebar.info(f"📊 Jumlah Kredit Dikira: {current_student.credits}  \n"
+                f"🎯 Anggaran Program Layak: {live_preview_count()}")
+
 # --- MAIN BUTTON ---
 if st.sidebar.button("Semak Kelayakan", type="primary"):
     passed, msg = check_gatekeepers()
@@ -155,19 +156,15 @@ if st.sidebar.button("Semak Kelayakan", type="primary"):
         st.session_state['fail_reason'] = msg
         st.session_state['checked'] = True
     else:
-        # Check Poly
-        poly_ids = []
-        for req in poly_req_list:
-            is_eligible, reason = check_eligibility(current_student, req)
-            if is_eligible:
-                poly_ids.append(req['course_id'])
-        
-        # Check TVET
-        tvet_ids = []
-        for req in tvet_req_list:
-            is_eligible, reason = check_eligibility(current_student, req)
-            if is_eligible:
-                tvet_ids.append(req['course_id'])
+        # Check Poly & TVET (one entry per course, however many rows offer it)
+        key = (student_fingerprint(current_student), data_version)
+        if rule_recorder is not None:
+            rule_recorder.maybe_record(current_student, poly_index.rules + tvet_index.rules)
+        def compute():
+            return (tuple(poly_index.eligible_courses(current_student)),
+                    tuple(tvet_index.eligible_courses(current_student)))
+        poly_ids, tvet_ids = result_cache.get_or_compute(key, compute)
+        poly_ids, tvet_ids = list(poly_ids), list(tvet_ids)
         
         st.session_state['eligible_ids'] = poly_ids
         st.session_state['tvet_eligible_ids'] = tvet_ids
@@ -199,9 +196,15 @@ if st.session_state.get('checked'):
         m1, m2, m3, m4 = st.columns(4)
         m1.metric("Diploma Politeknik", f"{len(p_poly)}")
         m2.metric("Sijil Kolej Komuniti", f"{len(p_kk)}")
-        m3.metric("Sijil/Diploma TVET", f"{len(set(tvet_ids))}") 
+        m3.metric("Sijil/Diploma TVET", f"{len(tvet_ids)}")
         m4.metric("Jumlah Kredit", f"{current_student.credits}")
 
+        # Each track's tables are read the first time one of its results is shown
+        if poly_ids:
+            courses_df, reqs_df, links_df, inst_df = tables.courses, tables.requirements, tables.links, tables.institutions
+        if tvet_ids:
+            t_courses, t_inst, t_reqs = tables.tvet_courses, tables.tvet_institutions, tables.tvet_requirements
+
         # --- TABS (RENAMED) ---
         tab1, tab2, tab3 = st.tabs(["🏛️ Diploma Politeknik (Akademik)", "🛠️ Sijil Komuniti (Praktikal)", "⚙️ Latihan Industri (TVET)"])
 
@@ -258,7 +261,7 @@ if st.session_state.get('checked'):
                     
                     if sel_poly:
                         cid = res_poly[res_poly['course'] == sel_poly].iloc[0]['course_id']
-                        details = get_course_details(cid, sel_poly)
+                        details = get_course_details(cid, sel_poly, dataset.descriptions)
                         
                         st.info(f"### {details['headline']}")
                         st.write(details['synopsis'])
@@ -267,7 +270,7 @@ if st.session_state.get('checked'):
                         
                         if 'req_interview' in reqs_df.columns:
                             rows = reqs_df[reqs_df['course_id'] == cid]
-                            if rows['req_interview'].apply(lambda x: str(x).strip().lower() in ['1', 'yes', 'true']).any():
+                            if (rows['req_interview'] == 1).any():
                                 st.warning("🗣️ **Perhatian:** Program ini mungkin memerlukan temuduga.")
                         
                         loc_ids = links_df[links_df['course_id'] == cid]['institution_id'].unique()
@@ -331,7 +334,7 @@ if st.session_state.get('checked'):
                     sel_kk = st.selectbox("Pilih Program untuk Detail:", res_kk['course'].unique(), key="sel_kk")
                     if sel_kk:
                         cid = res_kk[res_kk['course'] == sel_kk].iloc[0]['course_id']
-                        details = get_course_details(cid, sel_kk)
+                        details = get_course_details(cid, sel_kk, dataset.descriptions)
                         
                         st.info(f"### {details['headline']}")
                         st.write(details['synopsis'])
@@ -339,7 +342,7 @@ if st.session_state.get('checked'):
                         
                         if 'req_interview' in reqs_df.columns:
                             rows = reqs_df[reqs_df['course_id'] == cid]
-                            if rows['req_interview'].apply(lambda x: str(x).strip().lower() in ['1', 'yes', 'true']).any():
+                            if (rows['req_interview'] == 1).any():
                                 st.warning("🗣️ **Perhatian:** Program ini mungkin memerlukan temuduga.")
 
                         loc_ids = links_df[links_df['course_id'] == cid]['institution_id'].unique()
@@ -371,8 +374,7 @@ if st.session_state.get('checked'):
             if not tvet_ids:
                 st.info("Buat masa ini, tiada program TVET yang sepadan.")
             else:
-                unique_tvet_ids = list(set(tvet_ids))
-                res_tvet = t_courses[t_courses['course_id'].isin(unique_tvet_ids)]
+                res_tvet = t_courses[t_courses['course_id'].isin(tvet_ids)]
                 
                 if res_tvet.empty:
                     st.warning("Data kursus tidak dijumpai.")
@@ -388,7 +390,7 @@ if st.session_state.get('checked'):
                         sel_tvet = st.selectbox("Pilih Program untuk Detail:", res_tvet['course'].unique(), key="sel_tvet")
                         if sel_tvet:
                             cid = res_tvet[res_tvet['course'] == sel_tvet].iloc[0]['course_id']
-                            details = get_course_details(cid, sel_tvet) 
+                            details = get_course_details(cid, sel_tvet, dataset.descriptions)
                             
                             st.info(f"### {details['headline']}")
                             st.write(details['synopsis'])
@@ -407,7 +409,7 @@ if st.session_state.get('checked'):
                                 )
                                 row1 = loc_rows.iloc[0]
                                 m_allow = row1.get('monthly_allowance', 'Tiada')
-                                hostel = "Disediakan" if str(row1.get('free_hostel')).strip() == '1' else "Tiada"
+                                hostel = "Disediakan" if row1.get('free_hostel') == 1 else "Tiada"
                                 st.success(f"💰 **Elaun:** {m_allow} | 🏠 **Asrama:** {hostel}")
 
     # 4. FAILURE ANALYSIS
@@ -417,9 +419,9 @@ if st.session_state.get('checked'):
         eligible_tvet = set(st.session_state.get('tvet_eligible_ids', []))
         all_eligible = eligible_poly.union(eligible_tvet)
 
-        all_poly_courses = set(courses_df['course_id'].unique())
-        all_tvet_courses = set(t_courses['course_id'].unique())
-        all_courses = all_poly_courses.union(all_tvet_courses)
+        # Only poly/KK courses can be inspected below, so the TVET tables stay unread
+        courses_df, reqs_df = tables.courses, tables.requirements
+        all_courses = set(courses_df['course_id'].unique())
 
         rej_ids = list(all_courses - all_eligible)
         
@@ -434,9 +436,10 @@ if st.session_state.get('checked'):
                 for idx, req in rows.iterrows():
                     st.write(f"**Kriteria Set #{idx+1}:**")
                     req_dict = req.to_dict()
-                    is_eligible, reason = check_eligibility(current_student, req_dict)
-                    if not is_eligible:
-                        st.error(f"❌ {reason}")
+                    # Lazy: the audit is only built for the sets that failed
+                    passed_set, audit = check_eligibility(current_student, req_dict, lazy=True)
+                    if not passed_set:
+                        st.error("❌ " + "; ".join(log['reason'] for log in audit if not log['passed']))
                     else:
                         st.success("✅ Set kriteria ini LULUS.")
         else:
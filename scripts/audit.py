@@ -1,22 +1,26 @@
+import os
+import sys
+
 import pandas as pd
 import streamlit as st
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import COUNT_COLUMNS, FLAG_COLUMNS
+from src.loader import TRUE_VALUES, invalid_counts, invalid_flags, read_raw, read_table
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
 st.set_page_config(page_title="Data Audit Tool", page_icon="🕵️‍♀️")
 
 st.title("🕵️‍♀️ Requirement.csv Forensic Audit")
 
 # --- LOAD DATA ---
+# Requirements as written (text), so values the app's loader would reject
+# ('Yes', '2', ...) can be reported; courses through the app's typed reader
 try:
-    reqs = pd.read_csv("requirements.csv", encoding="latin1")
-    courses = pd.read_csv("courses.csv", encoding="latin1")
-    
-    # Clean headers
-    reqs.columns = [c.strip().lower() for c in reqs.columns]
-    courses.columns = [c.strip().lower() for c in courses.columns]
-    
-    # Clean IDs
-    reqs['course_id'] = reqs['course_id'].astype(str).str.strip()
-    courses['course_id'] = courses['course_id'].astype(str).str.strip()
+    reqs = read_raw(os.path.join(DATA_FOLDER, "requirements.csv"))
+    courses = read_table(os.path.join(DATA_FOLDER, "courses.csv"))
     
     st.success("Files loaded. Running logic checks...")
     
@@ -31,11 +35,15 @@ def log_issue(cid, issue_type, details):
     issues.append({"Course ID": cid, "Issue Type": issue_type, "Details": details})
 
 def is_active(val):
-    return str(val).strip().lower() in ['1', '1.0', 'true', 'yes']
+    return str(val).strip().lower() in TRUE_VALUES
+
+# Cells the app's loader rejects (one of them stops the file loading), by its own rules
+bad_flags = {col: invalid_flags(reqs[col]) for col in FLAG_COLUMNS if col in reqs.columns}
+bad_counts = {col: invalid_counts(reqs[col]) for col in COUNT_COLUMNS if col in reqs.columns}
 
 # --- RUN CHECKS ---
 for index, row in reqs.iterrows():
-    cid = row['course_id']
+    cid = str(row['course_id']).strip()
     
     # 1. ORPHAN CHECK
     # Does this ID exist in the Courses table?
@@ -70,6 +78,15 @@ for index, row in reqs.iterrows():
     if min_c > 3 and demanded == 0:
         log_issue(cid, "Vague Requirement", f"Requires {min_c} credits, but lists NO specific subjects.")
 
+    # 6. UNREADABLE VALUES
+    # The app rejects the whole file over one of these, so list them all here
+    for col, bad in bad_flags.items():
+        if bad[index]:
+            log_issue(cid, "Invalid Flag", f"{col} = '{row[col]}' (row {index + 2}); only 0/1 or blank allowed.")
+    for col, bad in bad_counts.items():
+        if bad[index]:
+            log_issue(cid, "Invalid Count", f"{col} = '{row[col]}' (row {index + 2}); must be a whole number 0-127.")
+
 # --- DISPLAY REPORT ---
 if issues:
     st.error(f"Found {len(issues)} Potential Inconsistencies")
@@ -0,0 +1,31 @@
+"""
+Builds the equivalence-class lookup tables (see src/lookup.py).
+
+    python scripts/build_lookup.py [data_folder]
+
+Writes <data_folder>/lookup/poly.npz and tvet.npz. Rerun whenever a
+requirements file changes; the app ignores tables built from other data.
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.index import TRACK_TABLES, load_index
+from src.lookup import build_lookup
+
+def main(data_folder="data"):
+    out_folder = os.path.join(data_folder, "lookup")
+    os.makedirs(out_folder, exist_ok=True)
+    for track in TRACK_TABLES:
+        start = time.time()
+        # Built from the rule check itself, not from the table being replaced
+        table = build_lookup(load_index(track, data_folder, lookup=False))
+        path = os.path.join(out_folder, f"{track}.npz")
+        table.save(path)
+        print(f"{track}: {len(table)} classes, {len(table.sets)} distinct course sets "
+              f"-> {path} ({os.path.getsize(path) // 1024} KB, {time.time() - start:.1f}s)")
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
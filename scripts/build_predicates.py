@@ -0,0 +1,41 @@
+"""
+Generates src/predicates.py, the ahead-of-time compiled predicates (see
+src/codegen.py).
+
+    python scripts/build_predicates.py [data_folder]
+
+Rerun after changing requirements.csv or tvet_requirements.csv and commit
+the result together with the data, so the rule change can be reviewed.
+"""
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.codegen import generate
+from src.engine import load_and_clean_data
+
+OUTPUT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'predicates.py')
+
+# Table name -> (file, dispatch key columns)
+TRACKS = {
+    'POLY': ('requirements.csv', ['course_id']),
+    'TVET': ('tvet_requirements.csv', ['course_id', 'institution_id']),
+}
+
+def build(data_folder="data"):
+    """Returns the generated module source for the CSVs in data_folder."""
+    tracks = {}
+    for table, (filename, key_columns) in TRACKS.items():
+        rows = load_and_clean_data(os.path.join(data_folder, filename)).to_dict('records')
+        tracks[table] = (rows, key_columns)
+    return generate(tracks, sources=", ".join(filename for filename, _ in TRACKS.values()))
+
+def main(data_folder="data"):
+    source = build(data_folder)
+    with open(OUTPUT, 'w') as f:
+        f.write(source)
+    print(f"{source.count('def p_')} predicates -> {OUTPUT}")
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,35 @@
+"""
+Builds data/snapshot/, the binary copy of the cleaned catalogue the app
+starts from (see src/snapshot.py).
+
+    python scripts/build_snapshot.py [data_folder]
+
+The app rebuilds a stale snapshot itself when the data folder is writable;
+run this as a deploy step where it is not.
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.loader import load_catalogue
+from src.snapshot import build_snapshot, load_snapshot, snapshot_dir
+
+def main(data_folder="data"):
+    start = time.time()
+    load_catalogue(data_folder)
+    csv_time = time.time() - start
+    manifest = build_snapshot(data_folder)
+    if manifest is None:
+        sys.exit(f"{data_folder} kept changing during the build; no snapshot written")
+
+    start = time.time()
+    load_snapshot(data_folder)
+    snapshot_time = time.time() - start
+    rows = sum(table['rows'] for table in manifest['tables'].values())
+    print(f"{len(manifest['tables'])} tables, {rows:,} rows -> {snapshot_dir(data_folder)}")
+    print(f"load: CSV {csv_time * 1000:.0f} ms, snapshot {snapshot_time * 1000:.0f} ms")
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,51 @@
+"""
+Audit report for the data team: how requirement rows relate to each other
+(see src/lattice.py) and which rows can never change a verdict.
+
+    python scripts/lattice_report.py [data_folder] [out.csv]
+
+Prints, per track, each distinct rule set with how many rows use it and how
+many rule sets are stronger / weaker than it, followed by the redundant
+rows. With out.csv the redundant rows are also written there.
+"""
+import os
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.index import TRACK_TABLES, load_index
+from src.lattice import redundant_rows
+
+def main(data_folder="data", out_path=None):
+    found = []
+    for track in TRACK_TABLES:
+        index = load_index(track, data_folder, lookup=False)
+        rows = index.rows
+        lattice = index.lattice
+
+        summary = pd.DataFrame({
+            'signature_key': index.keys,
+            'rows': [len(m) for m in index.members],
+            'example': [rows[m[0]]['course_id'] for m in index.members],
+            'stronger': [len(s) for s in lattice.stronger],
+            'weaker': [len(w) for w in lattice.weaker],
+        })
+        print(f"== {track}: {len(rows)} rows, {len(lattice)} rule sets, "
+              f"{sum(summary['weaker'])} subsumption pairs")
+        print(summary.to_string(index=False))
+
+        redundant = pd.DataFrame(redundant_rows(rows), columns=['row', 'course_id', 'covered_by', 'reason', 'signature_key'])
+        redundant.insert(0, 'track', track)
+        print(f"-- {len(redundant)} redundant rows")
+        if len(redundant):
+            print(redundant.to_string(index=False))
+        found.append(redundant)
+
+    if out_path:
+        pd.concat(found, ignore_index=True).to_csv(out_path, index=False)
+        print(f"-> {out_path}")
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,147 @@
+"""
+Columnar cohort: a whole cohort of students as a handful of NumPy arrays
+instead of one StudentProfile per student.
+
+    grades          int8  (students x SUBJECTS)  grade ordinals, 0 = not taken
+    gender          int8  index into GENDERS, -1 for anything else
+    nationality     int8  index into NATIONALITIES
+    colorblind      int8  index into ANSWERS ('Tidak', 'Ya')
+    disability      int8  index into ANSWERS
+    other_tech      bool
+    other_voc       bool
+    credits/passes  int16
+
+That is about 32 bytes a student (400k students ~ 13 MB). A batch is built
+straight from a DataFrame or CSV with column operations, never a per-row
+object, and StudentBatch.arrays() is what the vectorized engines
+(vector.eligibility_matrix, bitmask.MaskTable.matrix) read. Columns follow
+the app.py keys; missing answers take the sidebar defaults (DEFAULTS).
+"""
+import numpy as np
+import pandas as pd
+
+from src.engine import (SUBJECTS, GRADE_ORDINAL, ORDINAL_GRADE, PASS_MIN, CREDIT_MIN, StudentProfile)
+from src.vector import StudentArrays, encode_students
+
+GENDERS = ('Lelaki', 'Perempuan')
+NATIONALITIES = ('Warganegara', 'Bukan Warganegara')
+ANSWERS = ('Tidak', 'Ya')
+
+# Sidebar defaults for answers a school file leaves out
+DEFAULTS = {'gender': 'Lelaki', 'nationality': 'Warganegara', 'colorblind': 'Tidak', 'disability': 'Tidak'}
+TRUE_WORDS = {'1', '1.0', 'true', 'yes', 'ya', 'y'}
+
+CHOICES = {'gender': GENDERS, 'nationality': NATIONALITIES, 'colorblind': ANSWERS, 'disability': ANSWERS}
+COLUMNS = ['grades', 'gender', 'nationality', 'colorblind', 'disability', 'other_tech', 'other_voc', 'credits', 'passes']
+
+def _text(series):
+    return series.fillna('').astype(str).str.strip()
+
+def _code(values, choices):
+    return pd.Categorical(values, categories=choices).codes.astype(np.int8)
+
+class StudentBatch:
+    """A cohort stored column-wise (see module docstring). ids is None or one id per student."""
+
+    def __init__(self, grades, gender, nationality, colorblind, disability, other_tech, other_voc,
+                 credits=None, passes=None, ids=None):
+        self.grades = np.asarray(grades, dtype=np.int8)
+        self.gender = np.asarray(gender, dtype=np.int8)
+        self.nationality = np.asarray(nationality, dtype=np.int8)
+        self.colorblind = np.asarray(colorblind, dtype=np.int8)
+        self.disability = np.asarray(disability, dtype=np.int8)
+        self.other_tech = np.asarray(other_tech, dtype=bool)
+        self.other_voc = np.asarray(other_voc, dtype=bool)
+        if credits is None: credits = (self.grades >= CREDIT_MIN).sum(axis=1)
+        if passes is None: passes = (self.grades >= PASS_MIN).sum(axis=1)
+        self.credits = np.asarray(credits, dtype=np.int16)
+        self.passes = np.asarray(passes, dtype=np.int16)
+        self.ids = None if ids is None else np.asarray(ids, dtype=object)
+
+    @classmethod
+    def from_frame(cls, df, id_column=None):
+        """
+        Builds a batch from a DataFrame of school results (column names are
+        matched case-insensitively). Ids come from id_column, else student_id
+        or id when present.
+        """
+        columns = {str(c).strip().lower(): c for c in df.columns}
+        n = len(df)
+        grades = np.zeros((n, len(SUBJECTS)), dtype=np.int8)
+        for j, subj in enumerate(SUBJECTS):
+            if subj in columns:
+                grades[:, j] = _text(df[columns[subj]]).str.upper().map(GRADE_ORDINAL).fillna(0).to_numpy(np.int8)
+
+        answers = {}
+        for field, choices in CHOICES.items():
+            values = _text(df[columns[field]]) if field in columns else pd.Series([''] * n, index=df.index)
+            answers[field] = _code(values.mask(values == '', DEFAULTS[field]), choices)
+        for field in ['other_tech', 'other_voc']:
+            answers[field] = (_text(df[columns[field]]).str.lower().isin(TRUE_WORDS).to_numpy()
+                              if field in columns else np.zeros(n, dtype=bool))
+
+        if id_column is None:
+            id_column = next((columns[c] for c in ['student_id', 'id'] if c in columns), None)
+        ids = _text(df[id_column]).to_numpy(dtype=object) if id_column is not None else None
+        return cls(grades, ids=ids, **answers)
+
+    @classmethod
+    def from_csv(cls, path, chunksize=None, **read_csv_args):
+        """One batch for the whole file, or an iterator of batches of chunksize rows."""
+        read_csv_args.setdefault('dtype', str)
+        read_csv_args.setdefault('keep_default_na', False)
+        if chunksize is None:
+            return cls.from_frame(pd.read_csv(path, **read_csv_args))
+        return (cls.from_frame(df) for df in pd.read_csv(path, chunksize=chunksize, **read_csv_args))
+
+    @classmethod
+    def from_profiles(cls, students, ids=None):
+        """From StudentProfile objects (credits/passes as the profiles count them)."""
+        arrays = encode_students(students)
+        return cls(
+            arrays.grades,
+            gender=_code([s.gender for s in students], GENDERS),
+            nationality=_code([s.nationality for s in students], NATIONALITIES),
+            colorblind=_code([s.colorblind for s in students], ANSWERS),
+            disability=_code([s.disability for s in students], ANSWERS),
+            other_tech=arrays.other_tech, other_voc=arrays.other_voc,
+            credits=arrays.credits, passes=arrays.passes, ids=ids,
+        )
+
+    def __len__(self):
+        return len(self.credits)
+
+    def __getitem__(self, key):
+        """A sub-batch: slice, index array or bool mask (views where NumPy allows)."""
+        parts = {col: getattr(self, col)[key] for col in COLUMNS}
+        return StudentBatch(ids=None if self.ids is None else self.ids[key], **parts)
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, col).nbytes for col in COLUMNS)
+
+    def arrays(self):
+        """The StudentArrays the vectorized engines read."""
+        return StudentArrays(
+            grades=self.grades,
+            citizen=self.nationality == 0,
+            male=self.gender == 0,
+            female=self.gender == 1,
+            not_colorblind=self.colorblind == 0,
+            not_disabled=self.disability == 0,
+            other_tech=self.other_tech,
+            other_voc=self.other_voc,
+            credits=self.credits,
+            passes=self.passes,
+        )
+
+    def profile(self, i):
+        """StudentProfile for student i, e.g. to explain() one result."""
+        def choice(codes, choices):
+            return choices[codes[i]] if codes[i] >= 0 else ''
+        return StudentProfile(
+            grades={subj: ORDINAL_GRADE[o] for subj, o in zip(SUBJECTS, self.grades[i].tolist()) if o},
+            gender=choice(self.gender, GENDERS), nationality=choice(self.nationality, NATIONALITIES),
+            colorblind=choice(self.colorblind, ANSWERS), disability=choice(self.disability, ANSWERS),
+            other_tech=bool(self.other_tech[i]), other_voc=bool(self.other_voc[i]),
+        )
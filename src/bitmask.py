@@ -0,0 +1,76 @@
+"""
+Bitmask kernel: the cheapest form of the eligibility check.
+
+A requirement row is its required_mask (one bit per switched-on rule in
+FLAG_COLUMNS) plus min_credits and min_pass; a student is their rule_mask
+(one bit per rule they satisfy) plus their credit and pass counts. Then
+
+    eligible = (required & ~satisfied) == 0 and credits >= min_credits and passes >= min_pass
+
+MaskTable runs that over a whole requirements table, either as a plain
+loop over Python ints for one student, or as one NumPy uint64 operation
+for a cohort (student masks from vector.satisfied_rules).
+"""
+import numpy as np
+import pandas as pd
+
+from src.engine import FLAG_COLUMNS, required_mask, requirement_signature, rule_mask
+from src.vector import CHUNK_SIZE, StudentArrays, as_student_arrays, satisfied_rules
+
+_WEIGHTS = np.uint64(1) << np.arange(len(FLAG_COLUMNS), dtype=np.uint64)
+
+def student_masks(students):
+    """uint64 rule_mask per student (StudentProfile list, StudentBatch or StudentArrays)."""
+    students = as_student_arrays(students)
+    return satisfied_rules(students).astype(np.uint64) @ _WEIGHTS
+
+class MaskTable:
+    """required_mask / min_credits / min_pass per requirement row."""
+
+    def __init__(self, required, min_credits, min_pass):
+        self.required = np.asarray(required, dtype=np.uint64)
+        self.min_credits = np.asarray(min_credits, dtype=np.int16)
+        self.min_pass = np.asarray(min_pass, dtype=np.int16)
+        # Plain ints for the scalar loop (NumPy scalars are slow one at a time),
+        # each distinct (mask, thresholds) checked once for all its rows
+        self._distinct = {}
+        for i, entry in enumerate(zip(self.required.tolist(), self.min_credits.tolist(), self.min_pass.tolist())):
+            self._distinct.setdefault(entry, []).append(i)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Encodes a requirements DataFrame (or list of dicts)."""
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.to_dict('records')
+        n = len(FLAG_COLUMNS)
+        sigs = [requirement_signature(req) for req in rows]
+        return cls([required_mask(sig) for sig in sigs], [sig[n] for sig in sigs], [sig[n + 1] for sig in sigs])
+
+    def __len__(self):
+        return len(self.required)
+
+    def eligible_rows(self, student):
+        """Indices of the rows the student qualifies for, in file order."""
+        unmet = ~rule_mask(student)
+        credits, passes = student.credits, student.passes
+        hits = []
+        for (required, min_c, min_p), rows in self._distinct.items():
+            if not required & unmet and credits >= min_c and passes >= min_p:
+                hits.extend(rows)
+        hits.sort()
+        return hits
+
+    def matrix(self, students):
+        """(students x rows) bool matrix, same as vector.eligibility_matrix()."""
+        students = as_student_arrays(students)
+        n = len(students.credits)
+        out = np.empty((n, len(self)), dtype=bool)
+        for start in range(0, n, CHUNK_SIZE):
+            block = StudentArrays(*(a[start:start + CHUNK_SIZE] for a in students))
+            unmet = ~student_masks(block)
+            out[start:start + CHUNK_SIZE] = (
+                ((self.required[None, :] & unmet[:, None]) == 0)
+                & (block.credits[:, None] >= self.min_credits[None, :])
+                & (block.passes[:, None] >= self.min_pass[None, :])
+            )
+        return out
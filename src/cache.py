@@ -0,0 +1,73 @@
+"""
+Result cache shared by every session.
+
+Many students have the same effective profile: the engine only sees which
+rules they satisfy (rule_mask) and how many credits and passes they have.
+That triple is the student's fingerprint. It does not depend on the order
+grades were entered in, and subjects that no rule names (geo, psv, ...) only
+show up through the counts. Results are cached per (fingerprint, dataset
+version) in a bounded LRU, so a new version of the data never serves stale
+answers.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from src.engine import rule_mask
+
+def student_fingerprint(student):
+    """Canonical key of everything the engine can see about a student."""
+    return (rule_mask(student), student.credits, student.passes)
+
+def dataset_version(paths):
+    """Short content hash of the given data files."""
+    h = hashlib.blake2b(digest_size=8)
+    for path in paths:
+        h.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+class LRUCache:
+    """Thread-safe bounded LRU with hit/miss/eviction counters."""
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_or_compute(self, key, compute):
+        """Returns the cached value for key, or stores and returns compute()."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+        # Computed outside the lock; two sessions racing on one key both compute it
+        value = compute()
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0}
+
+# The eligibility results were its first use; the name is kept for them
+EligibilityCache = LRUCache
@@ -0,0 +1,100 @@
+"""
+Ahead-of-time compiler: requirement CSVs -> a plain Python module.
+
+generate() writes one function per distinct requirement signature, with
+straight-line checks for just the rules that signature switches on
+(subject indices and grade thresholds inlined, no dict lookups, no flags
+that are 0), and one dispatch table per track:
+
+    POLY[course_id]                   -> (predicate, ...)
+    TVET[(course_id, institution_id)] -> (predicate, ...)
+
+A key maps to more than one predicate when a course has alternative
+criteria sets; the student qualifies if any of them passes. The output
+(src/predicates.py, built by scripts/build_predicates.py) is committed, so a
+rule change by the data team shows up as a readable diff. It answers the
+same as check_eligibility(), which stays the reference.
+"""
+from src.engine import (FLAG_COLUMNS, COUNT_COLUMNS, SUBJECT_INDEX, ATTEMPTED_MIN, PASS_MIN, CREDIT_MIN,
+                        compile_signature, requirement_signature, signature_key)
+
+_BM, _ENG, _HIST, _MATH, _ADDMATH = (SUBJECT_INDEX[s] for s in ('bm', 'eng', 'hist', 'math', 'addmath'))
+
+# Python expression per rule column, reading student `s` and its ordinals `o`
+# (keep in step with the rule tests in src/engine.py)
+RULE_SOURCE = {
+    'req_malaysian': "s.nationality == 'Warganegara'",
+    'req_male': "s.gender == 'Lelaki'",
+    'req_female': "s.gender == 'Perempuan'",
+    'no_colorblind': "s.colorblind == 'Tidak'",
+    'no_disability': "s.disability == 'Tidak'",
+    '3m_only': f"o[{_BM}] >= {ATTEMPTED_MIN} and o[{_MATH}] >= {ATTEMPTED_MIN}",
+    'pass_bm': f"o[{_BM}] >= {PASS_MIN}",
+    'credit_bm': f"o[{_BM}] >= {CREDIT_MIN}",
+    'pass_history': f"o[{_HIST}] >= {PASS_MIN}",
+    'pass_eng': f"o[{_ENG}] >= {PASS_MIN}",
+    'credit_english': f"o[{_ENG}] >= {CREDIT_MIN}",
+    'pass_math': f"o[{_MATH}] >= {PASS_MIN} or o[{_ADDMATH}] >= {PASS_MIN}",
+    'credit_math': f"o[{_MATH}] >= {CREDIT_MIN} or o[{_ADDMATH}] >= {CREDIT_MIN}",
+    'pass_math_sci': f"o[{_MATH}] >= {PASS_MIN} or s.pure_sci_pass",
+    'pass_science_tech': "s.sci_tech_pass or s.other_tech",
+    'credit_math_sci': f"o[{_MATH}] >= {CREDIT_MIN} or s.pure_sci_credit",
+    'credit_math_sci_tech': f"o[{_MATH}] >= {CREDIT_MIN} or s.sci_tech_credit or s.other_tech",
+    'pass_stv': "s.sci_tech_pass or s.other_tech or s.other_voc",
+}
+
+HEADER = '''"""
+GENERATED by scripts/build_predicates.py from {sources} -- do not edit.
+
+One predicate per distinct requirement signature and one dispatch table
+per track (see src/codegen.py). Rerun the script after changing a
+requirements file.
+"""
+'''
+
+def _predicate_source(sig):
+    n = len(FLAG_COLUMNS)
+    compiled = compile_signature(sig)
+    rules = compiled.gatekeepers + ((compiled.three_m,) if compiled.three_m else ()) + compiled.academics
+    name = "p_" + signature_key(dict(zip(FLAG_COLUMNS + COUNT_COLUMNS, map(int, sig))))
+    lines = [f"def {name}(s):", f"    # {', '.join(rule.label for rule in rules) or 'no requirements'}"]
+    if any('o[' in RULE_SOURCE.get(rule.column, '') for rule in rules):
+        lines.append("    o = s.ordinals")
+    for rule in rules:
+        if rule.column == 'min_credits':
+            lines.append(f"    if s.credits < {sig[n]}: return False")
+        elif rule.column == 'min_pass':
+            lines.append(f"    if s.passes < {sig[n + 1]}: return False")
+        else:
+            lines.append(f"    if not ({RULE_SOURCE[rule.column]}): return False")
+    lines.append("    return True")
+    return name, "\n".join(lines)
+
+def generate(tracks, sources=""):
+    """
+    tracks: {TABLE_NAME: (rows, key_columns)}, rows as dicts in file order.
+    Returns the module source text.
+    """
+    functions = {}   # signature -> (name, source), first-seen order
+    tables = []
+    for table, (rows, key_columns) in tracks.items():
+        entries = {}
+        for req in rows:
+            sig = requirement_signature(req)
+            if sig not in functions:
+                functions[sig] = _predicate_source(sig)
+            key = tuple(str(req[col]).strip() for col in key_columns)
+            key = key[0] if len(key) == 1 else key
+            names = entries.setdefault(key, [])
+            if functions[sig][0] not in names:
+                names.append(functions[sig][0])
+        body = "\n".join(f"    {key!r}: ({', '.join(names)},)," for key, names in entries.items())
+        tables.append(f"{table} = {{\n{body}\n}}")
+
+    parts = [HEADER.format(sources=sources)]
+    parts += [source + "\n" for _, source in functions.values()]
+    parts += [t + "\n" for t in tables]
+    parts.append('def check(table, key, student):\n'
+                 '    """True when any alternative criteria set of table[key] passes."""\n'
+                 '    return any(p(student) for p in table[key])\n')
+    return "\n".join(parts)
@@ -0,0 +1,241 @@
+"""
+Batch screening for whole-school cohorts.
+
+    python -m src.cohort students.csv [-o results.ndjson] [--format ndjson|csv]
+                         [--chunk-size 1000] [--workers 1] [--data data]
+                         [--stats rule_set_stats.json] [--rule-stats rule_stats.json]
+
+Reads students from CSV or NDJSON (one JSON object per line; "-" is stdin)
+and writes one result per student, in input order, as they are screened:
+
+    {"student_id": "S001", "credits": 5, "poly": [...], "kk": [...], "tvet": [...]}
+
+Input fields use the app.py keys: one column per subject (bm, eng, hist,
+math, addmath, ...) holding a grade ("A+" ... "G"; blank or "Tidak Ambil"
+when not taken), plus gender, nationality, colorblind, disability,
+other_tech and other_voc. Missing answers take the sidebar defaults.
+student_id (or id) is copied through; otherwise the row number is used.
+
+Records are read, profiled and screened one chunk at a time, and results
+are cached per student fingerprint in a bounded LRU, so memory stays flat
+however long the input is. As in the app, non-citizens get no courses.
+--stats / --rule-stats record the pass rates and rule rejection rates the
+app loads from data/rule_set_stats.json and data/rule_stats.json.
+
+--workers N shards the chunks over N processes (see screen_parallel) and
+merges their results back in input order.
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from src.batch import DEFAULTS, TRUE_WORDS
+from src.cache import EligibilityCache, student_fingerprint
+from src.engine import SUBJECTS, StudentProfile
+from src.index import TRACK_TABLES, load_index
+from src.stats import RuleSetStats, RuleStats
+
+OUTPUT_FIELDS = ['student_id', 'credits', 'poly', 'kk', 'tvet']
+
+def load_indexes(data_folder="data"):
+    """RequirementIndex per track, built as the app builds them (index.load_index)."""
+    return {track: load_index(track, data_folder) for track in TRACK_TABLES}
+
+def _clean_keys(record):
+    # " BM " and "bm" are the same field, whichever format it came in
+    return {str(k).strip().lower(): v for k, v in record.items() if k is not None}
+
+def read_records(f, fmt):
+    """Yields one dict per student (keys stripped and lower-cased) from an open CSV or NDJSON file."""
+    if fmt == 'csv':
+        for record in csv.DictReader(f):
+            yield _clean_keys(record)
+    else:
+        for line in f:
+            if line.strip():
+                yield _clean_keys(json.loads(line))
+
+def _text(value):
+    return "" if value is None else str(value).strip()
+
+def profile_from_record(record):
+    """Builds the StudentProfile for one input record."""
+    grades = {}
+    for subj in SUBJECTS:
+        grade = _text(record.get(subj)).upper()
+        if grade:
+            grades[subj] = grade
+    answers = {field: _text(record.get(field)) or default for field, default in DEFAULTS.items()}
+    return StudentProfile(
+        grades=grades,
+        other_tech=_text(record.get('other_tech')).lower() in TRUE_WORDS,
+        other_voc=_text(record.get('other_voc')).lower() in TRUE_WORDS,
+        **answers
+    )
+
+def chunked(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+class Screener:
+    """Screens one StudentProfile against both tracks (poly/KK and TVET)."""
+
+    def __init__(self, indexes, cache_size=20000, stats=None, rule_stats=None):
+        self.indexes = indexes
+        self.cache = EligibilityCache(maxsize=cache_size)
+        self.stats = stats
+        self.rule_stats = rule_stats
+
+    def _courses(self, student):
+        if self.stats is None and self.rule_stats is None:
+            return tuple(tuple(index.eligible_courses(student)) for index in self.indexes.values())
+        found = []
+        for index in self.indexes.values():
+            if self.rule_stats is not None:
+                self.rule_stats.record_all(student, index.rules)
+            verdicts = index.course_verdicts(student, self.stats)
+            found.append(tuple(c for c, row in verdicts.items() if row is not None))
+        return tuple(found)
+
+    def screen(self, student):
+        """{'credits', 'poly', 'kk', 'tvet'} for one student."""
+        if student.nationality == 'Bukan Warganegara':
+            poly_ids, tvet_ids = (), ()
+        elif self.stats is None and self.rule_stats is None:
+            poly_ids, tvet_ids = self.cache.get_or_compute(student_fingerprint(student), lambda: self._courses(student))
+        else:
+            # Recording needs every student checked, not served from the cache
+            poly_ids, tvet_ids = self._courses(student)
+        return {
+            'credits': student.credits,
+            'poly': [c for c in poly_ids if "POLY" in c],
+            'kk': [c for c in poly_ids if "POLY" not in c],
+            'tvet': list(tvet_ids),
+        }
+
+def screen_records(records, screener, chunk_size=1000, first_row=0):
+    """Yields one result dict per record, in input order, a chunk at a time."""
+    row = first_row
+    for chunk in chunked(records, chunk_size):
+        profiles = [profile_from_record(record) for record in chunk]
+        for record, student in zip(chunk, profiles):
+            row += 1
+            student_id = _text(record.get('student_id', record.get('id'))) or str(row)
+            yield dict(student_id=student_id, **screener.screen(student))
+
+# --- PARALLEL MODE ---
+# The catalogue (indexes and lookup tables) is built once, in the parent.
+# Forked workers inherit it copy-on-write; where fork is unavailable each
+# worker builds its own once, in the pool initializer. Either way only the
+# student records and their results are pickled per task.
+_WORKER = None
+
+def _init_worker(data_folder):
+    global _WORKER
+    if _WORKER is None:
+        _WORKER = Screener(load_indexes(data_folder))
+
+def _screen_chunk(chunk, first_row, record_stats, record_rule_stats):
+    screener = _WORKER
+    # Fresh counters per task; the parent adds them up
+    screener.stats = RuleSetStats() if record_stats else None
+    screener.rule_stats = RuleStats() if record_rule_stats else None
+    results = list(screen_records(chunk, screener, len(chunk), first_row))
+    return (results,
+            screener.stats.counts if record_stats else None,
+            screener.rule_stats.counts if record_rule_stats else None)
+
+def screen_parallel(records, screener, workers, chunk_size=1000, data_folder="data"):
+    """
+    Like screen_records(), with chunks screened by a pool of `workers` processes.
+    At most 2 chunks per worker are in flight, so memory stays bounded, and
+    results come back in input order. Worker stats are merged into screener's.
+    """
+    global _WORKER
+    fork = 'fork' in multiprocessing.get_all_start_methods()
+    _WORKER = screener if fork else None
+    try:
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork') if fork else None,
+                                 initializer=_init_worker, initargs=(data_folder,)) as pool:
+            pending = deque()
+            row = 0
+
+            def collect():
+                results, stats, rule_stats = pending.popleft().result()
+                if stats is not None: screener.stats.merge(RuleSetStats(stats))
+                if rule_stats is not None: screener.rule_stats.merge(RuleStats(rule_stats))
+                return results
+
+            for chunk in chunked(records, chunk_size):
+                pending.append(pool.submit(_screen_chunk, chunk, row,
+                                           screener.stats is not None, screener.rule_stats is not None))
+                row += len(chunk)
+                if len(pending) >= 2 * workers:
+                    yield from collect()
+            while pending:
+                yield from collect()
+    finally:
+        _WORKER = None
+
+def write_results(results, f, fmt):
+    """Streams result dicts to an open file as NDJSON or CSV (course ids joined by ';')."""
+    if fmt == 'csv':
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDS)
+        writer.writeheader()
+        for result in results:
+            writer.writerow({k: ";".join(v) if isinstance(v, list) else v for k, v in result.items()})
+    else:
+        for result in results:
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+def _format(path, given):
+    if given:
+        return given
+    return 'csv' if path.lower().endswith('.csv') else 'ndjson'
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.cohort", description="Screen a cohort of SPM results.")
+    parser.add_argument("input", help="student CSV or NDJSON file, '-' for stdin")
+    parser.add_argument("-o", "--output", default="-", help="results file, '-' for stdout (default)")
+    parser.add_argument("--input-format", choices=['csv', 'ndjson'], help="default: from the file extension")
+    parser.add_argument("--format", choices=['csv', 'ndjson'], help="output format, default: from the extension")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: screen in-process)")
+    parser.add_argument("--data", default="data", help="folder with the requirement CSVs")
+    parser.add_argument("--stats", help="record per rule set pass rates to this JSON file")
+    parser.add_argument("--rule-stats", help="record per rule rejection rates to this JSON file")
+    args = parser.parse_args(argv)
+
+    stats = RuleSetStats() if args.stats else None
+    rule_stats = RuleStats() if args.rule_stats else None
+    screener = Screener(load_indexes(args.data), stats=stats, rule_stats=rule_stats)
+
+    in_format = _format(args.input, args.input_format)
+    out_format = _format(args.output, args.format)
+    fin = sys.stdin if args.input == "-" else open(args.input, newline='', encoding='utf-8-sig')
+    fout = sys.stdout if args.output == "-" else open(args.output, 'w', newline='', encoding='utf-8')
+    try:
+        records = read_records(fin, in_format)
+        if args.workers > 1:
+            results = screen_parallel(records, screener, args.workers, args.chunk_size, args.data)
+        else:
+            results = screen_records(records, screener, args.chunk_size)
+        write_results(results, fout, out_format)
+    finally:
+        if fin is not sys.stdin: fin.close()
+        if fout is not sys.stdout: fout.close()
+
+    if stats is not None: stats.save(args.stats)
+    if rule_stats is not None: rule_stats.save(args.rule_stats)
+
+if __name__ == '__main__':
+    main()
@@ -1,35 +1,35 @@
+import hashlib
+from collections import namedtuple
+from collections.abc import Sequence
+
 import pandas as pd
 import numpy as np
 
+# List of columns that MUST be integers (0 or 1).
+# The order is also the order the engine checks them in.
+FLAG_COLUMNS = [
+    'req_malaysian', 'req_male', 'req_female', 'no_colorblind', 'no_disability',
+    '3m_only', 'pass_bm', 'credit_bm', 'pass_history', 
+    'pass_eng', 'credit_english', 'pass_math', 'credit_math',
+    'pass_math_sci', 'pass_science_tech', 'credit_math_sci',
+    'credit_math_sci_tech', 'pass_stv'
+]
+GATEKEEPER_COLUMNS = FLAG_COLUMNS[:5]
+ACADEMIC_COLUMNS = FLAG_COLUMNS[6:]
+
+# Counts, not flags
+COUNT_COLUMNS = ['min_credits', 'min_pass']
+
 # --- 1. DATA SANITIZER (The Bouncer) ---
 def load_and_clean_data(filepath):
     """
-    Loads CSV and enforces strict integer types for flag columns.
-    Converts '1.0', 'Yes', 'True' -> 1
-    Converts '0', 'No', 'False', NaN -> 0
+    Loads a requirements CSV and enforces strict integer types for flag columns.
+    Converts '1.0' -> 1, '0' and blank -> 0
+    Rejects anything else ('Yes', 'True', '2') with loader.SchemaError
+    The reading itself lives in src.loader, shared with the app and scripts.
     """
-    df = pd.read_csv(filepath)
-    
-    # List of columns that MUST be integers (0 or 1)
-    flag_columns = [
-        'req_malaysian', 'req_male', 'req_female', 'no_colorblind', 'no_disability',
-        '3m_only', 'pass_bm', 'credit_bm', 'pass_history', 
-        'pass_eng', 'credit_english', 'pass_math', 'credit_math',
-        'pass_math_sci', 'pass_science_tech', 'credit_math_sci',
-        'credit_math_sci_tech', 'pass_stv'
-    ]
-    
-    for col in flag_columns:
-        if col in df.columns:
-            # Force numeric, turning errors (like 'Yes') into NaN
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
-    
-    # Handle 'min_credits' and 'min_pass' separately (they are counts, not flags)
-    for col in ['min_credits', 'min_pass']:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
-            
-    return df
+    from src.loader import load_requirements
+    return load_requirements(filepath)
 
 # --- 2. HELPER FUNCTIONS ---
 def is_pass(grade):
@@ -47,119 +47,379 @@ def is_attempted(grade):
     if grade in ["Tidak Ambil", None, "", "nan"]: return False
     return grade in ["A+", "A", "A-", "B+", "B", "C+", "C", "D", "E", "G"]
 
+# Grade ordinals for array-based engines: 0 = not taken, G = 1 ... A+ = 10.
+# is_attempted/is_pass/is_credit are ordinal >= ATTEMPTED_MIN/PASS_MIN/CREDIT_MIN.
+GRADE_ORDINAL = {g: i for i, g in enumerate(["G", "E", "D", "C", "C+", "B", "B+", "A-", "A", "A+"], 1)}
+ATTEMPTED_MIN, PASS_MIN, CREDIT_MIN = 1, 2, 4
+
+def grade_ordinal(grade):
+    """Returns the grade's ordinal, 0 for 'Tidak Ambil' or anything unknown."""
+    return GRADE_ORDINAL.get(grade, 0)
+
+# The subject keys used by app.py, in the order StudentProfile stores them
+SUBJECTS = [
+    'bm', 'eng', 'hist', 'math', 'addmath', 'phy', 'chem', 'bio',
+    'sci', 'geo', 'acc', 'biz', 'econ', 'psv', 'lang', 'lit',
+    'rel', 'rel_add', 'rc', 'cs', 'agro', 'srt'
+]
+SUBJECT_INDEX = {s: i for i, s in enumerate(SUBJECTS)}
+ORDINAL_GRADE = [None] + sorted(GRADE_ORDINAL, key=GRADE_ORDINAL.get)
+
+PURE_SCIENCE = ('phy', 'chem', 'bio')
+ALL_SCIENCE = PURE_SCIENCE + ('sci',)
+TECHNICAL = ('rc', 'cs', 'agro', 'srt')
+_PURE = [SUBJECT_INDEX[s] for s in PURE_SCIENCE]
+_SCI_TECH = [SUBJECT_INDEX[s] for s in ALL_SCIENCE + TECHNICAL]
+_BM, _ENG, _HIST, _MATH, _ADDMATH = (SUBJECT_INDEX[s] for s in ('bm', 'eng', 'hist', 'math', 'addmath'))
+
+class GradeView:
+    """
+    dict-like view of a StudentProfile's grades. Writes go straight back into
+    the profile, so credits/passes and the group flags stay in step.
+    Subjects that were not taken (or had an unknown grade) are absent.
+    """
+    __slots__ = ('_student',)
+
+    def __init__(self, student):
+        self._student = student
+
+    def get(self, subj, default=None):
+        i = SUBJECT_INDEX.get(subj)
+        o = self._student.ordinals[i] if i is not None else (self._student.extra or {}).get(subj, 0)
+        return ORDINAL_GRADE[o] if o else default
+
+    def __getitem__(self, subj):
+        grade = self.get(subj)
+        if grade is None: raise KeyError(subj)
+        return grade
+
+    def __setitem__(self, subj, grade):
+        self._student.set_grade(subj, grade)
+
+    def __contains__(self, subj):
+        return self.get(subj) is not None
+
+    def __iter__(self):
+        st = self._student
+        yield from (s for s, o in zip(SUBJECTS, st.ordinals) if o)
+        yield from (s for s, o in (st.extra or {}).items() if o)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def keys(self): return list(self)
+    def items(self): return [(s, self[s]) for s in self]
+
 class StudentProfile:
+    """
+    One student's results. Grades are kept as ordinals in a fixed-slot array
+    (see SUBJECTS / GRADE_ORDINAL); subjects outside SUBJECTS only count
+    towards credits/passes. Everything the engine asks about is worked out
+    once here, so a check is a handful of attribute reads.
+    """
+    __slots__ = (
+        'ordinals', 'extra', 'gender', 'nationality', 'colorblind', 'disability',
+        'other_tech', 'other_voc', 'credits', 'passes', 'three_m',
+        'pure_sci_pass', 'pure_sci_credit', 'sci_tech_pass', 'sci_tech_credit'
+    )
+
     def __init__(self, grades, gender, nationality, colorblind, disability, other_tech=False, other_voc=False):
-        self.grades = grades
         self.gender = gender
         self.nationality = nationality
         self.colorblind = colorblind
         self.disability = disability
         self.other_tech = other_tech
         self.other_voc = other_voc
-        
-        self.credits = 0
-        self.passes = 0
-        
+        self.grades = grades
+
+    @property
+    def grades(self):
+        return GradeView(self)
+
+    @grades.setter
+    def grades(self, grades):
+        self.ordinals = bytearray(len(SUBJECTS))
+        self.extra = None
         for subj, grade in grades.items():
-            if is_credit(grade): self.credits += 1
-            if is_pass(grade): self.passes += 1
+            self._store(subj, grade)
+        self._aggregate()
 
-# --- 3. THE ENGINE (Pure Logic) ---
-def check_eligibility(student, req):
-    """
-    Checks if a student meets the requirements.
-    Expects 'req' to be a CLEAN dictionary (integers only).
-    """
-    audit = []
-    
-    def check(label, condition, fail_msg=None):
-        if condition:
-            audit.append({"label": label, "passed": True, "reason": None})
-            return True
+    def set_grade(self, subj, grade):
+        """Changes one subject's grade and refreshes the aggregates."""
+        self._store(subj, grade)
+        self._aggregate()
+
+    def _store(self, subj, grade):
+        i = SUBJECT_INDEX.get(subj)
+        if i is not None:
+            self.ordinals[i] = grade_ordinal(grade)
         else:
-            audit.append({"label": label, "passed": False, "reason": fail_msg})
-            return False
+            if self.extra is None: self.extra = {}
+            self.extra[subj] = grade_ordinal(grade)
 
-    # GATEKEEPERS
-    # Notice: We removed 'safe_int'. We trust the data is clean now.
-    if req.get('req_malaysian') == 1:
-        if not check("Warganegara", student.nationality == 'Warganegara', "Hanya untuk Warganegara"): return False, audit
-    if req.get('req_male') == 1:
-        if not check("Jantina (Lelaki)", student.gender == 'Lelaki', "Lelaki Sahaja"): return False, audit
-    if req.get('req_female') == 1:
-        if not check("Jantina (Wanita)", student.gender == 'Perempuan', "Wanita Sahaja"): return False, audit
-    if req.get('no_colorblind') == 1:
-        if not check("Bebas Buta Warna", student.colorblind == 'Tidak', "Tidak boleh rabun warna"): return False, audit
-    if req.get('no_disability') == 1:
-        if not check("Sihat Tubuh Badan", student.disability == 'Tidak', "Syarat fizikal tidak dipenuhi"): return False, audit
-
-    g = student.grades
+    def _aggregate(self):
+        o = self.ordinals
+        every = list(o) + list(self.extra.values()) if self.extra else o
+        self.credits = sum(1 for x in every if x >= CREDIT_MIN)
+        self.passes = sum(1 for x in every if x >= PASS_MIN)
+        self.three_m = o[_BM] >= ATTEMPTED_MIN and o[_MATH] >= ATTEMPTED_MIN
+        best_pure = max(o[i] for i in _PURE)
+        best_sci_tech = max(o[i] for i in _SCI_TECH)
+        self.pure_sci_pass = best_pure >= PASS_MIN
+        self.pure_sci_credit = best_pure >= CREDIT_MIN
+        self.sci_tech_pass = best_sci_tech >= PASS_MIN
+        self.sci_tech_credit = best_sci_tech >= CREDIT_MIN
 
-    # TVET SPECIAL (3M)
-    # Notice: Clean and Simple again!
-    if req.get('3m_only') == 1:
-        has_bm = is_attempted(g.get('bm'))
-        has_math = is_attempted(g.get('math'))
-        if check("Syarat 3M (BM & Math)", has_bm and has_math, "Perlu sekurang-kurangnya Gred G dalam BM dan Matematik"):
-            return True, audit
-        else:
-            return False, audit
+# --- 3. THE COMPILER (Rows -> Predicates) ---
+# Every rule is (column, audit label, fail message, test). A compiled row only
+# carries the rules whose column is switched on, so checking a student never
+# touches the flags that are 0.
+Rule = namedtuple('Rule', ['column', 'label', 'fail_msg', 'test'])
+
+def _is_citizen(s): return s.nationality == 'Warganegara'
+def _is_male(s): return s.gender == 'Lelaki'
+def _is_female(s): return s.gender == 'Perempuan'
+def _not_colorblind(s): return s.colorblind == 'Tidak'
+def _not_disabled(s): return s.disability == 'Tidak'
+
+def _three_m(s): return s.three_m
+
+def _pass_bm(s): return s.ordinals[_BM] >= PASS_MIN
+def _credit_bm(s): return s.ordinals[_BM] >= CREDIT_MIN
+def _pass_history(s): return s.ordinals[_HIST] >= PASS_MIN
+def _pass_eng(s): return s.ordinals[_ENG] >= PASS_MIN
+def _credit_eng(s): return s.ordinals[_ENG] >= CREDIT_MIN
 
+# Logic: Passing Add Math satisfies the "Math" requirement.
+def _pass_math(s): return max(s.ordinals[_MATH], s.ordinals[_ADDMATH]) >= PASS_MIN
+def _credit_math(s): return max(s.ordinals[_MATH], s.ordinals[_ADDMATH]) >= CREDIT_MIN
+
+# Group Logic ('other_tech' counts as a C in a technical subject)
+def _pass_math_sci(s): return s.ordinals[_MATH] >= PASS_MIN or s.pure_sci_pass
+def _pass_science_tech(s): return s.sci_tech_pass or bool(s.other_tech)
+def _credit_math_sci(s): return s.ordinals[_MATH] >= CREDIT_MIN or s.pure_sci_credit
+def _credit_math_sci_tech(s): return s.ordinals[_MATH] >= CREDIT_MIN or s.sci_tech_credit or bool(s.other_tech)
+def _pass_stv(s): return s.sci_tech_pass or bool(s.other_tech) or bool(s.other_voc)
+
+RULES = {rule.column: rule for rule in [
+    # GATEKEEPERS
+    Rule('req_malaysian', "Warganegara", "Hanya untuk Warganegara", _is_citizen),
+    Rule('req_male', "Jantina (Lelaki)", "Lelaki Sahaja", _is_male),
+    Rule('req_female', "Jantina (Wanita)", "Wanita Sahaja", _is_female),
+    Rule('no_colorblind', "Bebas Buta Warna", "Tidak boleh rabun warna", _not_colorblind),
+    Rule('no_disability', "Sihat Tubuh Badan", "Syarat fizikal tidak dipenuhi", _not_disabled),
+    # TVET SPECIAL (3M)
+    Rule('3m_only', "Syarat 3M (BM & Math)", "Perlu sekurang-kurangnya Gred G dalam BM dan Matematik", _three_m),
     # ACADEMIC CHECKS
-    passed_academics = True
-
-    if req.get('pass_bm') == 1:
-        if not check("Lulus BM", is_pass(g.get('bm')), "Gagal Bahasa Melayu"): passed_academics = False
-    if req.get('credit_bm') == 1:
-        if not check("Kredit BM", is_credit(g.get('bm')), "Tiada Kredit Bahasa Melayu"): passed_academics = False
-    if req.get('pass_history') == 1:
-        if not check("Lulus Sejarah", is_pass(g.get('hist')), "Gagal Sejarah"): passed_academics = False
-    if req.get('pass_eng') == 1:
-        if not check("Lulus BI", is_pass(g.get('eng')), "Gagal Bahasa Inggeris"): passed_academics = False
-    if req.get('credit_english') == 1:
-        if not check("Kredit BI", is_credit(g.get('eng')), "Tiada Kredit Bahasa Inggeris"): passed_academics = False
-
-    # Logic: Passing Add Math satisfies the "Math" requirement.
-    if req.get('pass_math') == 1:
-        # Check Modern Math OR Add Math
-        cond = is_pass(g.get('math')) or is_pass(g.get('addmath'))
-        if not check("Lulus Matematik", cond, "Gagal Matematik & Add Math"): passed_academics = False
-    if req.get('credit_math') == 1:
-        # Check Credit in Modern Math OR Add Math
-        cond = is_credit(g.get('math')) or is_credit(g.get('addmath'))
-        if not check("Kredit Matematik", cond, "Tiada Kredit Matematik atau Add Math"): passed_academics = False
-
-    # Group Logic
-    pure_sci = [g.get('phy'), g.get('chem'), g.get('bio')]
-    all_sci = pure_sci + [g.get('sci')]
-    tech_subjs = [g.get('rc'), g.get('cs'), g.get('agro'), g.get('srt')]
-    if student.other_tech: tech_subjs.append('C')
-
-    def has_pass(grade_list): return any(is_pass(x) for x in grade_list)
-    def has_credit(grade_list): return any(is_credit(x) for x in grade_list)
-
-    if req.get('pass_math_sci') == 1:
-        cond = is_pass(g.get('math')) or has_pass(pure_sci)
-        if not check("Lulus Matemaik ATAU Sains Tulen", cond, "Perlu Lulus Math/Sains Tulen"): passed_academics = False
-    if req.get('pass_science_tech') == 1:
-        cond = has_pass(all_sci) or has_pass(tech_subjs)
-        if not check("Lulus Sains ATAU Teknikal", cond, "Perlu Lulus Sains/Teknikal"): passed_academics = False
-    if req.get('credit_math_sci') == 1:
-        cond = is_credit(g.get('math')) or has_credit(pure_sci)
-        if not check("Kredit Matematik ATAU Sains Tulen", cond, "Perlu Kredit Math/Sains Tulen"): passed_academics = False
-    if req.get('credit_math_sci_tech') == 1:
-        cond = is_credit(g.get('math')) or has_credit(all_sci) or has_credit(tech_subjs)
-        if not check("Kredit Math/Sains/Teknikal", cond, "Perlu Kredit Math/Sains/Teknikal"): passed_academics = False
-    if req.get('pass_stv') == 1:
-        cond = has_pass(all_sci) or has_pass(tech_subjs) or student.other_voc
-        if not check("Aliran Sains/Vokasional", cond, "Perlu Lulus Sains/Vokasional"): passed_academics = False
-
-    min_c = req.get('min_credits', 0)
-    if min_c > 0:
-        if not check(f"Minimum {min_c} Kredit", student.credits >= min_c, f"Hanya {student.credits} Kredit (Perlu {min_c})"): passed_academics = False
+    Rule('pass_bm', "Lulus BM", "Gagal Bahasa Melayu", _pass_bm),
+    Rule('credit_bm', "Kredit BM", "Tiada Kredit Bahasa Melayu", _credit_bm),
+    Rule('pass_history', "Lulus Sejarah", "Gagal Sejarah", _pass_history),
+    Rule('pass_eng', "Lulus BI", "Gagal Bahasa Inggeris", _pass_eng),
+    Rule('credit_english', "Kredit BI", "Tiada Kredit Bahasa Inggeris", _credit_eng),
+    Rule('pass_math', "Lulus Matematik", "Gagal Matematik & Add Math", _pass_math),
+    Rule('credit_math', "Kredit Matematik", "Tiada Kredit Matematik atau Add Math", _credit_math),
+    Rule('pass_math_sci', "Lulus Matemaik ATAU Sains Tulen", "Perlu Lulus Math/Sains Tulen", _pass_math_sci),
+    Rule('pass_science_tech', "Lulus Sains ATAU Teknikal", "Perlu Lulus Sains/Teknikal", _pass_science_tech),
+    Rule('credit_math_sci', "Kredit Matematik ATAU Sains Tulen", "Perlu Kredit Math/Sains Tulen", _credit_math_sci),
+    Rule('credit_math_sci_tech', "Kredit Math/Sains/Teknikal", "Perlu Kredit Math/Sains/Teknikal", _credit_math_sci_tech),
+    Rule('pass_stv', "Aliran Sains/Vokasional", "Perlu Lulus Sains/Vokasional", _pass_stv),
+]}
 
-    min_p = req.get('min_pass', 0)
+class _AtLeast:
+    """Picklable test for the count rules (student.credits >= n)."""
+    __slots__ = ('attr', 'n')
+
+    def __init__(self, attr, n):
+        self.attr = attr
+        self.n = n
+
+    def __call__(self, s):
+        return getattr(s, self.attr) >= self.n
+
+def _count_rules(min_c, min_p):
+    rules = []
+    if min_c > 0:
+        rules.append(Rule('min_credits', f"Minimum {min_c} Kredit",
+                          "Hanya {s.credits} Kredit (Perlu %d)" % min_c, _AtLeast('credits', min_c)))
     if min_p > 0:
-        if not check(f"Minimum {min_p} Lulus", student.passes >= min_p, f"Hanya {student.passes} Lulus"): passed_academics = False
+        rules.append(Rule('min_pass', f"Minimum {min_p} Lulus",
+                          "Hanya {s.passes} Lulus", _AtLeast('passes', min_p)))
+    return rules
+
+def _count(req, col):
+    value = req.get(col, 0)
+    return int(value) if value > 0 else 0
+
+def gatekeeper_bits(student):
+    """Which gatekeeper rules (GATEKEEPER_COLUMNS order) the student satisfies."""
+    return tuple(RULES[col].test(student) for col in GATEKEEPER_COLUMNS)
+
+def rule_mask(student):
+    """Bit i is set when the student satisfies the rule for FLAG_COLUMNS[i]."""
+    mask = 0
+    for i, col in enumerate(FLAG_COLUMNS):
+        if RULES[col].test(student): mask |= 1 << i
+    return mask
+
+def required_mask(signature):
+    """Bit i is set when a requirement_signature switches on FLAG_COLUMNS[i] (pairs with rule_mask)."""
+    mask = 0
+    for i, on in enumerate(signature[:len(FLAG_COLUMNS)]):
+        if on: mask |= 1 << i
+    return mask
+
+def requirement_signature(req):
+    """
+    Reduces a requirement row to the values the engine actually reads:
+    one bool per FLAG_COLUMNS entry, then min_credits and min_pass.
+    Rows with the same signature always give the same verdict.
+    """
+    flags = tuple(bool(req.get(col) == 1) for col in FLAG_COLUMNS)
+    if flags[5]:
+        # 3M rows stop after the 3M check, so academics and counts are dead
+        return flags[:6] + (False,) * len(ACADEMIC_COLUMNS) + (0, 0)
+    return flags + tuple(_count(req, col) for col in COUNT_COLUMNS)
+
+def signature_key(req):
+    """Short, stable hex digest of requirement_signature(req), for storing in a column."""
+    sig = requirement_signature(req)
+    return hashlib.blake2b(repr(tuple(int(v) for v in sig)).encode(), digest_size=8).hexdigest()
+
+def _audit_check(audit, rule, student):
+    if rule.test(student):
+        audit.append({"label": rule.label, "passed": True, "reason": None})
+        return True
+    audit.append({"label": rule.label, "passed": False, "reason": rule.fail_msg.format(s=student)})
+    return False
+
+class CompiledRequirement:
+    """A requirement row reduced to the rules it switches on."""
+    __slots__ = ('signature', 'gatekeepers', 'three_m', 'academics', 'tests', 'academic_tests')
+
+    def __init__(self, signature):
+        active = [col for col, on in zip(FLAG_COLUMNS, signature) if on]
+        self.signature = signature
+        self.gatekeepers = tuple(RULES[col] for col in active if col in GATEKEEPER_COLUMNS)
+        self.three_m = RULES['3m_only'] if '3m_only' in active else None
+        self.academics = tuple([RULES[col] for col in active if col in ACADEMIC_COLUMNS]
+                               + _count_rules(*signature[len(FLAG_COLUMNS):]))
+        # Fast path: a row passes iff every active test passes (3M rows carry no academics)
+        self.order_tests()
+
+    def order_tests(self):
+        """(Re)builds the fast-path test tuples in the current rule order (see set_rule_order)."""
+        rank = _RULE_RANK.get
+        three_m = (self.three_m,) if self.three_m else ()
+        academic = sorted(three_m + self.academics, key=lambda rule: rank(rule.column))
+        self.academic_tests = tuple(rule.test for rule in academic)
+        # Everything is ANDed on the fast path, so gatekeepers may move too
+        every = sorted(self.gatekeepers + three_m + self.academics, key=lambda rule: rank(rule.column))
+        self.tests = tuple(rule.test for rule in every)
+
+    def __reduce__(self):
+        return (compile_signature, (self.signature,))
+
+    def evaluate(self, student):
+        """Same contract as check_eligibility: (passed, audit)."""
+        audit = []
+        for rule in self.gatekeepers:
+            if not _audit_check(audit, rule, student): return False, audit
+
+        if self.three_m is not None:
+            return _audit_check(audit, self.three_m, student), audit
+
+        passed_academics = True
+        for rule in self.academics:
+            if not _audit_check(audit, rule, student): passed_academics = False
+        return passed_academics, audit
+
+    def is_met(self, student, gatekeepers=True):
+        """
+        Boolean-only check: stops at the first failing rule and builds no audit.
+        gatekeepers=False skips the gatekeeper rules (already settled by RequirementIndex).
+        """
+        for test in (self.tests if gatekeepers else self.academic_tests):
+            if not test(student): return False
+        return True
+
+class LazyAudit(Sequence):
+    """
+    Audit list that is only built when someone reads it (iterating, indexing, len).
+    It reflects the student as they are at that moment.
+    """
+    __slots__ = ('_compiled', '_student', '_items')
+
+    def __init__(self, compiled, student):
+        self._compiled = compiled
+        self._student = student
+        self._items = None
+
+    def _load(self):
+        if self._items is None:
+            self._items = self._compiled.evaluate(self._student)[1]
+        return self._items
+
+    def __getitem__(self, i): return self._load()[i]
+    def __len__(self): return len(self._load())
+    def __eq__(self, other): return list(self) == list(other)
+    def __repr__(self): return repr(self._load())
+
+_COMPILED = {}
+
+# Fast-path order of the rule columns; the audit always uses source order
+RULE_COLUMNS = FLAG_COLUMNS + COUNT_COLUMNS
+_RULE_RANK = {col: i for i, col in enumerate(RULE_COLUMNS)}
+
+def set_rule_order(columns=None):
+    """
+    Makes is_met() try rules in this order (e.g. RuleStats.order(), most often
+    failed first), so rejections short-circuit early. Columns left out follow
+    in source order; None restores source order.
+    """
+    columns = list(columns or [])
+    order = columns + [col for col in RULE_COLUMNS if col not in columns]
+    _RULE_RANK.clear()
+    _RULE_RANK.update((col, i) for i, col in enumerate(order))
+    for compiled in list(_COMPILED.values()):
+        compiled.order_tests()
+
+def rule_order():
+    """The current fast-path rule order."""
+    return sorted(_RULE_RANK, key=_RULE_RANK.get)
+
+def compile_signature(signature):
+    """Returns the shared CompiledRequirement for a signature."""
+    compiled = _COMPILED.get(signature)
+    if compiled is None:
+        compiled = _COMPILED[signature] = CompiledRequirement(signature)
+    return compiled
+
+def compile_requirement(req):
+    """Compiles one CLEAN requirement dict (see load_and_clean_data)."""
+    return compile_signature(requirement_signature(req))
+
+def compile_requirements(rows):
+    """Compiles a requirements DataFrame (or list of dicts), one entry per row."""
+    if isinstance(rows, pd.DataFrame):
+        rows = rows.to_dict('records')
+    return [compile_requirement(req) for req in rows]
+
+# --- 4. THE ENGINE (Pure Logic) ---
+def check_eligibility(student, req, lazy=False):
+    """
+    Checks if a student meets the requirements.
+    Expects 'req' to be a CLEAN dictionary (integers only), or a
+    CompiledRequirement from compile_requirements() to skip re-reading the row.
+    With lazy=True the audit is a LazyAudit, built only if it is read.
+    """
+    if not isinstance(req, CompiledRequirement):
+        req = compile_requirement(req)
+    if lazy:
+        return req.is_met(student), LazyAudit(req, student)
+    return req.evaluate(student)
 
-    return passed_academics, audit
\ No newline at end of file
+def is_eligible(student, req):
+    """Fast mode of check_eligibility(): the verdict only, no audit."""
+    if not isinstance(req, CompiledRequirement):
+        req = compile_requirement(req)
+    return req.is_met(student)
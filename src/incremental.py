@@ -0,0 +1,124 @@
+"""
+Incremental re-evaluation for "what if" changes to one student.
+
+IncrementalEvaluator remembers, for one student and one RequirementIndex,
+the outcome of every rule and how many of each rule set's switched-on rules
+are unmet. When a single grade or demographic answer changes, only the
+rules that read that field are re-tested, and the eligible rows/courses
+are adjusted in place.
+"""
+import copy
+
+from src.engine import FLAG_COLUMNS, RULES, SUBJECTS, PURE_SCIENCE, ALL_SCIENCE, TECHNICAL
+
+_MATH_GROUPS = ['pass_math_sci', 'credit_math_sci', 'credit_math_sci_tech']
+_SCI_TECH = ['pass_science_tech', 'credit_math_sci_tech', 'pass_stv']
+
+# Field -> rule columns whose outcome can change with it
+FIELD_RULES = {
+    'nationality': ['req_malaysian'],
+    'gender': ['req_male', 'req_female'],
+    'colorblind': ['no_colorblind'],
+    'disability': ['no_disability'],
+    'bm': ['3m_only', 'pass_bm', 'credit_bm'],
+    'eng': ['pass_eng', 'credit_english'],
+    'hist': ['pass_history'],
+    'math': ['3m_only', 'pass_math', 'credit_math'] + _MATH_GROUPS,
+    'addmath': ['pass_math', 'credit_math'],
+    'other_tech': _SCI_TECH,
+    'other_voc': ['pass_stv'],
+}
+for _subj in PURE_SCIENCE:
+    FIELD_RULES[_subj] = _MATH_GROUPS + _SCI_TECH
+for _subj in ALL_SCIENCE[len(PURE_SCIENCE):] + TECHNICAL:
+    FIELD_RULES[_subj] = _SCI_TECH
+
+DEMOGRAPHICS = ['gender', 'nationality', 'colorblind', 'disability', 'other_tech', 'other_voc']
+_COUNTS = (('min_credits', 'credits'), ('min_pass', 'passes'))
+
+class IncrementalEvaluator:
+    """One student's standing against one RequirementIndex, kept up to date field by field."""
+
+    def __init__(self, index, student):
+        self.index = index
+        n = len(FLAG_COLUMNS)
+        # rule column -> slots that switch it on
+        self._users = {col: [i for i, rule in enumerate(index.rules) if rule.signature[j]]
+                       for j, col in enumerate(FLAG_COLUMNS)}
+        self._thresholds = {
+            'min_credits': [(i, rule.signature[n]) for i, rule in enumerate(index.rules) if rule.signature[n] > 0],
+            'min_pass': [(i, rule.signature[n + 1]) for i, rule in enumerate(index.rules) if rule.signature[n + 1] > 0],
+        }
+        self.reset(student)
+
+    def reset(self, student):
+        """Full evaluation from scratch (the evaluator keeps its own copy of the student)."""
+        self.student = copy.deepcopy(student)
+        self.outcomes = {col: RULES[col].test(self.student) for col in FLAG_COLUMNS}
+        self.unmet = [0] * len(self.index.rules)
+        for col, slots in self._users.items():
+            if not self.outcomes[col]:
+                for i in slots: self.unmet[i] += 1
+        for rule_col, attr in _COUNTS:
+            have = getattr(self.student, attr)
+            for i, t in self._thresholds[rule_col]:
+                if have < t: self.unmet[i] += 1
+
+        self._course_hits = dict.fromkeys(self.index.courses, 0)
+        for i, unmet in enumerate(self.unmet):
+            if unmet == 0: self._open_slot(i, +1)
+
+    def _open_slot(self, i, step):
+        rows = self.index.rows
+        for row in self.index.members[i]:
+            self._course_hits[rows[row]['course_id']] += step
+
+    def _adjust(self, i, step):
+        before = self.unmet[i]
+        self.unmet[i] += step
+        if before == 0: self._open_slot(i, -1)
+        elif self.unmet[i] == 0: self._open_slot(i, +1)
+
+    def update(self, field, value):
+        """Changes one grade (subject key) or demographic field and re-tests what depends on it."""
+        st = self.student
+        old_counts = {attr: getattr(st, attr) for _, attr in _COUNTS}
+        if field in DEMOGRAPHICS:
+            setattr(st, field, value)
+        else:
+            st.set_grade(field, value)
+
+        for col in FIELD_RULES.get(field, ()):
+            now = RULES[col].test(st)
+            if now != self.outcomes[col]:
+                self.outcomes[col] = now
+                for i in self._users[col]: self._adjust(i, -1 if now else +1)
+
+        for rule_col, attr in _COUNTS:
+            old, new = old_counts[attr], getattr(st, attr)
+            if old != new:
+                for i, t in self._thresholds[rule_col]:
+                    if (old >= t) != (new >= t): self._adjust(i, -1 if new >= t else +1)
+
+    def sync(self, student):
+        """Applies every field where `student` differs from the current one, one update each."""
+        for field in DEMOGRAPHICS:
+            value = getattr(student, field)
+            if getattr(self.student, field) != value:
+                self.update(field, value)
+        if (student.extra or None) != (self.student.extra or None):
+            self.reset(student)
+            return
+        for subj, old, new in zip(SUBJECTS, self.student.ordinals, student.ordinals):
+            if old != new:
+                self.update(subj, student.grades.get(subj))
+
+    def eligible_rows(self):
+        return sorted(row for i, unmet in enumerate(self.unmet) if unmet == 0 for row in self.index.members[i])
+
+    def eligible_courses(self):
+        """Distinct course_ids currently eligible, in catalogue order."""
+        return [c for c, hits in self._course_hits.items() if hits]
+
+    def eligible_count(self):
+        return sum(1 for hits in self._course_hits.values() if hits)
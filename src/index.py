@@ -0,0 +1,216 @@
+"""
+Requirement index: the requirement rows of one track (poly/KK or TVET),
+grouped so that the engine does as little work per student as possible.
+
+Many rows are the same rule set offered at a different institution (every
+IKBN-DIP-001 row, for example). Rows are grouped by requirement_signature,
+each distinct signature is checked once per student, and the verdict is
+fanned back out to all the rows that share it.
+
+Distinct rule sets are further partitioned by their gatekeeper flags
+(nationality, gender, colour-blindness, disability). A student's answers
+decide up front which partitions are open to them, so rule sets behind a
+closed gate are never visited at all.
+
+Inside each partition rule sets are sorted by min_credits (3M rule sets
+count as 0, they ignore the counts). Bisecting the student's credits gives
+the prefix they could possibly satisfy; min_pass is compared next, and only
+the survivors get the full rule check. Weak students skip most of the
+catalogue almost for free.
+
+Finally, a course is eligible if any of its rows is (the alternative
+criteria sets of requirements.csv, or the institutions offering a TVET
+course). Each course keeps its distinct alternatives, ordered by how often
+they pass (RuleSetStats), and stops at the first one that passes.
+
+Rule sets also form a subsumption lattice (src/lattice.py): once one is
+checked, every rule set it is stronger or weaker than is settled too, so
+failing "3 credits + Pass BM" never needs "5 credits + Credit BM" checked.
+
+build_index() / load_index() are the one way every consumer (the app's
+DataStore, src/cohort.py and its workers, the scripts) gets an index: with
+the precomputed lookup and the recorded alternative and rule orders from
+the data folder, when present.
+"""
+import os
+from bisect import bisect_right
+from collections import namedtuple
+
+import pandas as pd
+
+from src.engine import (FLAG_COLUMNS, GATEKEEPER_COLUMNS, check_eligibility, compile_signature,
+                        gatekeeper_bits, requirement_signature, set_rule_order, signature_key)
+from src.lattice import Lattice
+from src.loader import load_table
+from src.lookup import load_lookup
+from src.stats import RuleSetStats, RuleStats
+
+# Track name -> its requirement table (as in loader.FILES)
+TRACK_TABLES = {'poly': 'requirements', 'tvet': 'tvet_requirements'}
+
+# Rule slots behind one gate, sorted by min_credits (kept alongside for bisecting)
+Partition = namedtuple('Partition', ['min_credits', 'slots'])
+
+class RequirementIndex:
+    """Requirement rows grouped by signature and gatekeeper partition. Read-only once built."""
+
+    def __init__(self, rows):
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.to_dict('records')
+        self.rows = rows
+        self.rules = []      # one CompiledRequirement per distinct signature
+        self.members = []    # row indices sharing each rule, in file order
+        self.row_rule = []   # rule slot of each row
+        self.courses = list(dict.fromkeys(req['course_id'] for req in rows))
+        self.keys = []       # signature_key of each rule slot
+        self.lookup = None   # optional LookupTable (see attach_lookup)
+        slot = {}
+        for i, req in enumerate(rows):
+            sig = requirement_signature(req)
+            if sig not in slot:
+                slot[sig] = len(self.rules)
+                self.rules.append(compile_signature(sig))
+                self.keys.append(signature_key(req))
+                self.members.append([])
+            self.members[slot[sig]].append(i)
+            self.row_rule.append(slot[sig])
+
+        # Count thresholds of each rule slot
+        n = len(FLAG_COLUMNS)
+        self.min_credits = [rule.signature[n] for rule in self.rules]
+        self.min_pass = [rule.signature[n + 1] for rule in self.rules]
+
+        # Gatekeeper flags -> rule slots behind that gate, by min_credits
+        groups = {}
+        for i, rule in enumerate(self.rules):
+            groups.setdefault(rule.signature[:len(GATEKEEPER_COLUMNS)], []).append(i)
+        self.partitions = {}
+        for gate, slots in groups.items():
+            slots.sort(key=self.min_credits.__getitem__)
+            self.partitions[gate] = Partition([self.min_credits[i] for i in slots], slots)
+        self._open = {}      # student's gatekeeper_bits -> partitions they may visit
+        self.lattice = Lattice(rule.signature for rule in self.rules)
+
+        # course_id -> [(rule slot, first row using it)], one entry per distinct rule set
+        self.alternatives = {}
+        for row, (req, i) in enumerate(zip(rows, self.row_rule)):
+            alts = self.alternatives.setdefault(req['course_id'], [])
+            if all(i != slot for slot, _ in alts):
+                alts.append((i, row))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _open_partitions(self, student):
+        bits = gatekeeper_bits(student)
+        parts = self._open.get(bits)
+        if parts is None:
+            parts = [part for gate, part in self.partitions.items()
+                     if all(ok or not needed for needed, ok in zip(gate, bits))]
+            self._open[bits] = parts
+        return parts
+
+    def open_rules(self, student):
+        """Rule slots whose gatekeepers the student passes (at most 32 answer combinations)."""
+        return sorted(i for part in self._open_partitions(student) for i in part.slots)
+
+    def candidates(self, student):
+        """Open rule slots whose min_credits and min_pass the student reaches."""
+        credits, passes = student.credits, student.passes
+        found = []
+        for part in self._open_partitions(student):
+            for k in range(bisect_right(part.min_credits, credits)):
+                i = part.slots[k]
+                if self.min_pass[i] <= passes:
+                    found.append(i)
+        return found
+
+    def eligible_rows(self, student):
+        """Indices of the rows the student qualifies for, in file order."""
+        hits = []
+        known = {}
+        for i in self.candidates(student):
+            ok = known.get(i)
+            if ok is None:
+                ok = self.rules[i].is_met(student, gatekeepers=False)
+                self.lattice.learn(known, i, ok)
+            if ok:
+                hits.extend(self.members[i])
+        hits.sort()
+        return hits
+
+    def order_alternatives(self, stats):
+        """Tries each course's most often passing alternative first (ties keep file order)."""
+        for course, alts in self.alternatives.items():
+            self.alternatives[course] = sorted(alts, key=lambda alt: -stats.pass_rate(self.keys[alt[0]]))
+
+    def course_verdicts(self, student, stats=None):
+        """
+        course_id -> row of the alternative that qualified, or None.
+        Each rule set is checked at most once, and not at all when the lattice
+        already settled it; with stats, every verdict used is recorded once.
+        """
+        possible = set(self.candidates(student))
+        known = {}
+        recorded = set()
+        verdicts = {}
+        for course, alts in self.alternatives.items():
+            verdicts[course] = None
+            for slot, row in alts:
+                ok = known.get(slot)
+                if ok is None:
+                    ok = slot in possible and self.rules[slot].is_met(student, gatekeepers=False)
+                    self.lattice.learn(known, slot, ok)
+                if stats is not None and slot not in recorded:
+                    recorded.add(slot)
+                    stats.record(self.keys[slot], ok)
+                if ok:
+                    verdicts[course] = row
+                    break
+        return verdicts
+
+    def eligible_courses(self, student):
+        """Distinct course_ids the student qualifies for, in catalogue order."""
+        if self.lookup is not None:
+            ids = self.lookup.lookup(student)
+            if ids is not None:
+                return ids
+        return [c for c, row in self.course_verdicts(student).items() if row is not None]
+
+    def attach_lookup(self, table):
+        """Answers eligible_courses() from a precomputed LookupTable (None detaches)."""
+        self.lookup = table
+
+    def explain(self, student, row):
+        """Full (passed, audit) for one row, with the same reasons as check_eligibility()."""
+        return check_eligibility(student, self.rules[self.row_rule[row]])
+
+def apply_rule_stats(data_folder="data"):
+    """Orders the fast path by data_folder/rule_stats.json (set_rule_order), if it exists. True if applied."""
+    path = os.path.join(data_folder, "rule_stats.json")
+    if not os.path.exists(path):
+        return False
+    set_rule_order(RuleStats.load(path).order())
+    return True
+
+def build_index(requirements, track, data_folder="data", lookup=True):
+    """
+    A RequirementIndex over one track's requirement rows (DataFrame or
+    dicts) with what data_folder has recorded for it: the precomputed
+    lookup (scripts/build_lookup.py, used only if built from this data;
+    lookup=False skips it), the alternatives' pass rates and the rule order.
+    """
+    index = RequirementIndex(requirements)
+    if lookup:
+        index.attach_lookup(load_lookup(os.path.join(data_folder, "lookup", f"{track}.npz"), index))
+    # Recorded pass rates: try each course's most successful criteria set first
+    stats_path = os.path.join(data_folder, "rule_set_stats.json")
+    if os.path.exists(stats_path):
+        index.order_alternatives(RuleSetStats.load(stats_path))
+    # Recorded rejection rates: the fast path tries the most often failed rule first
+    apply_rule_stats(data_folder)
+    return index
+
+def load_index(track, data_folder="data", lookup=True):
+    """build_index() on the track's requirements CSV, read with src/loader.py."""
+    return build_index(load_table(data_folder, TRACK_TABLES[track]), track, data_folder, lookup)
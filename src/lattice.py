@@ -0,0 +1,92 @@
+"""
+Subsumption lattice over requirement signatures.
+
+Signature A is stronger than B when every student who meets A also meets B:
+A's flags, closed under IMPLIES, cover all of B's flags, and A's min_credits
+and min_pass are at least B's. So one check answers many others:
+failing B fails everything stronger than B, and passing A passes
+everything weaker than A.
+
+IMPLIES only lists what the rule tests in src/engine.py guarantee (a
+credit is always a pass, pure science is part of science/technical, ...).
+Pass Math does NOT imply Pass Math/Science: the former accepts Add Math.
+"""
+from src.engine import FLAG_COLUMNS, required_mask, requirement_signature, signature_key
+
+IMPLIES = {
+    'credit_bm': ('pass_bm',),
+    'credit_english': ('pass_eng',),
+    'credit_math': ('pass_math',),
+    'credit_math_sci': ('pass_math_sci', 'credit_math_sci_tech'),
+    'pass_science_tech': ('pass_stv',),
+}
+
+_BIT = {col: 1 << i for i, col in enumerate(FLAG_COLUMNS)}
+_N = len(FLAG_COLUMNS)
+
+def implied_mask(signature):
+    """required_mask plus every rule the active rules guarantee."""
+    mask = required_mask(signature)
+    for col, implied in IMPLIES.items():
+        if mask & _BIT[col]:
+            for other in implied:
+                mask |= _BIT[other]
+    return mask
+
+def subsumes(strong, weak):
+    """True when every student meeting signature `strong` also meets `weak`."""
+    weak_flags = required_mask(weak)
+    return (implied_mask(strong) & weak_flags == weak_flags
+            and strong[_N] >= weak[_N] and strong[_N + 1] >= weak[_N + 1])
+
+class Lattice:
+    """Partial order over a list of distinct signatures (slots as in RequirementIndex.rules)."""
+
+    def __init__(self, signatures):
+        self.signatures = list(signatures)
+        n = len(self.signatures)
+        self.stronger = [[] for _ in range(n)]   # slots implied to fail when slot i fails
+        self.weaker = [[] for _ in range(n)]     # slots implied to pass when slot i passes
+        for i, a in enumerate(self.signatures):
+            for j, b in enumerate(self.signatures):
+                if i != j and subsumes(a, b):
+                    self.stronger[j].append(i)
+                    self.weaker[i].append(j)
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def learn(self, known, slot, ok):
+        """Stores slot's verdict in `known` together with everything it settles."""
+        known[slot] = ok
+        for other in (self.weaker[slot] if ok else self.stronger[slot]):
+            known.setdefault(other, ok)
+
+def redundant_rows(rows, group_by=('course_id', 'institution_id')):
+    """
+    Rows that can never change a verdict: another row of the same course
+    (and institution, where the file has one) is weaker or identical, so it
+    already passes whenever this one would. Returns one dict per redundant
+    row with the row index, its course and the row that covers it.
+    """
+    groups = {}
+    for i, req in enumerate(rows):
+        key = tuple(str(req.get(col, '')).strip() for col in group_by)
+        groups.setdefault(key, []).append(i)
+    report = []
+    for key, members in groups.items():
+        sigs = {i: requirement_signature(rows[i]) for i in members}
+        for i in members:
+            for j in members:
+                if i == j or not subsumes(sigs[i], sigs[j]):
+                    continue
+                # Equivalent rule sets (e.g. Credit BM with or without Pass BM): keep the first
+                if subsumes(sigs[j], sigs[i]):
+                    if j > i: continue
+                    reason = "duplicate"
+                else:
+                    reason = "stronger"
+                report.append({'row': i, 'course_id': key[0], 'covered_by': j,
+                               'reason': reason, 'signature_key': signature_key(rows[i])})
+                break
+    return report
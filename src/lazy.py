@@ -0,0 +1,122 @@
+"""
+Catalogue tables read on first use, track by track and column group by
+column group.
+
+A session that only checks eligibility needs the rule columns of the two
+requirement tables and nothing else. The course names, institutions and
+links are needed only to show results for a track, and the long TVET
+description/career text not even then. LazyCatalogue reads each part the
+first time it is asked for:
+
+    tables.rules('requirements')   ids, engine flags, counts, signature (for the indexes)
+    tables.courses                 the table without its long text columns
+    tables.text('tvet_courses')    ids and the long text columns
+
+Each part comes from the binary snapshot (src/snapshot.py) when it is
+fresh for that file, else from the CSV with only those columns parsed, and
+is then kept. tables.loaded() lists what a process has actually read.
+
+A catalogue given the content hash of each file (`files`, as in
+reload.Dataset) only ever serves those contents: a part read after the CSV
+was edited comes from a snapshot of the old content if there is one, and
+is refused (StaleDataError) otherwise, rather than mixed with the new file.
+"""
+import os
+import threading
+
+from src.cache import dataset_version
+from src.engine import FLAG_COLUMNS, COUNT_COLUMNS
+from src.loader import FILES, ID_COLUMNS, load_table
+from src.snapshot import load_snapshot_table
+
+RULE_GROUP = set(ID_COLUMNS + FLAG_COLUMNS + COUNT_COLUMNS + ['signature'])
+# Long free text, read only through text()
+TEXT_COLUMNS = {'tvet_courses': ['description', 'career']}
+TRACKS = {
+    'poly': ['requirements', 'courses', 'links', 'institutions'],
+    'tvet': ['tvet_requirements', 'tvet_courses', 'tvet_institutions'],
+}
+
+def _keep(name, group):
+    text = TEXT_COLUMNS.get(name, [])
+    if group == 'rules':
+        return lambda col: col in RULE_GROUP
+    if group == 'text':
+        return lambda col: col in ID_COLUMNS or col in text
+    return lambda col: col not in text
+
+class StaleDataError(RuntimeError):
+    """A table was asked for after its file changed, and no snapshot holds the old content."""
+
+class LazyCatalogue:
+    """The data folder's tables, each column group read on first access (names as in loader.Catalogue)."""
+
+    def __init__(self, data_folder="data", parts=None, files=None):
+        self.data_folder = data_folder
+        self.files = dict(files or {})    # filename -> content hash parts must match (none: as on disk)
+        self._parts = dict(parts or {})   # (table, group) -> DataFrame
+        self._lock = threading.Lock()
+
+    def _part(self, name, group):
+        key = (name, group)
+        if key not in self._parts:
+            with self._lock:
+                if key not in self._parts:
+                    self._parts[key] = self._read(name, group)
+        return self._parts[key]
+
+    def _read(self, name, group):
+        return self._load(name, _keep(name, group))
+
+    def _load(self, name, keep=None):
+        filename = FILES[name]
+        expected = self.files.get(filename)
+        df = load_snapshot_table(self.data_folder, name, keep, expected)
+        if df is not None:
+            return df
+        df = load_table(self.data_folder, name, keep)
+        if expected is not None and dataset_version([os.path.join(self.data_folder, filename)]) != expected:
+            raise StaleDataError(f"{filename} changed since version {expected}; reload the data")
+        return df
+
+    def __getattr__(self, name):
+        if name not in FILES:
+            raise AttributeError(name)
+        return self._part(name, 'table')
+
+    def rules(self, name):
+        """A requirement table's rule columns (what RequirementIndex reads)."""
+        return self._part(name, 'rules')
+
+    def text(self, name):
+        """A table's ids and long text columns."""
+        return self._part(name, 'text')
+
+    def track(self, track):
+        """Every table of one track ('poly' or 'tvet'), loading them if needed."""
+        return {name: getattr(self, name) for name in TRACKS[track]}
+
+    def loaded(self):
+        """(table, group) pairs read so far."""
+        return sorted(self._parts)
+
+    def nbytes(self):
+        return int(sum(df.memory_usage(deep=True).sum() for df in list(self._parts.values())))
+
+    def replace(self, names, files=None):
+        """
+        A catalogue of the same folder where the tables in `names` are read
+        again, stamped with the content hashes in `files`. Each of them is
+        read whole now, so a broken file fails here whether or not it had
+        been used, and the parts this one had loaded are cut from it; the
+        rest is shared.
+        """
+        kept = {key: df for key, df in self._parts.items() if key[0] not in names}
+        fresh = LazyCatalogue(self.data_folder, kept, dict(self.files, **(files or {})))
+        for name in names:
+            table = fresh._load(name)
+            for loaded, group in self._parts:
+                if loaded == name:
+                    keep = _keep(name, group)
+                    fresh._parts[(name, group)] = table[[col for col in table.columns if keep(col)]]
+        return fresh
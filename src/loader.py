@@ -0,0 +1,166 @@
+"""
+One loader for the data folder, shared by the app, the engine, the scripts
+and the tests, so every consumer sees the same clean types.
+
+read_table() reads one CSV:
+    - UTF-8 (with or without BOM), falling back to latin1
+    - headers stripped and lower-cased ('State' -> 'state')
+    - ids (course_id, institution_id) stripped
+    - engine flags -> int8, blank -> 0
+    - counts (min_credits, min_pass) -> int8, blank -> 0
+    - any other value in an engine flag or count ('Yes', '2', 'x') -> SchemaError
+      naming the file, column and rows, rather than a silent 0 (run
+      scripts/audit.py for a full report; it applies the same rules)
+    - display-only 0/1 columns (req_interview, free_hostel, ...) -> int8,
+      '1'/'yes'/'true' -> 1, anything else -> 0
+    - plain numbers (semesters, no) -> small ints, junk -> 0
+    - repeated labels (course_id, institution_id, department, state) -> category
+    - the columns each file must have are checked (SchemaError)
+
+load_catalogue() reads all seven files into a Catalogue. Requirement
+tables also get the engine's 'signature' column (see load_and_clean_data).
+"""
+import os
+from collections import namedtuple
+
+import pandas as pd
+
+from src.engine import FLAG_COLUMNS, COUNT_COLUMNS, signature_key
+
+FILES = {
+    'courses': 'courses.csv',
+    'institutions': 'institutions.csv',
+    'requirements': 'requirements.csv',
+    'links': 'links.csv',
+    'tvet_courses': 'tvet_courses.csv',
+    'tvet_institutions': 'tvet_institutions.csv',
+    'tvet_requirements': 'tvet_requirements.csv',
+}
+REQUIREMENT_TABLES = ['requirements', 'tvet_requirements']
+
+# Columns a file cannot do without
+SCHEMAS = {
+    'courses.csv': ['course_id', 'course'],
+    'institutions.csv': ['institution_id'],
+    'requirements.csv': ['course_id'],
+    'links.csv': ['course_id', 'institution_id'],
+    'tvet_courses.csv': ['course_id', 'course'],
+    'tvet_institutions.csv': ['institution_id'],
+    'tvet_requirements.csv': ['course_id', 'institution_id'],
+}
+
+ID_COLUMNS = ['course_id', 'institution_id']
+CATEGORY_COLUMNS = ID_COLUMNS + ['department', 'state']
+# 0/1 columns the engine does not read, but the app and the audit do (TRUE_VALUES count as set)
+EXTRA_FLAG_COLUMNS = ['credit_eng', 'credit_stv', 'credit_sf', 'credit_sfmt', 'credit_bmbi',
+                      'req_interview', 'single', 'wbl', 'free_hostel', 'free_meals']
+INT_COLUMNS = {'semesters': 'int16', 'no': 'int32'}
+TRUE_VALUES = ['1', '1.0', 'yes', 'true']
+
+Catalogue = namedtuple('Catalogue', list(FILES))
+
+class SchemaError(ValueError):
+    """A data file is missing columns the app needs, or has values it cannot read."""
+
+def clean_header(text):
+    return str(text).replace("\ufeff", "").strip().lower()
+
+def _read_csv(path, keep=None, **options):
+    usecols = None if keep is None else (lambda col: keep(clean_header(col)))
+    try:
+        return pd.read_csv(path, encoding="utf-8-sig", usecols=usecols, **options)
+    except UnicodeDecodeError:
+        return pd.read_csv(path, encoding="latin1", usecols=usecols, **options)
+
+def _to_int(series, dtype):
+    return pd.to_numeric(series, errors='coerce').fillna(0).astype(dtype)
+
+def _parse_int(series, allowed):
+    """(text, values, bad): stripped cells (blank -> NA), them as numbers, and the non-blank ones allowed() rejects."""
+    text = series.astype('string').str.strip().replace('', pd.NA)
+    values = pd.to_numeric(text, errors='coerce')
+    bad = (text.notna() & (values.isna() | ~allowed(values))).fillna(False).astype(bool)
+    return text, values, bad
+
+def _to_checked_int(series, path, col, allowed, expected):
+    """int8 column; blank cells are 0, any value allowed() rejects is a SchemaError."""
+    if pd.api.types.is_numeric_dtype(series.dtype) and allowed(series.dropna()).all():
+        return series.fillna(0).astype('int8')   # parsed as numbers already: nothing to explain
+    text, values, bad = _parse_int(series, allowed)
+    if bad.any():
+        rows = (bad[bad].index + 2).tolist()   # file line numbers (after the header)
+        found = sorted(set(text[bad].astype(str)))
+        raise SchemaError(f"Nilai tidak sah dalam fail '{os.path.basename(path)}', lajur '{col}' "
+                          f"(baris {rows[:5]}): {found[:5]}. Hanya {expected} dibenarkan.")
+    return values.fillna(0).astype('int8')
+
+def _is_flag(values):
+    return values.isin([0, 1])
+
+def _is_count(values):
+    return (values >= 0) & (values <= 127) & (values == values.round())
+
+def _to_display_flag(series):
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return (series == 1).astype('int8')
+    return series.astype(str).str.strip().str.lower().isin(TRUE_VALUES).astype('int8')
+
+def invalid_flags(series):
+    """Mask of the cells read_table rejects in an engine flag column (not 0, 1 or blank)."""
+    return _parse_int(series, _is_flag)[2]
+
+def invalid_counts(series):
+    """Mask of the cells read_table rejects in a count column (not a whole number 0-127, or blank)."""
+    return _parse_int(series, _is_count)[2]
+
+def read_table(path, keep=None):
+    """Reads one data CSV with the typed schema described above (only the columns keep(name) accepts, if given)."""
+    df = _read_csv(path, keep)
+    df.columns = [clean_header(c) for c in df.columns]
+
+    required = [col for col in SCHEMAS.get(os.path.basename(path), []) if keep is None or keep(col)]
+    missing = [col for col in required if col not in df.columns]
+    if missing:
+        raise SchemaError(f"Struktur fail '{os.path.basename(path)}' salah. Lajur hilang: {missing}")
+
+    for col in FLAG_COLUMNS:
+        if col in df.columns:
+            df[col] = _to_checked_int(df[col], path, col, _is_flag, "0/1")
+    for col in EXTRA_FLAG_COLUMNS:
+        if col in df.columns:
+            df[col] = _to_display_flag(df[col])
+    for col in COUNT_COLUMNS:
+        if col in df.columns:
+            df[col] = _to_checked_int(df[col], path, col, _is_count, "nombor bulat 0-127")
+    for col, dtype in INT_COLUMNS.items():
+        if col in df.columns:
+            df[col] = _to_int(df[col], dtype)
+    for col in ID_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(str).str.strip()
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+def read_raw(path):
+    """One data CSV as written, every cell as text (headers cleaned), for tools that report bad values."""
+    df = _read_csv(path, dtype=str, keep_default_na=False)
+    df.columns = [clean_header(c) for c in df.columns]
+    return df
+
+def load_requirements(path, keep=None):
+    """A requirements CSV, typed, with the engine's 'signature' column (unless keep rejects it)."""
+    df = read_table(path, keep)
+    if keep is None or keep('signature'):
+        df['signature'] = [signature_key(req) for req in df.to_dict('records')]
+    return df
+
+def load_table(data_folder, name, keep=None):
+    """One Catalogue table by name ('courses', 'requirements', ...), optionally only some columns."""
+    path = os.path.join(data_folder, FILES[name])
+    return load_requirements(path, keep) if name in REQUIREMENT_TABLES else read_table(path, keep)
+
+def load_catalogue(data_folder="data"):
+    """All seven data files as a Catalogue (FileNotFoundError / SchemaError if one is unusable)."""
+    return Catalogue(**{name: load_table(data_folder, name) for name in FILES})
@@ -0,0 +1,163 @@
+"""
+Equivalence-class lookup table: every student answer is precomputed.
+
+The engine's verdict on a row only depends on which rules the student
+satisfies (one bit per FLAG_COLUMNS entry, see rule_mask) and on their
+credit and pass counts. Bits for rules no row switches on are dropped, and
+counts above the largest min_credits / min_pass in the catalogue behave
+the same, so they are capped. That triple is the student's class key, and
+two students with the same key are eligible for exactly the same courses.
+
+build_lookup() enumerates every reachable rule mask (every demographic
+answer crossed with every grade band that a rule can tell apart), crosses
+it with every capped count pair, and stores the eligible course set of
+each class. At runtime a StudentProfile maps to its key and the answer is
+one dict lookup.
+
+Keys pack the three parts into one uint32: the rule mask above two
+COUNT_BITS-wide count fields. build_lookup() refuses a catalogue whose
+thresholds do not fit, rather than let classes collide.
+"""
+import hashlib
+import itertools
+
+import numpy as np
+
+from src.engine import FLAG_COLUMNS, SUBJECTS, rule_mask
+from src.vector import StudentArrays, satisfied_rules
+
+# Grade bands the rules can tell apart: not taken, G, E (pass), C (credit)
+_BANDS = {
+    'bm': (0, 1, 2, 4), 'math': (0, 1, 2, 4),     # attempted matters (3M)
+    'eng': (0, 2, 4), 'addmath': (0, 2, 4),
+    'phy': (0, 2, 4), 'sci': (0, 2, 4), 'rc': (0, 2, 4),  # stand-ins for their groups
+    'hist': (0, 2),
+}
+_GENDERS = ('Lelaki', 'Perempuan', '')
+
+COUNT_BITS = 6
+COUNT_MAX = (1 << COUNT_BITS) - 1
+
+def class_key(mask, credits, passes):
+    """Packs a (capped) class into one int; works on ints and uint32 arrays alike."""
+    return (mask << (2 * COUNT_BITS)) | (credits << COUNT_BITS) | passes
+
+def catalogue_digest(index):
+    """Digest of the rows a table was built from, to detect stale files."""
+    h = hashlib.blake2b(digest_size=8)
+    for req, slot in zip(index.rows, index.row_rule):
+        h.update(repr((str(req['course_id']).strip(), index.rules[slot].signature)).encode())
+    return h.hexdigest()
+
+def reachable_masks():
+    """Every rule_mask a real student can have."""
+    subjects = list(_BANDS)
+    combos = list(itertools.product(
+        *(_BANDS[s] for s in subjects),
+        range(len(_GENDERS)), (True, False), (True, False), (True, False),  # gender, citizen, not cb, not dis
+        (False, True), (False, True)))                                       # other_tech, other_voc
+    arr = np.array(combos, dtype=np.int8)
+    grades = np.zeros((len(arr), len(SUBJECTS)), dtype=np.int8)
+    for j, subj in enumerate(subjects):
+        grades[:, SUBJECTS.index(subj)] = arr[:, j]
+    k = len(subjects)
+    gender = arr[:, k]
+    students = StudentArrays(
+        grades=grades,
+        citizen=arr[:, k + 1].astype(bool), male=gender == 0, female=gender == 1,
+        not_colorblind=arr[:, k + 2].astype(bool), not_disabled=arr[:, k + 3].astype(bool),
+        other_tech=arr[:, k + 4].astype(bool), other_voc=arr[:, k + 5].astype(bool),
+        credits=np.zeros(len(arr), np.int16), passes=np.zeros(len(arr), np.int16),
+    )
+    bits = satisfied_rules(students).astype(np.uint32) << np.arange(len(FLAG_COLUMNS), dtype=np.uint32)
+    return np.unique(bits.sum(axis=1, dtype=np.uint32))
+
+class LookupTable:
+    """Class key -> eligible course ids for one RequirementIndex."""
+
+    def __init__(self, courses, keys, set_ids, sets, caps, digest):
+        self.courses = [str(c) for c in courses]
+        self.sets = sets
+        self.used_mask, self.cap_credits, self.cap_pass = (int(c) for c in caps)
+        self.digest = str(digest)
+        self._keys, self._set_ids = keys, set_ids
+        self._table = dict(zip(keys.tolist(), set_ids.tolist()))
+        self._decoded = {}
+
+    def key(self, student):
+        """The student's equivalence class."""
+        mask = rule_mask(student) & self.used_mask
+        return class_key(mask, min(student.credits, self.cap_credits), min(student.passes, self.cap_pass))
+
+    def __len__(self):
+        return len(self._table)
+
+    def lookup(self, student):
+        """Eligible course ids (catalogue order), or None if the key is unknown."""
+        set_id = self._table.get(self.key(student))
+        if set_id is None:
+            return None
+        ids = self._decoded.get(set_id)
+        if ids is None:
+            bits = np.unpackbits(self.sets[set_id], count=len(self.courses))
+            ids = self._decoded[set_id] = [c for c, on in zip(self.courses, bits) if on]
+        return list(ids)
+
+    def save(self, path):
+        np.savez_compressed(path, courses=np.array(self.courses), keys=self._keys, set_ids=self._set_ids,
+                            sets=self.sets, caps=np.array([self.used_mask, self.cap_credits, self.cap_pass]),
+                            digest=np.array(self.digest))
+
+    @classmethod
+    def load(cls, path, index=None):
+        """Loads a saved table; with an index, refuses a table built from other data."""
+        with np.load(path) as f:
+            table = cls(f['courses'], f['keys'], f['set_ids'], f['sets'], f['caps'], f['digest'])
+        if index is not None and table.digest != catalogue_digest(index):
+            raise ValueError(f"{path} was built from a different catalogue, rebuild it")
+        return table
+
+def build_lookup(index):
+    """Precomputes the eligible course set of every reachable class of an index."""
+    n = len(FLAG_COLUMNS)
+    sigs = np.array([rule.signature for rule in index.rules], dtype=np.int16).reshape(-1, n + 2)
+    required = sigs[:, :n].astype(bool)
+    min_c, min_p = sigs[:, n], sigs[:, n + 1]
+    cap_c, cap_p = int(min_c.max(initial=0)), int(min_p.max(initial=0))
+    if max(cap_c, cap_p) > COUNT_MAX:
+        raise ValueError(f"min_credits/min_pass up to {max(cap_c, cap_p)} do not fit the "
+                         f"{COUNT_BITS}-bit count fields of the class key (max {COUNT_MAX})")
+    if n + 2 * COUNT_BITS > 32:
+        raise ValueError(f"{n} rule bits and two count fields do not fit a uint32 class key")
+
+    courses = index.courses
+    # rule slot -> courses it opens
+    opens = np.zeros((len(index.rules), len(courses)), dtype=np.uint8)
+    position = {c: j for j, c in enumerate(courses)}
+    for slot, members in enumerate(index.members):
+        for row in members:
+            opens[slot, position[index.rows[row]['course_id']]] = 1
+
+    used = int(np.bitwise_or.reduce((required.astype(np.uint32) << np.arange(n, dtype=np.uint32)).sum(axis=1), initial=0))
+    masks = np.unique(reachable_masks() & np.uint32(used))
+    bits = ((masks[:, None] >> np.arange(n, dtype=np.uint32)) & 1).astype(bool)
+    rules_met = (~bits[:, None, :] & required[None, :, :]).sum(axis=2) == 0  # masks x rule slots
+
+    keys, packed = [], []
+    for c, p in itertools.product(range(cap_c + 1), range(cap_p + 1)):
+        ok = rules_met & (c >= min_c) & (p >= min_p)
+        eligible = (ok.astype(np.uint16) @ opens) > 0
+        keys.append(class_key(masks, np.uint32(c), np.uint32(p)))
+        packed.append(np.packbits(eligible, axis=1))
+    keys = np.concatenate(keys).astype(np.uint32)
+    sets, set_ids = np.unique(np.concatenate(packed), axis=0, return_inverse=True)
+    order = np.argsort(keys)
+    return LookupTable(courses, keys[order], set_ids.reshape(-1)[order].astype(np.uint32), sets,
+                       (used, cap_c, cap_p), catalogue_digest(index))
+
+def load_lookup(path, index):
+    """Loads the table for an index if it exists and is current, else None."""
+    try:
+        return LookupTable.load(path, index)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,274 @@
+"""
+Out-of-core screening for applicant files too big to hold in memory.
+
+    python -m src.pipeline applicants.csv results.ndjson [--chunk-size 100000] [--data data] [--restart]
+    python -m src.pipeline applicants.csv results.npz --format sparse
+
+The input is read chunk_size rows at a time, each chunk becomes a
+StudentBatch (a few dozen bytes a student), is checked against the whole
+catalogue with the bitmask kernel (same verdicts as check_eligibility) and
+its results are appended to the output. Only one chunk is ever in memory.
+
+Output formats:
+    ndjson  one line per student, the same fields as src/cohort.py
+    sparse  the students x courses matrix as a SparseEligibility .npz
+            (src/sparse.py); chunks go to <output>.pairs / <output>.ids
+            and are packed into the .npz when the run completes, in
+            streamed passes through disk-backed arrays
+
+After every chunk the output is flushed and a checkpoint
+(<output>.checkpoint.json) records how many chunks are done and how long
+each output file was at that point. Rerunning the same command after an
+interruption cuts off any half-written chunk and carries on from the next
+one (the finished records are parsed again to find it, not screened); the checkpoint refuses to resume when the input, chunk size, format
+or requirement data changed. It is removed once the run completes.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.batch import StudentBatch
+from src.bitmask import MaskTable
+from src.cache import dataset_version
+from src.engine import load_and_clean_data
+from src.sparse import SparseEligibility
+
+TRACKS = {'poly': 'requirements.csv', 'tvet': 'tvet_requirements.csv'}
+
+class CourseTable:
+    """One track's requirement rows, checked a whole batch at a time and answered per course."""
+
+    def __init__(self, rows):
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.to_dict('records')
+        self.masks = MaskTable.from_rows(rows)
+        ids = [str(req['course_id']).strip() for req in rows]
+        self.courses = list(dict.fromkeys(ids))   # catalogue order
+        code = {c: i for i, c in enumerate(self.courses)}
+        codes = np.array([code[c] for c in ids])
+        # Rows regrouped by course, so one reduceat ORs each course's alternatives
+        self._order = np.argsort(codes, kind='stable')
+        self._starts = np.flatnonzero(np.r_[True, np.diff(codes[self._order]) != 0])
+
+    def matrix(self, students):
+        """(students x courses) bool matrix: eligible through any of the course's rows."""
+        rows = self.masks.matrix(students)
+        return np.logical_or.reduceat(rows[:, self._order], self._starts, axis=1)
+
+def load_catalogue(data_folder="data"):
+    """CourseTable per track and the requirement data's version."""
+    tables = {}
+    for track, filename in TRACKS.items():
+        tables[track] = CourseTable(load_and_clean_data(os.path.join(data_folder, filename)))
+    version = dataset_version([os.path.join(data_folder, f) for f in TRACKS.values()])
+    return tables, version
+
+def screen_batch(batch, tables):
+    """track -> (students x courses) matrix; non-citizens get nothing, as in the app."""
+    allowed = batch.nationality != 1
+    return {track: table.matrix(batch) & allowed[:, None] for track, table in tables.items()}
+
+def _student_ids(batch, first_row):
+    if batch.ids is None:
+        return [str(first_row + i + 1) for i in range(len(batch))]
+    return [sid or str(first_row + i + 1) for i, sid in enumerate(batch.ids)]
+
+def result_lines(batch, hits, tables, first_row=0):
+    """The NDJSON lines for one screened batch (same fields as src/cohort.py)."""
+    poly_ids = np.array(tables['poly'].courses, dtype=object)
+    tvet_ids = np.array(tables['tvet'].courses, dtype=object)
+    is_poly = np.array(["POLY" in c for c in poly_ids], dtype=bool)
+    lines = []
+    for i, student_id in enumerate(_student_ids(batch, first_row)):
+        poly = hits['poly'][i]
+        lines.append(json.dumps({
+            'student_id': student_id,
+            'credits': int(batch.credits[i]),
+            'poly': poly_ids[poly & is_poly].tolist(),
+            'kk': poly_ids[poly & ~is_poly].tolist(),
+            'tvet': tvet_ids[hits['tvet'][i]].tolist(),
+        }, ensure_ascii=False) + "\n")
+    return lines
+
+# --- OUTPUTS ---
+# Each format appends one byte string per file per chunk, so a checkpoint
+# only has to remember the file lengths.
+class NdjsonOutput:
+    def __init__(self, path, tables):
+        self.tables = tables
+        self.paths = [path]
+
+    def chunk(self, batch, hits, first_row):
+        return ["".join(result_lines(batch, hits, self.tables, first_row)).encode('utf-8')]
+
+    def finish(self):
+        pass
+
+PAIR_BLOCK = 1 << 20   # pairs (or ids) held in memory at a time while packing
+
+def _pair_blocks(path, block):
+    count = os.path.getsize(path) // 8
+    for start in range(0, count, block):
+        yield np.fromfile(path, dtype=np.int32, count=2 * min(block, count - start), offset=8 * start).reshape(-1, 2)
+
+def _scratch_array(path, dtype, n):
+    # np.memmap cannot map an empty file
+    return np.memmap(path, dtype=dtype, mode='w+', shape=(n,)) if n else np.zeros(0, dtype=dtype)
+
+def _read_ids(path, scratch, block):
+    """The .ids part as a disk-backed fixed-width string array."""
+    # Split on "\n" only: universal newlines would also split on a "\r" inside an id
+    n = width = 0
+    with open(path, encoding='utf-8', newline='\n') as f:
+        for line in f:
+            n += 1
+            width = max(width, len(line.rstrip("\n")))
+    students = _scratch_array(scratch, f"<U{max(width, 1)}", n)
+    with open(path, encoding='utf-8', newline='\n') as f:
+        start, lines = 0, []
+        for line in f:
+            lines.append(line.rstrip("\n"))
+            if len(lines) == block:
+                students[start:start + block] = lines
+                start, lines = start + block, []
+        students[start:start + len(lines)] = lines
+    return students
+
+class SparseOutput:
+    def __init__(self, path, tables):
+        self.path = path
+        self.paths = [path + ".pairs", path + ".ids"]
+        self.courses = tables['poly'].courses + tables['tvet'].courses
+
+    def chunk(self, batch, hits, first_row):
+        # (course, student number) int32 pairs, and one student id per line
+        students, courses = np.nonzero(np.hstack([hits['poly'], hits['tvet']]))
+        pairs = np.column_stack([courses, students + first_row]).astype(np.int32)
+        ids = "".join(sid.replace("\r", " ").replace("\n", " ") + "\n" for sid in _student_ids(batch, first_row))
+        return [pairs.tobytes(), ids.encode('utf-8')]
+
+    def finish(self, block=PAIR_BLOCK):
+        # Two passes over the pairs, `block` at a time: count per course for
+        # indptr, then drop each student into its course's slice of a
+        # disk-backed indices array. Pairs come in student order, so every
+        # slice fills already sorted.
+        scratch = [self.path + ".indices", self.path + ".students"]
+        counts = np.zeros(len(self.courses), dtype=np.int64)
+        for pairs in _pair_blocks(self.paths[0], block):
+            counts += np.bincount(pairs[:, 0], minlength=len(self.courses))
+        indptr = np.zeros(len(self.courses) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        indices = _scratch_array(scratch[0], np.int32, int(indptr[-1]))
+        cursor = indptr[:-1].copy()
+        for pairs in _pair_blocks(self.paths[0], block):
+            order = np.argsort(pairs[:, 0], kind='stable')
+            course, student = pairs[order, 0], pairs[order, 1]
+            first = np.flatnonzero(np.r_[True, course[1:] != course[:-1]])
+            rank = np.arange(len(course)) - np.repeat(first, np.diff(np.r_[first, len(course)]))
+            indices[cursor[course] + rank] = student
+            cursor += np.bincount(course, minlength=len(self.courses))
+
+        students = _read_ids(self.paths[1], scratch[1], block)
+        SparseEligibility(indptr, indices, self.courses, students).save(self.path)
+        del indices, students
+        for path in self.paths + scratch:
+            if os.path.exists(path):
+                os.remove(path)
+
+OUTPUTS = {'ndjson': NdjsonOutput, 'sparse': SparseOutput}
+
+# --- CHECKPOINTS ---
+def _checkpoint_path(output):
+    return output + ".checkpoint.json"
+
+def _save_checkpoint(output, state):
+    path = _checkpoint_path(output)
+    with open(path + ".tmp", 'w') as f:
+        json.dump(state, f)
+    os.replace(path + ".tmp", path)
+
+def _resume_state(output, paths, fresh):
+    """The checkpoint to carry on from, or None to start over."""
+    path = _checkpoint_path(output)
+    if not os.path.exists(path) or not all(os.path.exists(p) for p in paths):
+        return None
+    with open(path) as f:
+        state = json.load(f)
+    for field in ['input', 'input_size', 'chunk_size', 'format', 'data_version']:
+        if state.get(field) != fresh[field]:
+            raise ValueError(f"Checkpoint {path} was made with a different {field}; rerun with --restart")
+    return state
+
+def print_progress(state, elapsed):
+    rate = state['students'] / elapsed if elapsed else 0.0
+    print(f"chunk {state['chunks']}: {state['students']:,} students, {rate:,.0f}/s", file=sys.stderr)
+
+def run_pipeline(input_path, output, chunk_size=100000, data_folder="data", restart=False,
+                 progress=print_progress, fmt='ndjson'):
+    """
+    Screens input_path into output chunk by chunk (see module docstring).
+    progress(state, elapsed_seconds) is called after every chunk. Returns the final state.
+    """
+    tables, version = load_catalogue(data_folder)
+    writer = OUTPUTS[fmt](output, tables)
+    state = {'input': os.path.abspath(input_path), 'input_size': os.path.getsize(input_path),
+             'chunk_size': chunk_size, 'format': fmt, 'data_version': version,
+             'chunks': 0, 'students': 0, 'offsets': [0] * len(writer.paths)}
+    saved = None if restart else _resume_state(output, writer.paths, state)
+    if saved is not None:
+        state = saved
+
+    done = state['students']
+    start = time.time()
+    files = [open(path, 'r+b' if saved is not None else 'wb') for path in writer.paths]
+    try:
+        # Drop whatever a crash left after the last completed chunk
+        for f, offset in zip(files, state['offsets']):
+            f.seek(offset)
+            f.truncate()
+        reader = pd.read_csv(input_path, chunksize=chunk_size, dtype=str, keep_default_na=False)
+        # Skip the finished records through the parser, not by line number: a
+        # quoted field can span lines
+        while done:
+            done -= len(reader.get_chunk(min(done, chunk_size)))
+        for df in reader:
+            batch = StudentBatch.from_frame(df)
+            parts = writer.chunk(batch, screen_batch(batch, tables), state['students'])
+            for f, data in zip(files, parts):
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            state['chunks'] += 1
+            state['students'] += len(batch)
+            state['offsets'] = [f.tell() for f in files]
+            _save_checkpoint(output, state)
+            if progress is not None:
+                progress(state, time.time() - start)
+    finally:
+        for f in files:
+            f.close()
+    writer.finish()
+    if os.path.exists(_checkpoint_path(output)):
+        os.remove(_checkpoint_path(output))
+    return state
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.pipeline", description="Screen a large applicant CSV in chunks.")
+    parser.add_argument("input", help="applicant CSV (app.py subject keys, see src/batch.py)")
+    parser.add_argument("output", help="results file (.ndjson, or .npz with --format sparse)")
+    parser.add_argument("--format", choices=list(OUTPUTS), default='ndjson')
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--data", default="data", help="folder with the requirement CSVs")
+    parser.add_argument("--restart", action="store_true", help="ignore an existing checkpoint")
+    args = parser.parse_args(argv)
+    state = run_pipeline(args.input, args.output, args.chunk_size, args.data, args.restart, fmt=args.format)
+    print(f"done: {state['students']:,} students -> {args.output}", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,663 @@
+"""
+GENERATED by scripts/build_predicates.py from requirements.csv, tvet_requirements.csv -- do not edit.
+
+One predicate per distinct requirement signature and one dispatch table
+per track (see src/codegen.py). Rerun the script after changing a
+requirements file.
+"""
+
+def p_982ce1c134b1e2de(s):
+    # Warganegara, Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if s.credits < 3: return False
+    return True
+
+def p_0a37b632a682112e(s):
+    # Warganegara, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus BI, Kredit Matematik, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[1] >= 2): return False
+    if not (o[3] >= 4 or o[4] >= 4): return False
+    if s.credits < 3: return False
+    return True
+
+def p_7c63fc63ecda2eaf(s):
+    # Warganegara, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus BI, Lulus Matematik, Minimum 5 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[1] >= 2): return False
+    if not (o[3] >= 2 or o[4] >= 2): return False
+    if s.credits < 5: return False
+    return True
+
+def p_72a25b003d601ffe(s):
+    # Warganegara, Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus BI, Kredit Matematik, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[1] >= 2): return False
+    if not (o[3] >= 4 or o[4] >= 4): return False
+    if s.credits < 3: return False
+    return True
+
+def p_2f30421c5809e2f9(s):
+    # Warganegara, Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus BI, Lulus Matematik, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[1] >= 2): return False
+    if not (o[3] >= 2 or o[4] >= 2): return False
+    if s.credits < 3: return False
+    return True
+
+def p_1b53c180413888c1(s):
+    # Warganegara, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus BI, Lulus Matematik, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[1] >= 2): return False
+    if not (o[3] >= 2 or o[4] >= 2): return False
+    if s.credits < 3: return False
+    return True
+
+def p_60dce42c1ede4321(s):
+    # Warganegara, Bebas Buta Warna, Sihat Tubuh Badan, Kredit BM, Lulus Sejarah, Kredit Matematik, Minimum 5 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 4): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 4 or o[4] >= 4): return False
+    if s.credits < 5: return False
+    return True
+
+def p_b15e83783fefa30f(s):
+    # Warganegara, Jantina (Lelaki), Bebas Buta Warna, Sihat Tubuh Badan, Kredit BM, Lulus Sejarah, Kredit Matematik, Minimum 5 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.gender == 'Lelaki'): return False
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 4): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 4 or o[4] >= 4): return False
+    if s.credits < 5: return False
+    return True
+
+def p_a46c403c6d627eed(s):
+    # Warganegara, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus BI, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[1] >= 2): return False
+    if s.credits < 3: return False
+    return True
+
+def p_717400886879474c(s):
+    # Warganegara, Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus BI, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[1] >= 2): return False
+    if s.credits < 3: return False
+    return True
+
+def p_58518ce94e01a4c0(s):
+    # Warganegara, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus Matematik, Minimum 5 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 2 or o[4] >= 2): return False
+    if s.credits < 5: return False
+    return True
+
+def p_de6bde0ca2eeacb5(s):
+    # Warganegara, Sihat Tubuh Badan, Kredit BM, Lulus Sejarah, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 4): return False
+    if not (o[2] >= 2): return False
+    if s.credits < 3: return False
+    return True
+
+def p_70c63e4e3a257c34(s):
+    # Warganegara, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus Matematik, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 2 or o[4] >= 2): return False
+    if s.credits < 3: return False
+    return True
+
+def p_aa7d5131fdf338dd(s):
+    # Warganegara, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if s.credits < 3: return False
+    return True
+
+def p_967ba6832858a3aa(s):
+    # Warganegara, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus Matematik, Aliran Sains/Vokasional, Minimum 1 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 2 or o[4] >= 2): return False
+    if not (s.sci_tech_pass or s.other_tech or s.other_voc): return False
+    if s.credits < 1: return False
+    return True
+
+def p_a70290c88c48c5c2(s):
+    # Warganegara, Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus Matematik, Aliran Sains/Vokasional, Minimum 1 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 2 or o[4] >= 2): return False
+    if not (s.sci_tech_pass or s.other_tech or s.other_voc): return False
+    if s.credits < 1: return False
+    return True
+
+def p_7c8bac3c6416543a(s):
+    # Warganegara, Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Minimum 1 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if s.credits < 1: return False
+    return True
+
+def p_1b59ec2f8fb00a1b(s):
+    # Warganegara, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Minimum 1 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if s.credits < 1: return False
+    return True
+
+def p_82f59ba17b928f64(s):
+    # Warganegara, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus Matematik, Minimum 1 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 2 or o[4] >= 2): return False
+    if s.credits < 1: return False
+    return True
+
+def p_e5f939a29ef018f4(s):
+    # Warganegara, Jantina (Wanita), Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Minimum 1 Kredit
+    o = s.ordinals
+    if not (s.nationality == 'Warganegara'): return False
+    if not (s.gender == 'Perempuan'): return False
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if s.credits < 1: return False
+    return True
+
+def p_2098bc14bfb3b61d(s):
+    # Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Kredit Math/Sains/Teknikal, Minimum 1 Kredit, Minimum 2 Lulus
+    o = s.ordinals
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 4 or s.sci_tech_credit or s.other_tech): return False
+    if s.credits < 1: return False
+    if s.passes < 2: return False
+    return True
+
+def p_591130975686416c(s):
+    # Sihat Tubuh Badan, Syarat 3M (BM & Math)
+    o = s.ordinals
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 1 and o[3] >= 1): return False
+    return True
+
+def p_313eccf93fdde7b9(s):
+    # Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus Matematik, Lulus Sains ATAU Teknikal, Minimum 4 Lulus
+    o = s.ordinals
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 2 or o[4] >= 2): return False
+    if not (s.sci_tech_pass or s.other_tech): return False
+    if s.passes < 4: return False
+    return True
+
+def p_fc39fba137d28f79(s):
+    # Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus Matemaik ATAU Sains Tulen, Minimum 2 Lulus
+    o = s.ordinals
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 2 or s.pure_sci_pass): return False
+    if s.passes < 2: return False
+    return True
+
+def p_b8c9cf0a7a286e52(s):
+    # Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Lulus Matematik, Minimum 4 Lulus
+    o = s.ordinals
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 2 or o[4] >= 2): return False
+    if s.passes < 4: return False
+    return True
+
+def p_cba9c8d96a5f10e7(s):
+    # Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Kredit BI, Kredit Math/Sains/Teknikal, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[1] >= 4): return False
+    if not (o[3] >= 4 or s.sci_tech_credit or s.other_tech): return False
+    if s.credits < 3: return False
+    return True
+
+def p_b3e4a08fe40aa105(s):
+    # Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Kredit Matematik ATAU Sains Tulen, Minimum 3 Kredit
+    o = s.ordinals
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if not (o[3] >= 4 or s.pure_sci_credit): return False
+    if s.credits < 3: return False
+    return True
+
+def p_641822ebe5b7aafd(s):
+    # Bebas Buta Warna, Sihat Tubuh Badan, Lulus BM, Lulus Sejarah, Minimum 2 Lulus
+    o = s.ordinals
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 2): return False
+    if not (o[2] >= 2): return False
+    if s.passes < 2: return False
+    return True
+
+def p_092edfd44678be3f(s):
+    # Bebas Buta Warna, Sihat Tubuh Badan, Syarat 3M (BM & Math)
+    o = s.ordinals
+    if not (s.colorblind == 'Tidak'): return False
+    if not (s.disability == 'Tidak'): return False
+    if not (o[0] >= 1 and o[3] >= 1): return False
+    return True
+
+POLY = {
+    'POLY-DIP-001': (p_982ce1c134b1e2de,),
+    'POLY-DIP-002': (p_982ce1c134b1e2de,),
+    'POLY-DIP-003': (p_0a37b632a682112e,),
+    'POLY-DIP-004': (p_7c63fc63ecda2eaf,),
+    'POLY-DIP-005': (p_0a37b632a682112e,),
+    'POLY-DIP-006': (p_0a37b632a682112e,),
+    'POLY-DIP-007': (p_0a37b632a682112e,),
+    'POLY-DIP-008': (p_72a25b003d601ffe,),
+    'POLY-DIP-009': (p_72a25b003d601ffe,),
+    'POLY-DIP-010': (p_2f30421c5809e2f9,),
+    'POLY-DIP-011': (p_72a25b003d601ffe,),
+    'POLY-DIP-012': (p_72a25b003d601ffe,),
+    'POLY-DIP-013': (p_2f30421c5809e2f9,),
+    'POLY-DIP-014': (p_2f30421c5809e2f9,),
+    'POLY-DIP-015': (p_72a25b003d601ffe,),
+    'POLY-DIP-016': (p_2f30421c5809e2f9,),
+    'POLY-DIP-017': (p_72a25b003d601ffe,),
+    'POLY-DIP-018': (p_0a37b632a682112e,),
+    'POLY-DIP-019': (p_0a37b632a682112e,),
+    'POLY-DIP-020': (p_0a37b632a682112e,),
+    'POLY-DIP-021': (p_0a37b632a682112e,),
+    'POLY-DIP-022': (p_0a37b632a682112e,),
+    'POLY-DIP-023': (p_0a37b632a682112e,),
+    'POLY-DIP-024': (p_1b53c180413888c1,),
+    'POLY-DIP-025': (p_0a37b632a682112e,),
+    'POLY-DIP-026': (p_0a37b632a682112e,),
+    'POLY-DIP-027': (p_0a37b632a682112e,),
+    'POLY-DIP-028': (p_0a37b632a682112e,),
+    'POLY-DIP-029': (p_1b53c180413888c1,),
+    'POLY-DIP-030': (p_0a37b632a682112e,),
+    'POLY-DIP-031': (p_0a37b632a682112e,),
+    'POLY-DIP-032': (p_72a25b003d601ffe,),
+    'POLY-DIP-033': (p_60dce42c1ede4321,),
+    'POLY-DIP-034': (p_b15e83783fefa30f,),
+    'POLY-DIP-035': (p_2f30421c5809e2f9,),
+    'POLY-DIP-036': (p_0a37b632a682112e,),
+    'POLY-DIP-037': (p_7c63fc63ecda2eaf,),
+    'POLY-DIP-038': (p_0a37b632a682112e,),
+    'POLY-DIP-039': (p_0a37b632a682112e,),
+    'POLY-DIP-040': (p_a46c403c6d627eed,),
+    'POLY-DIP-041': (p_7c63fc63ecda2eaf,),
+    'POLY-DIP-042': (p_7c63fc63ecda2eaf,),
+    'POLY-DIP-043': (p_a46c403c6d627eed,),
+    'POLY-DIP-044': (p_717400886879474c,),
+    'POLY-DIP-045': (p_7c63fc63ecda2eaf,),
+    'POLY-DIP-046': (p_a46c403c6d627eed,),
+    'POLY-DIP-047': (p_7c63fc63ecda2eaf,),
+    'POLY-DIP-048': (p_717400886879474c,),
+    'POLY-DIP-049': (p_0a37b632a682112e,),
+    'POLY-DIP-050': (p_a46c403c6d627eed,),
+    'POLY-DIP-051': (p_717400886879474c,),
+    'POLY-DIP-052': (p_58518ce94e01a4c0,),
+    'POLY-DIP-053': (p_982ce1c134b1e2de,),
+    'POLY-DIP-054': (p_982ce1c134b1e2de,),
+    'POLY-DIP-055': (p_982ce1c134b1e2de,),
+    'POLY-DIP-056': (p_de6bde0ca2eeacb5,),
+    'POLY-DIP-057': (p_0a37b632a682112e,),
+    'POLY-DIP-058': (p_717400886879474c,),
+    'POLY-DIP-059': (p_1b53c180413888c1,),
+    'POLY-DIP-060': (p_7c63fc63ecda2eaf,),
+    'POLY-DIP-061': (p_982ce1c134b1e2de,),
+    'POLY-DIP-062': (p_70c63e4e3a257c34,),
+    'POLY-DIP-063': (p_982ce1c134b1e2de,),
+    'POLY-DIP-064': (p_72a25b003d601ffe,),
+    'POLY-DIP-065': (p_72a25b003d601ffe,),
+    'POLY-DIP-066': (p_982ce1c134b1e2de,),
+    'POLY-DIP-067': (p_982ce1c134b1e2de,),
+    'POLY-DIP-068': (p_982ce1c134b1e2de,),
+    'POLY-DIP-069': (p_982ce1c134b1e2de,),
+    'POLY-DIP-070': (p_982ce1c134b1e2de,),
+    'POLY-DIP-071': (p_982ce1c134b1e2de,),
+    'POLY-DIP-072': (p_0a37b632a682112e,),
+    'POLY-DIP-073': (p_0a37b632a682112e,),
+    'POLY-DIP-074': (p_0a37b632a682112e,),
+    'POLY-DIP-075': (p_0a37b632a682112e,),
+    'POLY-DIP-076': (p_0a37b632a682112e,),
+    'POLY-DIP-077': (p_0a37b632a682112e,),
+    'POLY-DIP-078': (p_982ce1c134b1e2de,),
+    'POLY-DIP-079': (p_aa7d5131fdf338dd,),
+    'POLY-DIP-080': (p_982ce1c134b1e2de,),
+    'POLY-DIP-081': (p_982ce1c134b1e2de,),
+    'POLY-DIP-082': (p_7c63fc63ecda2eaf,),
+    'POLY-CET-001': (p_967ba6832858a3aa,),
+    'POLY-CET-002': (p_a70290c88c48c5c2,),
+    'POLY-CET-003': (p_967ba6832858a3aa,),
+    'KKOM-DIP-001': (p_982ce1c134b1e2de,),
+    'KKOM-DIP-002': (p_982ce1c134b1e2de,),
+    'KKOM-DIP-003': (p_aa7d5131fdf338dd,),
+    'KKOM-DIP-004': (p_717400886879474c,),
+    'KKOM-DIP-005': (p_982ce1c134b1e2de,),
+    'KKOM-DIP-006': (p_982ce1c134b1e2de,),
+    'KKOM-DIP-007': (p_982ce1c134b1e2de,),
+    'KKOM-DIP-008': (p_aa7d5131fdf338dd,),
+    'KKOM-DIP-009': (p_982ce1c134b1e2de,),
+    'KKOM-DIP-010': (p_717400886879474c,),
+    'KKOM-DIP-011': (p_982ce1c134b1e2de,),
+    'KKOM-DIP-012': (p_982ce1c134b1e2de,),
+    'KKOM-DIP-013': (p_982ce1c134b1e2de,),
+    'KKOM-DIP-014': (p_aa7d5131fdf338dd,),
+    'KKOM-DIP-015': (p_982ce1c134b1e2de,),
+    'KKOM-DIP-016': (p_982ce1c134b1e2de,),
+    'KKOM-CET-001': (p_7c8bac3c6416543a,),
+    'KKOM-CET-002': (p_7c8bac3c6416543a,),
+    'KKOM-CET-003': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-004': (p_7c8bac3c6416543a,),
+    'KKOM-CET-005': (p_7c8bac3c6416543a,),
+    'KKOM-CET-006': (p_7c8bac3c6416543a,),
+    'KKOM-CET-007': (p_7c8bac3c6416543a,),
+    'KKOM-CET-008': (p_7c8bac3c6416543a,),
+    'KKOM-CET-009': (p_7c8bac3c6416543a,),
+    'KKOM-CET-010': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-011': (p_7c8bac3c6416543a,),
+    'KKOM-CET-012': (p_7c8bac3c6416543a,),
+    'KKOM-CET-013': (p_7c8bac3c6416543a,),
+    'KKOM-CET-014': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-015': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-016': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-017': (p_7c8bac3c6416543a,),
+    'KKOM-CET-018': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-019': (p_7c8bac3c6416543a,),
+    'KKOM-CET-020': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-021': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-022': (p_7c8bac3c6416543a,),
+    'KKOM-CET-023': (p_7c8bac3c6416543a,),
+    'KKOM-CET-024': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-025': (p_7c8bac3c6416543a,),
+    'KKOM-CET-026': (p_7c8bac3c6416543a,),
+    'KKOM-CET-027': (p_82f59ba17b928f64,),
+    'KKOM-CET-028': (p_7c8bac3c6416543a,),
+    'KKOM-CET-029': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-030': (p_7c8bac3c6416543a,),
+    'KKOM-CET-031': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-032': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-033': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-034': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-035': (p_7c8bac3c6416543a,),
+    'KKOM-CET-036': (p_1b59ec2f8fb00a1b,),
+    'KKOM-CET-037': (p_7c8bac3c6416543a,),
+    'KKOM-CET-038': (p_e5f939a29ef018f4,),
+}
+
+TVET = {
+    ('IKBN-DIP-001', 'IKBN-004'): (p_2098bc14bfb3b61d,),
+    ('IKBN-DIP-001', 'IKBN-005'): (p_2098bc14bfb3b61d,),
+    ('IKBN-DIP-001', 'IKBN-020'): (p_2098bc14bfb3b61d,),
+    ('IKBN-DIP-002', 'IKBN-012'): (p_591130975686416c,),
+    ('IKBN-DIP-003', 'IKBN-010'): (p_591130975686416c,),
+    ('IKBN-DIP-006', 'IKBN-001'): (p_591130975686416c,),
+    ('IKBN-DIP-007', 'IKBN-012'): (p_591130975686416c,),
+    ('IKBN-CET-001', 'IKBN-001'): (p_591130975686416c,),
+    ('IKBN-CET-001', 'IKBN-003'): (p_591130975686416c,),
+    ('IKBN-CET-001', 'IKBN-014'): (p_591130975686416c,),
+    ('IKBN-CET-002', 'IKBN-003'): (p_591130975686416c,),
+    ('IKBN-CET-002', 'IKBN-008'): (p_591130975686416c,),
+    ('IKBN-CET-002', 'IKBN-014'): (p_591130975686416c,),
+    ('IKBN-CET-003', 'IKBN-007'): (p_591130975686416c,),
+    ('IKBN-CET-003', 'IKBN-014'): (p_591130975686416c,),
+    ('IKBN-CET-004', 'IKBN-003'): (p_591130975686416c,),
+    ('IKBN-CET-005', 'IKBN-003'): (p_591130975686416c,),
+    ('IKBN-CET-005', 'IKBN-007'): (p_591130975686416c,),
+    ('IKBN-CET-005', 'IKBN-008'): (p_591130975686416c,),
+    ('IKBN-CET-005', 'IKBN-014'): (p_591130975686416c,),
+    ('IKBN-CET-005', 'IKBN-021'): (p_591130975686416c,),
+    ('IKBN-CET-006', 'IKBN-003'): (p_591130975686416c,),
+    ('IKBN-CET-006', 'IKBN-014'): (p_591130975686416c,),
+    ('IKBN-CET-007', 'IKBN-016'): (p_591130975686416c,),
+    ('IKBN-CET-008', 'IKBN-004'): (p_313eccf93fdde7b9,),
+    ('IKBN-CET-008', 'IKBN-020'): (p_313eccf93fdde7b9,),
+    ('IKBN-CET-009', 'IKBN-012'): (p_591130975686416c,),
+    ('IKBN-CET-010', 'IKBN-004'): (p_591130975686416c,),
+    ('IKBN-CET-010', 'IKBN-011'): (p_591130975686416c,),
+    ('IKBN-CET-011', 'IKBN-013'): (p_591130975686416c,),
+    ('IKBN-CET-012', 'IKBN-017'): (p_591130975686416c,),
+    ('IKBN-CET-013', 'IKBN-010'): (p_591130975686416c,),
+    ('IKBN-CET-014', 'IKBN-019'): (p_591130975686416c,),
+    ('IKBN-CET-014', 'IKBN-021'): (p_591130975686416c,),
+    ('IKBN-CET-015', 'IKBN-005'): (p_591130975686416c,),
+    ('IKBN-CET-015', 'IKBN-008'): (p_591130975686416c,),
+    ('IKBN-CET-016', 'IKBN-017'): (p_591130975686416c,),
+    ('IKBN-CET-017', 'IKBN-010'): (p_591130975686416c,),
+    ('IKBN-CET-018', 'IKBN-017'): (p_591130975686416c,),
+    ('IKBN-CET-019', 'IKBN-011'): (p_591130975686416c,),
+    ('IKBN-CET-020', 'IKBN-014'): (p_591130975686416c,),
+    ('IKBN-CET-021', 'IKBN-018'): (p_591130975686416c,),
+    ('IKBN-CET-022', 'IKBN-016'): (p_591130975686416c,),
+    ('IKBN-CET-023', 'IKBN-001'): (p_591130975686416c,),
+    ('IKBN-CET-024', 'IKBN-004'): (p_591130975686416c,),
+    ('IKBN-CET-025', 'IKBN-018'): (p_591130975686416c,),
+    ('IKBN-CET-026', 'IKBN-004'): (p_591130975686416c,),
+    ('IKBN-CET-026', 'IKBN-021'): (p_591130975686416c,),
+    ('IKBN-CET-027', 'IKBN-018'): (p_591130975686416c,),
+    ('IKBN-CET-028', 'IKBN-018'): (p_591130975686416c,),
+    ('IKBN-CET-029', 'IKBN-015'): (p_591130975686416c,),
+    ('IKBN-CET-032', 'IKBN-014'): (p_591130975686416c,),
+    ('IKBN-CET-034', 'IKBN-011'): (p_fc39fba137d28f79,),
+    ('IKBN-CET-034', 'IKBN-013'): (p_fc39fba137d28f79,),
+    ('IJTM-DIP-010', 'IJTM-004'): (p_b8c9cf0a7a286e52,),
+    ('IJTM-DIP-017', 'IJTM-004'): (p_b8c9cf0a7a286e52,),
+    ('IJTM-DIP-017', 'IJTM-027'): (p_b8c9cf0a7a286e52,),
+    ('IJTM-DIP-019', 'IJTM-004'): (p_b8c9cf0a7a286e52,),
+    ('IJTM-DIP-022', 'IJTM-027'): (p_b8c9cf0a7a286e52,),
+    ('IJTM-DIP-024', 'IJTM-026'): (p_b8c9cf0a7a286e52,),
+    ('IJTM-DIP-026', 'IJTM-026'): (p_cba9c8d96a5f10e7,),
+    ('IJTM-DIP-032', 'IJTM-001'): (p_b3e4a08fe40aa105,),
+    ('IJTM-DIP-033', 'IJTM-001'): (p_b3e4a08fe40aa105,),
+    ('IJTM-DIP-034', 'IJTM-001'): (p_b3e4a08fe40aa105,),
+    ('IJTM-DIP-035', 'IJTM-001'): (p_b3e4a08fe40aa105,),
+    ('IJTM-CET-001', 'IJTM-029'): (p_641822ebe5b7aafd,),
+    ('IJTM-CET-002', 'IJTM-029'): (p_641822ebe5b7aafd,),
+    ('IJTM-CET-003', 'IJTM-029'): (p_641822ebe5b7aafd,),
+    ('IJTM-CET-004', 'IJTM-002'): (p_092edfd44678be3f,),
+    ('IJTM-CET-004', 'IJTM-008'): (p_092edfd44678be3f,),
+    ('IJTM-CET-004', 'IJTM-013'): (p_092edfd44678be3f,),
+    ('IJTM-CET-004', 'IJTM-015'): (p_092edfd44678be3f,),
+    ('IJTM-CET-004', 'IJTM-016'): (p_092edfd44678be3f,),
+    ('IJTM-CET-004', 'IJTM-021'): (p_092edfd44678be3f,),
+    ('IJTM-CET-004', 'IJTM-028'): (p_092edfd44678be3f,),
+    ('IJTM-CET-004', 'IJTM-032'): (p_092edfd44678be3f,),
+    ('IJTM-CET-004', 'IJTM-034'): (p_092edfd44678be3f,),
+    ('IJTM-CET-005', 'IJTM-024'): (p_092edfd44678be3f,),
+    ('IJTM-CET-005', 'IJTM-033'): (p_092edfd44678be3f,),
+    ('IJTM-CET-005', 'IJTM-034'): (p_092edfd44678be3f,),
+    ('IJTM-CET-006', 'IJTM-024'): (p_092edfd44678be3f,),
+    ('IJTM-CET-007', 'IJTM-003'): (p_092edfd44678be3f,),
+    ('IJTM-CET-007', 'IJTM-019'): (p_092edfd44678be3f,),
+    ('IJTM-CET-007', 'IJTM-020'): (p_092edfd44678be3f,),
+    ('IJTM-CET-008', 'IJTM-019'): (p_092edfd44678be3f,),
+    ('IJTM-CET-008', 'IJTM-032'): (p_092edfd44678be3f,),
+    ('IJTM-CET-009', 'IJTM-002'): (p_313eccf93fdde7b9,),
+    ('IJTM-CET-009', 'IJTM-003'): (p_313eccf93fdde7b9,),
+    ('IJTM-CET-009', 'IJTM-013'): (p_313eccf93fdde7b9,),
+    ('IJTM-CET-009', 'IJTM-014'): (p_313eccf93fdde7b9,),
+    ('IJTM-CET-009', 'IJTM-016'): (p_313eccf93fdde7b9,),
+    ('IJTM-CET-009', 'IJTM-021'): (p_313eccf93fdde7b9,),
+    ('IJTM-CET-009', 'IJTM-023'): (p_313eccf93fdde7b9,),
+    ('IJTM-CET-009', 'IJTM-024'): (p_313eccf93fdde7b9,),
+    ('IJTM-CET-009', 'IJTM-032'): (p_313eccf93fdde7b9,),
+    ('IJTM-CET-009', 'IJTM-034'): (p_313eccf93fdde7b9,),
+    ('IJTM-CET-010', 'IJTM-009'): (p_092edfd44678be3f,),
+    ('IJTM-CET-010', 'IJTM-021'): (p_092edfd44678be3f,),
+    ('IJTM-CET-011', 'IJTM-003'): (p_092edfd44678be3f,),
+    ('IJTM-CET-011', 'IJTM-020'): (p_092edfd44678be3f,),
+    ('IJTM-CET-011', 'IJTM-021'): (p_092edfd44678be3f,),
+    ('IJTM-CET-012', 'IJTM-012'): (p_591130975686416c,),
+    ('IJTM-CET-013', 'IJTM-018'): (p_092edfd44678be3f,),
+    ('IJTM-CET-013', 'IJTM-021'): (p_092edfd44678be3f,),
+    ('IJTM-CET-014', 'IJTM-028'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-002'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-003'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-008'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-012'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-014'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-017'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-018'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-020'): (p_092edfd44678be3f,),
+    ('IJTM-CET-015', 'IJTM-021'): (p_092edfd44678be3f,),
+    ('IJTM-CET-015', 'IJTM-024'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-028'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-032'): (p_591130975686416c,),
+    ('IJTM-CET-015', 'IJTM-034'): (p_591130975686416c,),
+    ('IJTM-CET-016', 'IJTM-002'): (p_591130975686416c,),
+    ('IJTM-CET-016', 'IJTM-011'): (p_591130975686416c,),
+    ('IJTM-CET-016', 'IJTM-024'): (p_591130975686416c,),
+    ('IJTM-CET-016', 'IJTM-033'): (p_591130975686416c,),
+    ('IJTM-CET-017', 'IJTM-007'): (p_591130975686416c,),
+    ('IJTM-CET-017', 'IJTM-013'): (p_591130975686416c,),
+    ('IJTM-CET-017', 'IJTM-014'): (p_591130975686416c,),
+    ('IJTM-CET-017', 'IJTM-020'): (p_591130975686416c,),
+    ('IJTM-CET-018', 'IJTM-032'): (p_591130975686416c,),
+    ('IJTM-CET-019', 'IJTM-015'): (p_591130975686416c,),
+    ('IJTM-CET-019', 'IJTM-017'): (p_591130975686416c,),
+    ('IJTM-CET-019', 'IJTM-018'): (p_591130975686416c,),
+    ('IJTM-CET-019', 'IJTM-019'): (p_591130975686416c,),
+    ('IJTM-CET-019', 'IJTM-020'): (p_591130975686416c,),
+    ('IJTM-CET-019', 'IJTM-025'): (p_591130975686416c,),
+    ('IJTM-CET-020', 'IJTM-013'): (p_591130975686416c,),
+    ('IJTM-CET-020', 'IJTM-015'): (p_591130975686416c,),
+    ('IJTM-CET-021', 'IJTM-021'): (p_591130975686416c,),
+    ('IJTM-CET-021', 'IJTM-030'): (p_591130975686416c,),
+    ('IJTM-CET-022', 'IJTM-024'): (p_591130975686416c,),
+    ('IJTM-CET-023', 'IJTM-007'): (p_591130975686416c,),
+    ('IJTM-CET-024', 'IJTM-012'): (p_591130975686416c,),
+    ('IJTM-CET-024', 'IJTM-023'): (p_092edfd44678be3f,),
+    ('IJTM-CET-024', 'IJTM-033'): (p_092edfd44678be3f,),
+    ('IJTM-CET-025', 'IJTM-002'): (p_092edfd44678be3f,),
+    ('IJTM-CET-025', 'IJTM-013'): (p_092edfd44678be3f,),
+    ('IJTM-CET-025', 'IJTM-019'): (p_092edfd44678be3f,),
+    ('IJTM-CET-025', 'IJTM-032'): (p_092edfd44678be3f,),
+    ('IJTM-CET-026', 'IJTM-003'): (p_092edfd44678be3f,),
+    ('IJTM-CET-027', 'IJTM-027'): (p_092edfd44678be3f,),
+    ('IJTM-CET-028', 'IJTM-020'): (p_092edfd44678be3f,),
+    ('IJTM-CET-029', 'IJTM-012'): (p_591130975686416c,),
+    ('IJTM-CET-029', 'IJTM-017'): (p_092edfd44678be3f,),
+    ('IJTM-CET-029', 'IJTM-021'): (p_591130975686416c,),
+    ('IJTM-CET-030', 'IJTM-021'): (p_591130975686416c,),
+    ('IJTM-CET-031', 'IJTM-002'): (p_591130975686416c,),
+    ('IJTM-CET-031', 'IJTM-003'): (p_591130975686416c,),
+    ('IJTM-CET-031', 'IJTM-005'): (p_591130975686416c,),
+    ('IJTM-CET-031', 'IJTM-009'): (p_591130975686416c,),
+    ('IJTM-CET-031', 'IJTM-023'): (p_591130975686416c,),
+    ('IJTM-CET-031', 'IJTM-024'): (p_591130975686416c,),
+    ('IJTM-CET-031', 'IJTM-028'): (p_591130975686416c,),
+    ('IJTM-CET-031', 'IJTM-033'): (p_591130975686416c,),
+    ('IJTM-CET-031', 'IJTM-034'): (p_591130975686416c,),
+    ('IJTM-CET-032', 'IJTM-024'): (p_591130975686416c,),
+    ('IJTM-CET-033', 'IJTM-002'): (p_591130975686416c,),
+    ('IJTM-CET-033', 'IJTM-003'): (p_591130975686416c,),
+    ('IJTM-CET-033', 'IJTM-017'): (p_591130975686416c,),
+    ('IJTM-CET-033', 'IJTM-024'): (p_591130975686416c,),
+    ('IJTM-CET-033', 'IJTM-028'): (p_591130975686416c,),
+    ('IJTM-CET-033', 'IJTM-032'): (p_591130975686416c,),
+    ('IJTM-CET-033', 'IJTM-033'): (p_591130975686416c,),
+    ('IJTM-CET-033', 'IJTM-034'): (p_591130975686416c,),
+    ('IJTM-CET-034', 'IJTM-015'): (p_591130975686416c,),
+    ('IJTM-CET-034', 'IJTM-018'): (p_591130975686416c,),
+    ('IJTM-CET-034', 'IJTM-020'): (p_591130975686416c,),
+    ('IJTM-CET-034', 'IJTM-028'): (p_591130975686416c,),
+    ('IJTM-CET-035', 'IJTM-034'): (p_591130975686416c,),
+    ('IJTM-CET-036', 'IJTM-002'): (p_591130975686416c,),
+    ('IJTM-CET-037', 'IJTM-021'): (p_591130975686416c,),
+    ('IJTM-CET-038', 'IJTM-009'): (p_591130975686416c,),
+    ('IJTM-CET-038', 'IJTM-019'): (p_591130975686416c,),
+    ('IJTM-CET-038', 'IJTM-023'): (p_591130975686416c,),
+}
+
+def check(table, key, student):
+    """True when any alternative criteria set of table[key] passes."""
+    return any(p(student) for p in table[key])
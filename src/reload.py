@@ -0,0 +1,163 @@
+"""
+Hot reload of the data folder, without restarting the app.
+
+DataStore.current is a Dataset: the tables (a LazyCatalogue, src/lazy.py),
+the two RequirementIndexes built from their rule columns, the course
+descriptions (src/description.py) and a version hash of the data files. A Dataset is never replaced in part. check() (run every few seconds by the
+thread start() launches) re-reads only the files whose content changed,
+rebuilds only the index whose requirements changed (or the descriptions
+store, if descriptions.jsonl changed), and then replaces
+`current` in one assignment. A session that took `store.current` at the
+top of its run keeps a consistent version to the end of it. The next run
+sees the new one. The tables are stamped with the hashes in Dataset.files,
+so a part of the old version that was never loaded before the swap is
+read from the snapshot of the old content or refused (lazy.StaleDataError),
+never from the new files.
+
+Creating a store reads no more than the rule columns the indexes need. The
+binary snapshot (src/snapshot.py) is rebuilt, if missing or stale, on the
+watcher thread: when it starts and after each reload. Until then parts are
+read from the CSVs.
+
+A changed file is read whole and typed before the swap; if that fails
+(half-copied, missing a column, a bad flag) the current Dataset stays in
+place. The failure is kept in store.error, and the file is retried when it
+changes again.
+
+Dataset.version changes with any data file, so caches keyed on it (the
+app's EligibilityCache) never mix versions.
+"""
+import hashlib
+import os
+import sys
+import threading
+from collections import namedtuple
+
+from src.cache import dataset_version
+from src.description import DESCRIPTIONS_FILE, DescriptionStore
+from src.index import build_index
+from src.lazy import LazyCatalogue, StaleDataError
+from src.loader import FILES
+from src.snapshot import refresh_snapshot
+
+Dataset = namedtuple('Dataset', ['tables', 'poly_index', 'tvet_index', 'descriptions', 'version', 'files'])
+
+# Watched besides the catalogue; a missing one is not an error
+OPTIONAL_FILES = [DESCRIPTIONS_FILE]
+
+# Dataset field -> (requirement table it is built from, track name of its lookup)
+INDEXES = {'poly_index': ('requirements', 'poly'), 'tvet_index': ('tvet_requirements', 'tvet')}
+
+def _combined_version(files):
+    h = hashlib.blake2b(digest_size=8)
+    for filename in sorted(files):
+        h.update(f"{filename}:{files[filename]};".encode())
+    return h.hexdigest()
+
+class DataStore:
+    """The current Dataset of a data folder, reloaded when its files change."""
+
+    def __init__(self, data_folder="data", interval=5.0):
+        self.data_folder = data_folder
+        self.interval = interval
+        self.error = None
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        watched = list(FILES.values()) + OPTIONAL_FILES
+        self._stats = {filename: self._stat(filename) for filename in watched}
+        files = {filename: self._hash(filename) for filename in watched}
+        self.current = self._assemble(LazyCatalogue(data_folder, files=files), files)
+
+    def _path(self, filename):
+        return os.path.join(self.data_folder, filename)
+
+    def _stat(self, filename):
+        try:
+            stat = os.stat(self._path(filename))
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def _hash(self, filename):
+        if filename in OPTIONAL_FILES and not os.path.exists(self._path(filename)):
+            return None
+        return dataset_version([self._path(filename)])
+
+    def _assemble(self, tables, files, previous=None):
+        indexes = {}
+        for field, (table, track) in INDEXES.items():
+            filename = FILES[table]
+            if previous is not None and previous.files[filename] == files[filename]:
+                indexes[field] = getattr(previous, field)
+            else:
+                indexes[field] = build_index(tables.rules(table), track, self.data_folder)
+        if previous is not None and previous.files[DESCRIPTIONS_FILE] == files[DESCRIPTIONS_FILE]:
+            descriptions = previous.descriptions
+        else:
+            descriptions = DescriptionStore(self._path(DESCRIPTIONS_FILE))
+        return Dataset(tables=tables, descriptions=descriptions, version=_combined_version(files),
+                       files=files, **indexes)
+
+    def changed_files(self):
+        """filename -> new hash, for files whose content differs from the current Dataset's (size/mtime first)."""
+        changed = {}
+        for filename, known in self.current.files.items():
+            stat = self._stat(filename)
+            if stat is None or stat == self._stats[filename]:
+                continue
+            self._stats[filename] = stat
+            content = self._hash(filename)
+            if content != known:
+                changed[filename] = content
+        return changed
+
+    def check(self):
+        """Reloads changed files and swaps in the new Dataset. Returns the filenames reloaded."""
+        with self._lock:
+            changed = self.changed_files()
+            if not changed:
+                return []
+            previous = self.current
+            names = [name for name, filename in FILES.items() if filename in changed]
+            files = dict(previous.files, **changed)
+            try:
+                tables = previous.tables.replace(names, files) if names else previous.tables
+                dataset = self._assemble(tables, files, previous)
+            except (OSError, ValueError, StaleDataError) as e:
+                # Keep serving the last good version until the file changes again
+                self.error = f"{', '.join(changed)}: {e}"
+                return []
+            self.current = dataset
+            self.error = None
+            self.reloads += 1
+        return list(changed)
+
+    # --- WATCHER ---
+    def start(self):
+        """Refreshes the snapshot, then checks for changes every `interval` seconds, on a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="data-reload", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self):
+        refresh_snapshot(self.data_folder)
+        while not self._stop.wait(self.interval):
+            error = self.error
+            try:
+                changed = self.check()
+            except Exception as e:   # never let a bad file kill the watcher
+                self.error, changed = str(e), []
+            if changed:
+                print(f"data reloaded ({', '.join(changed)}): version {self.current.version}", file=sys.stderr)
+                refresh_snapshot(self.data_folder)
+            elif self.error and self.error != error:
+                print(f"data reload failed: {self.error}", file=sys.stderr)
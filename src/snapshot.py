@@ -0,0 +1,220 @@
+"""
+Binary snapshot of the cleaned catalogue, for fast cold starts.
+
+build_snapshot() runs the CSVs through src/loader.py once and stores the
+tables as .npy blocks under data/snapshot/: numbers as they are (one block
+per table and dtype), categoricals as int codes plus their categories, and
+text as one UTF-8 buffer per table with each cell's byte offsets and a
+null mask, so a string costs its own length, not the longest one's.
+manifest.json (written last, so a half-built snapshot is never used) lists
+the columns and, per source CSV, its size, mtime and content hash.
+
+The sources are hashed before they are parsed and again once the arrays
+are written; if an edit landed in between, the build starts over, so a
+manifest never vouches for tables parsed from other contents.
+
+load_snapshot() reads the arrays back into the same DataFrames
+load_catalogue() would give (a table is a few files, read whole). A source whose size or mtime moved is
+re-hashed; only a real content change makes the snapshot stale (None).
+load_snapshot_table() reads just some columns of one table, which is what
+src/lazy.py builds on; given a content hash, it serves that version of the
+table even after the CSV moved on. refresh_snapshot() rebuilds a stale one.
+
+    python scripts/build_snapshot.py [data_folder]
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.cache import dataset_version
+from src.loader import FILES, Catalogue, load_catalogue
+
+MANIFEST = "manifest.json"
+FORMAT = 2
+
+def snapshot_dir(data_folder):
+    return os.path.join(data_folder, "snapshot")
+
+def _source_state(data_folder, filename, with_hash=True):
+    path = os.path.join(data_folder, filename)
+    stat = os.stat(path)
+    state = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if with_hash:
+        state['hash'] = dataset_version([path])
+    return state
+
+def _save(folder, stem, array):
+    # Written aside and renamed over, so a reader never sees half a file
+    path = os.path.join(folder, stem + ".npy")
+    with open(path + ".tmp", 'wb') as f:
+        np.save(f, array)
+    os.replace(path + ".tmp", path)
+
+def _encode(strings):
+    """One UTF-8 buffer (uint8) and the len+1 byte offsets of the strings in it."""
+    data = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(data) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in data], out=offsets[1:])
+    return np.frombuffer(b''.join(data), dtype=np.uint8), offsets
+
+def _decode(buffer, offsets):
+    raw = buffer.tobytes()
+    return [raw[start:end].decode('utf-8') for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+
+def _save_strings(folder, stem, strings):
+    buffer, offsets = _encode(strings)
+    _save(folder, stem, buffer)
+    _save(folder, stem + ".offsets", offsets)
+
+def _save_table(folder, name, df):
+    """
+    Writes one table as a few block files: every numeric dtype as one
+    (columns x rows) array, all text as one UTF-8 buffer with offsets and a
+    null mask, and each categorical as codes plus categories. Returns its
+    manifest entry.
+    """
+    columns, blocks, text = [], {}, []
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            stem = f"{name}.cat{len(columns)}"
+            _save(folder, stem, series.cat.codes.to_numpy())
+            _save_strings(folder, stem + ".categories", [str(c) for c in series.cat.categories])
+            columns.append({'name': col, 'kind': 'category', 'file': stem})
+        elif pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+            block = blocks.setdefault(str(series.dtype), [])
+            columns.append({'name': col, 'kind': 'number', 'file': f"{name}.{series.dtype}", 'row': len(block)})
+            block.append(series.to_numpy())
+        else:
+            columns.append({'name': col, 'kind': 'text', 'dtype': str(series.dtype), 'row': len(text)})
+            text.append(series)
+    for dtype, block in blocks.items():
+        _save(folder, f"{name}.{dtype}", np.vstack(block))
+    if text:
+        # Column after column in one buffer; column i is cells i*rows .. (i+1)*rows
+        _save_strings(folder, f"{name}.text", [value for s in text for value in s.fillna('').astype(str)])
+        _save(folder, f"{name}.null", np.vstack([s.isna().to_numpy() for s in text]))
+    return {'rows': len(df), 'columns': columns}
+
+def _load_table(folder, name, table, keep=None):
+    def block(stem):
+        if stem not in loaded:
+            loaded[stem] = np.load(os.path.join(folder, stem + ".npy"), allow_pickle=False)
+        return loaded[stem]
+
+    def strings(stem, start=0, stop=None):
+        offsets = block(stem + ".offsets")
+        return _decode(block(stem), offsets[start:None if stop is None else stop + 1])
+
+    loaded, data, rows = {}, {}, table['rows']
+    for entry in table['columns']:
+        if keep is not None and not keep(entry['name']):
+            continue
+        if entry['kind'] == 'category':
+            categories = strings(entry['file'] + ".categories")
+            data[entry['name']] = pd.Categorical.from_codes(block(entry['file']), categories=categories)
+        elif entry['kind'] == 'number':
+            data[entry['name']] = block(entry['file'])[entry['row']]
+        else:
+            values = np.array(strings(f"{name}.text", entry['row'] * rows, (entry['row'] + 1) * rows), dtype=object)
+            values[block(f"{name}.null")[entry['row']]] = np.nan
+            data[entry['name']] = pd.array(values, dtype=entry['dtype'])
+    return pd.DataFrame(data, index=pd.RangeIndex(rows))
+
+def build_snapshot(data_folder="data", attempts=3):
+    """
+    Writes the snapshot for data_folder. Returns the manifest, or None
+    (and no manifest) if the CSVs kept changing under every attempt.
+    """
+    folder = snapshot_dir(data_folder)
+    os.makedirs(folder, exist_ok=True)
+    manifest_path = os.path.join(folder, MANIFEST)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    for _ in range(attempts):
+        sources = {filename: _source_state(data_folder, filename) for filename in FILES.values()}
+        catalogue = load_catalogue(data_folder)
+        tables = {name: _save_table(folder, name, df) for name, df in zip(Catalogue._fields, catalogue)}
+        after = {filename: _source_state(data_folder, filename)['hash'] for filename in FILES.values()}
+        if after == {filename: state['hash'] for filename, state in sources.items()}:
+            break
+    else:
+        return None
+
+    manifest = {'format': FORMAT, 'sources': sources, 'tables': tables}
+    with open(manifest_path + ".tmp", 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return manifest
+
+def is_fresh(manifest, data_folder, filenames=None):
+    """True while every source CSV (or those named) still has the content the snapshot was built from."""
+    if manifest.get('format') != FORMAT:
+        return False
+    for filename, saved in manifest['sources'].items():
+        if filenames is not None and filename not in filenames:
+            continue
+        try:
+            now = _source_state(data_folder, filename, with_hash=False)
+        except OSError:
+            return False
+        if now['size'] == saved['size'] and now['mtime_ns'] == saved['mtime_ns']:
+            continue
+        # Touched (git checkout, copy into a container...): compare contents
+        if now['size'] != saved['size'] or dataset_version([os.path.join(data_folder, filename)]) != saved['hash']:
+            return False
+    return True
+
+def read_manifest(data_folder="data"):
+    """The snapshot's manifest, or None if there is no usable one."""
+    try:
+        with open(os.path.join(snapshot_dir(data_folder), MANIFEST)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('format') == FORMAT else None
+
+def load_snapshot(data_folder="data"):
+    """The snapshot's Catalogue, or None if it is missing, unreadable or stale."""
+    folder = snapshot_dir(data_folder)
+    manifest = read_manifest(data_folder)
+    try:
+        if manifest is None or not is_fresh(manifest, data_folder):
+            return None
+        return Catalogue(**{name: _load_table(folder, name, table) for name, table in manifest['tables'].items()})
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def load_snapshot_table(data_folder, name, keep=None, source_hash=None):
+    """
+    One table (only the columns keep(name) accepts, if given), or None if
+    the snapshot does not hold it: built from another content of its CSV
+    than the one on disk now or, if given, the one hashed to source_hash.
+    """
+    manifest = read_manifest(data_folder)
+    filename = FILES[name]
+    try:
+        if manifest is None:
+            return None
+        if source_hash is None and not is_fresh(manifest, data_folder, [filename]):
+            return None
+        if source_hash is not None and manifest['sources'][filename]['hash'] != source_hash:
+            return None
+        df = _load_table(snapshot_dir(data_folder), name, manifest['tables'][name], keep)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    # Rebuilt while being read: the arrays may come from two builds
+    return df if read_manifest(data_folder) == manifest else None
+
+def refresh_snapshot(data_folder="data"):
+    """Rebuilds a missing or stale snapshot when the folder is writable. True if it is fresh afterwards."""
+    manifest = read_manifest(data_folder)
+    if manifest is not None and is_fresh(manifest, data_folder):
+        return True
+    try:
+        return build_snapshot(data_folder) is not None
+    except (OSError, ValueError):   # read-only folder, or a CSV that does not load
+        return False
@@ -0,0 +1,112 @@
+"""
+Sparse students x courses eligibility, for cohort-wide questions.
+
+Most students qualify for a small share of the catalogue, so the matrix is
+kept course by course (CSR over courses): indptr[c]:indptr[c + 1] slices
+`indices`, the sorted student numbers eligible for courses[c]. Saved as
+one .npz with the course ids and student ids next to it.
+
+    e = SparseEligibility.load("results.npz")
+    e.difference("POLY-DIP-009", "POLY-DIP-008")   # eligible for 009 but not 008
+    len(e.any_of(e.courses_like("IKBN")))           # qualify for any IKBN course
+
+Results are student numbers (rows of the input); e.ids() turns them into
+student ids. bitmap() gives a course as packed bits over all students.
+"""
+import numpy as np
+
+class SparseEligibility:
+    """CSR-by-course eligibility with course-id and student-id dictionaries."""
+
+    def __init__(self, indptr, indices, courses, students):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.courses = [str(c) for c in courses]
+        self.students = np.asarray(students, dtype=str)
+        self._course = {c: i for i, c in enumerate(self.courses)}
+
+    @classmethod
+    def from_pairs(cls, course_codes, student_numbers, courses, students):
+        """From (course, student) pairs, e.g. np.nonzero of a dense matrix, in any order."""
+        course_codes = np.asarray(course_codes, dtype=np.int64)
+        order = np.lexsort((student_numbers, course_codes))
+        indptr = np.zeros(len(courses) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(course_codes, minlength=len(courses)), out=indptr[1:])
+        return cls(indptr, np.asarray(student_numbers)[order], courses, students)
+
+    @classmethod
+    def from_matrix(cls, matrix, courses, students):
+        """From a dense (students x courses) bool matrix."""
+        student_numbers, course_codes = np.nonzero(matrix)
+        return cls.from_pairs(course_codes, student_numbers, courses, students)
+
+    def __len__(self):
+        return len(self.students)
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    def save(self, path):
+        # Through a file object, so the name is kept as given (no .npz appended)
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, indptr=self.indptr, indices=self.indices,
+                                courses=np.array(self.courses, dtype=str), students=self.students)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['indptr'], data['indices'], data['courses'], data['students'])
+
+    # --- QUERIES ---
+    def eligible(self, course):
+        """Sorted student numbers eligible for one course."""
+        c = self._course[course]
+        return self.indices[self.indptr[c]:self.indptr[c + 1]]
+
+    def courses_like(self, prefix):
+        """Course ids starting with prefix."""
+        return [c for c in self.courses if c.startswith(prefix)]
+
+    def bitmap(self, course):
+        """The course as packed bits over all students (np.unpackbits(..., count=len(self)) to expand)."""
+        return np.packbits(self._mask([course]))
+
+    def _mask(self, courses):
+        mask = np.zeros(len(self), dtype=bool)
+        for course in courses:
+            mask[self.eligible(course)] = True
+        return mask
+
+    def any_of(self, courses):
+        """Students eligible for at least one of the courses."""
+        return np.flatnonzero(self._mask(courses))
+
+    def all_of(self, courses):
+        """Students eligible for every one of the courses."""
+        counts = np.zeros(len(self), dtype=np.int32)
+        for course in courses:
+            counts[self.eligible(course)] += 1
+        return np.flatnonzero(counts == len(courses))
+
+    def difference(self, course, other):
+        """Students eligible for course but not for other."""
+        return np.setdiff1d(self.eligible(course), self.eligible(other), assume_unique=True)
+
+    def course_counts(self):
+        """course id -> number of eligible students."""
+        return dict(zip(self.courses, np.diff(self.indptr).tolist()))
+
+    def student_courses(self, number):
+        """Course ids one student is eligible for (a binary search per course)."""
+        found = []
+        for course in self.courses:
+            row = self.eligible(course)
+            k = np.searchsorted(row, number)
+            if k < len(row) and row[k] == number:
+                found.append(course)
+        return found
+
+    def ids(self, numbers):
+        """Student ids of student numbers."""
+        return self.students[np.asarray(numbers, dtype=np.int64)].tolist()
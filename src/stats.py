@@ -0,0 +1,186 @@
+"""
+Recorded engine statistics, saved as JSON so batch runs can feed the app.
+
+RuleSetStats counts, per requirement signature (signature_key), how often
+the rule set was evaluated and how often it passed. RequirementIndex uses
+the pass rates to try a course's most successful alternative first.
+
+RuleStats counts, per rule column, how often the rule was checked and how
+often it rejected the student. Every active rule is checked, not just the
+ones the short-circuiting fast path would reach, so the rates do not
+depend on the current order. Its order() (most often failing first) is
+what set_rule_order() wants, so the fast path stops as early as possible.
+That costs more than the check itself, so batch runs record every student
+(python -m src.cohort --rule-stats) while the app records only a sample,
+and only when asked to: RuleStatsRecorder adds a fraction of its checks to
+the same file every few minutes and at exit.
+"""
+import atexit
+import json
+import os
+import random
+import threading
+
+import pandas as pd
+
+from src.engine import RULE_COLUMNS
+
+class RuleSetStats:
+    """evaluated / passed counters per signature_key."""
+
+    def __init__(self, counts=None):
+        self.counts = {key: list(v) for key, v in (counts or {}).items()}
+        self._lock = threading.Lock()
+
+    def record(self, key, passed):
+        with self._lock:
+            entry = self.counts.setdefault(key, [0, 0])
+            entry[0] += 1
+            entry[1] += bool(passed)
+
+    def merge(self, other):
+        """Adds another RuleSetStats' counts (e.g. from a worker process)."""
+        with self._lock:
+            for key, (e, p) in other.counts.items():
+                entry = self.counts.setdefault(key, [0, 0])
+                entry[0] += e
+                entry[1] += p
+
+    def pass_rate(self, key):
+        evaluated, passed = self.counts.get(key, (0, 0))
+        return passed / evaluated if evaluated else 0.0
+
+    def to_dict(self):
+        return {key: {"evaluated": e, "passed": p} for key, (e, p) in sorted(self.counts.items())}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls({key: (v["evaluated"], v["passed"]) for key, v in data.items()})
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+class RuleStats:
+    """evaluations / rejections counters per rule column."""
+
+    def __init__(self, counts=None):
+        self.counts = {col: [0, 0] for col in RULE_COLUMNS}
+        for col, v in (counts or {}).items():
+            self.counts[col] = list(v)
+        self._lock = threading.Lock()
+
+    def record(self, student, compiled):
+        """Checks every active rule of a CompiledRequirement (no short-circuit) and counts it."""
+        three_m = (compiled.three_m,) if compiled.three_m else ()
+        outcomes = [(rule.column, rule.test(student)) for rule in compiled.gatekeepers + three_m + compiled.academics]
+        with self._lock:
+            for col, ok in outcomes:
+                entry = self.counts[col]
+                entry[0] += 1
+                entry[1] += not ok
+
+    def record_all(self, student, rules):
+        for compiled in rules:
+            self.record(student, compiled)
+
+    def take(self):
+        """A RuleStats with the counts so far, leaving this one at zero."""
+        with self._lock:
+            counts, self.counts = self.counts, {col: [0, 0] for col in RULE_COLUMNS}
+        return RuleStats(counts)
+
+    def merge(self, other):
+        """Adds another RuleStats' counts (e.g. from a worker process)."""
+        with self._lock:
+            for col, (e, r) in other.counts.items():
+                entry = self.counts.setdefault(col, [0, 0])
+                entry[0] += e
+                entry[1] += r
+
+    def rejection_rate(self, col):
+        evaluations, rejections = self.counts.get(col, (0, 0))
+        return rejections / evaluations if evaluations else 0.0
+
+    def order(self):
+        """Rule columns, most often rejecting first (never-seen rules last)."""
+        return sorted(RULE_COLUMNS, key=lambda col: (-self.rejection_rate(col), RULE_COLUMNS.index(col)))
+
+    def to_dict(self):
+        return {col: {"evaluations": e, "rejections": r} for col, (e, r) in self.counts.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls({col: (v["evaluations"], v["rejections"]) for col, v in data.items()})
+
+    def to_frame(self):
+        """One row per rule, sorted by rejections: which rules dominate the cost."""
+        df = pd.DataFrame([{"rule": col, "evaluations": e, "rejections": r,
+                            "rejection_rate": self.rejection_rate(col)}
+                           for col, (e, r) in self.counts.items()])
+        return df.sort_values(["rejections", "evaluations"], ascending=False, ignore_index=True)
+
+    def save(self, path):
+        # Written aside and renamed over: the app may be reading it
+        with open(path + ".tmp", 'w') as f:
+            json.dump(self.to_dict(), f, indent=1)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+class RuleStatsRecorder:
+    """
+    Records a `sample` fraction of the checks it is shown into a RuleStats
+    file, adding to what is there: every `interval` seconds once started,
+    and at exit.
+    """
+
+    def __init__(self, path, sample=0.01, interval=300.0, seed=None):
+        self.path = path
+        self.sample = sample
+        self.interval = interval
+        self.pending = RuleStats()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def maybe_record(self, student, rules):
+        if self._random.random() < self.sample:
+            self.pending.record_all(student, rules)
+
+    def flush(self):
+        """Adds the pending counts to the file and returns the totals."""
+        with self._lock:
+            pending = self.pending.take()
+            total = RuleStats.load(self.path) if os.path.exists(self.path) else RuleStats()
+            total.merge(pending)
+            total.save(self.path)
+        return total
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="rule-stats", daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            atexit.unregister(self.flush)
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
@@ -0,0 +1,128 @@
+"""
+Batch engine: evaluates a whole cohort against a whole requirements table
+with NumPy array operations instead of a Python loop per (student, row).
+
+Results match check_eligibility() exactly. Both sides go through the same
+reduction: a requirement row becomes its signature (see
+requirement_signature), a student becomes one "satisfied" bit per rule
+column, and a row passes when every rule it switches on is satisfied and
+the student has enough credits and passes.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from src.engine import (FLAG_COLUMNS, SUBJECTS, SUBJECT_INDEX, PURE_SCIENCE, ALL_SCIENCE, TECHNICAL,
+                        ATTEMPTED_MIN, PASS_MIN, CREDIT_MIN, requirement_signature)
+
+RequirementArrays = namedtuple('RequirementArrays', ['required', 'min_credits', 'min_pass'])
+StudentArrays = namedtuple('StudentArrays', [
+    'grades', 'citizen', 'male', 'female', 'not_colorblind', 'not_disabled',
+    'other_tech', 'other_voc', 'credits', 'passes'
+])
+
+_PURE = [SUBJECT_INDEX[s] for s in PURE_SCIENCE]
+_SCI = [SUBJECT_INDEX[s] for s in ALL_SCIENCE]
+_TECH = [SUBJECT_INDEX[s] for s in TECHNICAL]
+
+# Students per block, keeps the (students x rows) temporaries small
+CHUNK_SIZE = 4096
+
+def encode_requirements(rows):
+    """Encodes a requirements DataFrame (or list of dicts) as integer arrays."""
+    if isinstance(rows, pd.DataFrame):
+        rows = rows.to_dict('records')
+    n_flags = len(FLAG_COLUMNS)
+    sigs = np.array([requirement_signature(req) for req in rows], dtype=np.int16).reshape(-1, n_flags + 2)
+    return RequirementArrays(
+        required=sigs[:, :n_flags].astype(np.int8),
+        min_credits=sigs[:, n_flags],
+        min_pass=sigs[:, n_flags + 1],
+    )
+
+def encode_students(students):
+    """Encodes a list of StudentProfile as grade-ordinal arrays (one row per student)."""
+    n = len(students)
+    grades = np.frombuffer(b''.join(s.ordinals for s in students), dtype=np.int8).reshape(n, len(SUBJECTS))
+
+    def column(values, dtype=bool):
+        return np.fromiter(values, dtype=dtype, count=n)
+
+    return StudentArrays(
+        grades=grades,
+        citizen=column(s.nationality == 'Warganegara' for s in students),
+        male=column(s.gender == 'Lelaki' for s in students),
+        female=column(s.gender == 'Perempuan' for s in students),
+        not_colorblind=column(s.colorblind == 'Tidak' for s in students),
+        not_disabled=column(s.disability == 'Tidak' for s in students),
+        other_tech=column(bool(s.other_tech) for s in students),
+        other_voc=column(bool(s.other_voc) for s in students),
+        # Counted by the profile itself, which also sees subjects outside SUBJECTS
+        credits=column((s.credits for s in students), np.int16),
+        passes=column((s.passes for s in students), np.int16),
+    )
+
+def as_student_arrays(students):
+    """StudentArrays from StudentArrays, a StudentBatch (see src/batch.py) or a StudentProfile list."""
+    if isinstance(students, StudentArrays):
+        return students
+    if hasattr(students, 'arrays'):
+        return students.arrays()
+    return encode_students(students)
+
+def satisfied_rules(st):
+    """Returns a (students x FLAG_COLUMNS) bool matrix: does the student meet each rule?"""
+    g = st.grades
+    attempted, passed, credit = g >= ATTEMPTED_MIN, g >= PASS_MIN, g >= CREDIT_MIN
+
+    def col(subj): return SUBJECT_INDEX[subj]
+    bm, eng, hist, math, addmath = (col(s) for s in ('bm', 'eng', 'hist', 'math', 'addmath'))
+
+    pass_sci_tech = passed[:, _SCI].any(axis=1) | passed[:, _TECH].any(axis=1) | st.other_tech
+    outcomes = {
+        'req_malaysian': st.citizen,
+        'req_male': st.male,
+        'req_female': st.female,
+        'no_colorblind': st.not_colorblind,
+        'no_disability': st.not_disabled,
+        '3m_only': attempted[:, bm] & attempted[:, math],
+        'pass_bm': passed[:, bm],
+        'credit_bm': credit[:, bm],
+        'pass_history': passed[:, hist],
+        'pass_eng': passed[:, eng],
+        'credit_english': credit[:, eng],
+        'pass_math': passed[:, math] | passed[:, addmath],
+        'credit_math': credit[:, math] | credit[:, addmath],
+        'pass_math_sci': passed[:, math] | passed[:, _PURE].any(axis=1),
+        'pass_science_tech': pass_sci_tech,
+        'credit_math_sci': credit[:, math] | credit[:, _PURE].any(axis=1),
+        'credit_math_sci_tech': (credit[:, math] | credit[:, _SCI].any(axis=1)
+                                 | credit[:, _TECH].any(axis=1) | st.other_tech),
+        'pass_stv': pass_sci_tech | st.other_voc,
+    }
+    return np.column_stack([outcomes[c] for c in FLAG_COLUMNS])
+
+def eligibility_matrix(students, requirements):
+    """
+    Returns a (students x rows) bool matrix, True where check_eligibility() would be.
+    Accepts StudentProfile lists / requirement rows, a StudentBatch, or their encoded arrays.
+    """
+    students = as_student_arrays(students)
+    if not isinstance(requirements, RequirementArrays):
+        requirements = encode_requirements(requirements)
+
+    required = requirements.required.T.astype(np.float32)
+    n = len(students.credits)
+    out = np.empty((n, len(requirements.min_credits)), dtype=bool)
+    for start in range(0, n, CHUNK_SIZE):
+        block = StudentArrays(*(a[start:start + CHUNK_SIZE] for a in students))
+        missing = (~satisfied_rules(block)).astype(np.float32)
+        # Number of switched-on rules the student does not meet, per row
+        unmet = missing @ required
+        out[start:start + CHUNK_SIZE] = (
+            (unmet == 0)
+            & (block.credits[:, None] >= requirements.min_credits[None, :])
+            & (block.passes[:, None] >= requirements.min_pass[None, :])
+        )
+    return out
@@ -0,0 +1,49 @@
+import unittest
+import io
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.batch import StudentBatch
+from src.bitmask import MaskTable
+from src.cohort import profile_from_record, read_records
+from src.engine import is_eligible, load_and_clean_data
+from src.vector import eligibility_matrix
+from test_cohort import SCHOOL_CSV
+from test_vector import random_cohort
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class TestStudentBatch(unittest.TestCase):
+
+    # --- TEST 1: A CSV batch holds the same students as per-row profiles ---
+    def test_01_from_csv_matches_profiles(self):
+        batch = StudentBatch.from_csv(io.StringIO(SCHOOL_CSV))
+        profiles = [profile_from_record(r) for r in read_records(io.StringIO(SCHOOL_CSV), 'csv')]
+        expected = StudentBatch.from_profiles(profiles)
+        for col in ['grades', 'gender', 'nationality', 'colorblind', 'disability',
+                    'other_tech', 'other_voc', 'credits', 'passes']:
+            np.testing.assert_array_equal(getattr(batch, col), getattr(expected, col), col)
+        self.assertEqual(batch.ids.tolist(), ['S1', 'S2', 'S3', 'S4'])
+        self.assertEqual(dict(batch.profile(3).grades.items()), dict(profiles[3].grades.items()))
+        chunks = list(StudentBatch.from_csv(io.StringIO(SCHOOL_CSV), chunksize=3))
+        self.assertEqual([len(c) for c in chunks], [3, 1])
+        print("\n✅ Batch: CSV columns match per-row profiles")
+
+    # --- TEST 2: Vectorized engines accept a batch directly ---
+    def test_02_feeds_vector_engines(self):
+        cohort = random_cohort(300, seed=37)
+        batch = StudentBatch.from_profiles(cohort)
+        rows = load_and_clean_data(os.path.join(DATA_FOLDER, 'requirements.csv')).to_dict('records')
+        expected = np.array([[is_eligible(s, req) for req in rows] for s in cohort])
+        np.testing.assert_array_equal(eligibility_matrix(batch, rows), expected)
+        np.testing.assert_array_equal(MaskTable.from_rows(rows).matrix(batch[100:]), expected[100:])
+        self.assertEqual(batch.nbytes, 300 * 32)
+        print("✅ Batch: vector and bitmask engines read batches")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import is_eligible, load_and_clean_data, rule_mask
+from src.bitmask import MaskTable, student_masks
+from test_vector import random_cohort
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class TestBitmaskKernel(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tables = [load_and_clean_data(os.path.join(DATA_FOLDER, f)).to_dict('records')
+                      for f in ['requirements.csv', 'tvet_requirements.csv']]
+        cls.cohort = random_cohort(400, seed=29)
+
+    # --- TEST 1: Packed NumPy masks equal the scalar rule_mask ---
+    def test_01_student_masks(self):
+        expected = np.array([rule_mask(s) for s in self.cohort], dtype=np.uint64)
+        np.testing.assert_array_equal(student_masks(self.cohort), expected)
+        print("\n✅ Bitmask: student masks match")
+
+    # --- TEST 2: Scalar loop and uint64 matrix both match the engine ---
+    def test_02_kernel_matches_engine(self):
+        for rows in self.tables:
+            table = MaskTable.from_rows(rows)
+            matrix = table.matrix(self.cohort)
+            for s, row in zip(self.cohort, matrix):
+                expected = [i for i, req in enumerate(rows) if is_eligible(s, req)]
+                self.assertEqual(table.eligible_rows(s), expected)
+                self.assertEqual(np.flatnonzero(row).tolist(), expected)
+        print("✅ Bitmask: kernel matches check_eligibility")
+
+if __name__ == '__main__':
+    unittest.main()
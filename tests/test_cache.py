@@ -0,0 +1,49 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import StudentProfile
+from src.cache import EligibilityCache, student_fingerprint
+
+def make_student(grades, **kwargs):
+    details = dict(gender='Lelaki', nationality='Warganegara', colorblind='Tidak', disability='Tidak')
+    details.update(kwargs)
+    return StudentProfile(grades=grades, **details)
+
+class TestResultCache(unittest.TestCase):
+
+    # --- TEST 1: Fingerprint ignores order and which elective gave the credit ---
+    def test_01_canonical_fingerprint(self):
+        a = make_student({'bm': 'C', 'hist': 'C', 'math': 'B', 'geo': 'A'})
+        b = make_student({'psv': 'B+', 'math': 'A-', 'hist': 'C+', 'bm': 'B'})
+        self.assertEqual(student_fingerprint(a), student_fingerprint(b))
+
+    # --- TEST 2: Anything the engine can see changes it ---
+    def test_02_relevant_changes(self):
+        base = make_student({'bm': 'C', 'hist': 'C', 'math': 'B'})
+        for other in [make_student({'bm': 'C', 'hist': 'C', 'math': 'D'}),
+                      make_student({'bm': 'C', 'hist': 'C', 'math': 'B', 'geo': 'C'}),
+                      make_student({'bm': 'C', 'hist': 'C', 'math': 'B'}, colorblind='Ya')]:
+            self.assertNotEqual(student_fingerprint(base), student_fingerprint(other))
+
+    # --- TEST 3: Bounded LRU with counters ---
+    def test_03_lru_counters(self):
+        cache = EligibilityCache(maxsize=2)
+        calls = []
+        def compute(v):
+            return lambda: calls.append(v) or v
+        self.assertEqual(cache.get_or_compute('a', compute(1)), 1)
+        self.assertEqual(cache.get_or_compute('b', compute(2)), 2)
+        self.assertEqual(cache.get_or_compute('a', compute(9)), 1)   # hit, 'a' now newest
+        cache.get_or_compute('c', compute(3))                          # evicts 'b'
+        self.assertEqual(cache.get_or_compute('b', compute(4)), 4)
+        self.assertEqual(calls, [1, 2, 3, 4])
+        stats = cache.stats()
+        print(f"\n🔹 CACHE: {stats}")
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions'], stats['size']), (1, 4, 2, 2))
+
+if __name__ == '__main__':
+    unittest.main()
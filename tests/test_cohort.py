@@ -0,0 +1,104 @@
+import unittest
+import io
+import json
+import sys
+import os
+import shutil
+import tempfile
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cohort import Screener, load_indexes, read_records, screen_parallel, screen_records, write_results
+from src.engine import StudentProfile, is_eligible, load_and_clean_data, rule_order, set_rule_order
+from src.reload import DataStore
+from src.stats import RuleSetStats, RuleStats
+from test_vector import GRADES
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+SCHOOL_CSV = """Student_ID,Nama,BM,ENG,HIST,MATH,ADDMATH,PHY,GENDER,NATIONALITY,OTHER_TECH
+S1,Ali,A,B,C,A,B,C,Lelaki,Warganegara,0
+S2,Siti,G,E,G,E,,,Perempuan,Warganegara,
+S3,Ravi,A,A,A,A,A,A,Lelaki,Bukan Warganegara,
+S4,Mei,C,C,C,Tidak Ambil,,,Perempuan,,ya
+"""
+
+class TestCohortScreening(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.indexes = load_indexes(DATA_FOLDER)
+
+    # --- TEST 1: Streamed results equal a row-by-row engine check ---
+    def test_01_matches_engine(self):
+        results = list(screen_records(read_records(io.StringIO(SCHOOL_CSV), 'csv'),
+                                      Screener(self.indexes), chunk_size=3))
+        self.assertEqual([r['student_id'] for r in results], ['S1', 'S2', 'S3', 'S4'])
+        self.assertEqual(results[2]['poly'] + results[2]['kk'] + results[2]['tvet'], [])
+
+        ali = StudentProfile(grades={'bm': 'A', 'eng': 'B', 'hist': 'C', 'math': 'A', 'addmath': 'B', 'phy': 'C'},
+                             gender='Lelaki', nationality='Warganegara', colorblind='Tidak', disability='Tidak')
+        rows = load_and_clean_data(os.path.join(DATA_FOLDER, 'tvet_requirements.csv')).to_dict('records')
+        expected = list(dict.fromkeys(r['course_id'].strip() for r in rows if is_eligible(ali, r)))
+        self.assertEqual(results[0]['tvet'], expected)
+        self.assertEqual(results[0]['credits'], ali.credits)
+        print("\n✅ Cohort: streamed results match the engine")
+
+    # --- TEST 2: NDJSON in/out round trip, with recorded stats ---
+    def test_02_ndjson_and_stats(self):
+        records = list(read_records(io.StringIO(SCHOOL_CSV), 'csv'))
+        # Keys as another exporter might write them: upper case, padded
+        ndjson = "".join(json.dumps({f" {k.upper()}": v for k, v in r.items()}) + "\n" for r in records)
+        stats = RuleSetStats()
+        out = io.StringIO()
+        write_results(screen_records(read_records(io.StringIO(ndjson), 'ndjson'),
+                                     Screener(self.indexes, stats=stats)), out, 'ndjson')
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        plain = list(screen_records(records, Screener(self.indexes)))
+        self.assertEqual(lines, plain)
+        self.assertTrue(stats.to_dict())
+        print("✅ Cohort: NDJSON round trip and stats")
+
+    # --- TEST 3: Process pool gives the same results, in order, and the same stats ---
+    def test_03_parallel_matches_serial(self):
+        subjects = ['bm', 'eng', 'hist', 'math', 'addmath', 'phy', 'chem', 'bio', 'sci', 'rc']
+        records = [dict({subj: GRADES[(i * 7 + k * 3) % len(GRADES)] for k, subj in enumerate(subjects)},
+                        student_id=f"S{i}", gender=['Lelaki', 'Perempuan'][i % 2], other_voc=str(i % 3 == 0))
+                   for i in range(120)]
+        serial = Screener(self.indexes, stats=RuleSetStats(), rule_stats=RuleStats())
+        pooled = Screener(self.indexes, stats=RuleSetStats(), rule_stats=RuleStats())
+        expected = list(screen_records(records, serial))
+        got = list(screen_parallel(records, pooled, workers=2, chunk_size=25, data_folder=DATA_FOLDER))
+        self.assertEqual(got, expected)
+        self.assertEqual(pooled.stats.counts, serial.stats.counts)
+        self.assertEqual(pooled.rule_stats.counts, serial.rule_stats.counts)
+        print("✅ Cohort: parallel screening matches serial")
+
+    # --- TEST 4: Batch runs build their indexes like the app, recorded orders included ---
+    def test_04_same_indexes_as_app(self):
+        folder = tempfile.mkdtemp()
+        try:
+            for name in os.listdir(DATA_FOLDER):
+                if name.endswith('.csv') or name.endswith('.json'):
+                    shutil.copy(os.path.join(DATA_FOLDER, name), folder)
+            shutil.copytree(os.path.join(DATA_FOLDER, 'lookup'), os.path.join(folder, 'lookup'))
+            stats = RuleStats()
+            stats.counts['credit_math'] = [10, 9]
+            stats.save(os.path.join(folder, 'rule_stats.json'))
+
+            indexes = load_indexes(folder)
+            self.assertEqual(rule_order()[0], 'credit_math')
+            store = DataStore(folder)
+            for track, field in [('poly', 'poly_index'), ('tvet', 'tvet_index')]:
+                app_index = getattr(store.current, field)
+                self.assertEqual(indexes[track].courses, app_index.courses)
+                self.assertEqual(indexes[track].alternatives, app_index.alternatives)
+                self.assertEqual(indexes[track].lookup is None, app_index.lookup is None)
+        finally:
+            set_rule_order(None)
+            shutil.rmtree(folder)
+        print("✅ Cohort: indexes built through the same helper as the app")
+
+if __name__ == '__main__':
+    unittest.main()
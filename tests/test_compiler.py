@@ -0,0 +1,113 @@
+import unittest
+import pickle
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import (StudentProfile, check_eligibility, compile_requirement,
+                        compile_requirements, is_eligible, load_and_clean_data,
+                        rule_order, set_rule_order)
+from src.stats import RuleStats, RuleStatsRecorder
+
+class TestRequirementCompiler(unittest.TestCase):
+
+    def setUp(self):
+        self.req = {
+            'min_credits': 3, 'pass_bm': 1, 'pass_history': 1,
+            'req_malaysian': 1, 'req_male': 0, 'no_colorblind': 1,
+            'credit_math': 0
+        }
+        self.student = StudentProfile(
+            grades={'bm': 'C', 'hist': 'C', 'math': 'D'},
+            gender='Lelaki', nationality='Warganegara', colorblind='Tidak', disability='Tidak'
+        )
+
+    # --- TEST 1: Only active rules survive compilation ---
+    def test_01_only_active_rules(self):
+        compiled = compile_requirement(self.req)
+        labels = [r.label for r in compiled.gatekeepers + compiled.academics]
+        self.assertEqual(labels, ["Warganegara", "Bebas Buta Warna", "Lulus BM", "Lulus Sejarah", "Minimum 3 Kredit"])
+        self.assertIsNone(compiled.three_m)
+
+    # --- TEST 2: Same flags -> same predicate object ---
+    def test_02_rows_share_signature(self):
+        other = dict(self.req, course_id='X', remarks='ignored', credit_math=float('nan'))
+        self.assertIs(compile_requirement(self.req), compile_requirement(other))
+
+    # --- TEST 3: Delegation gives identical verdict and audit ---
+    def test_03_compiled_matches_dict(self):
+        compiled = compile_requirement(self.req)
+        self.assertEqual(check_eligibility(self.student, compiled), check_eligibility(self.student, self.req))
+        is_eligible, audit = check_eligibility(self.student, compiled)
+        self.assertFalse(is_eligible)
+        self.assertEqual(audit[-1]['reason'], "Hanya 2 Kredit (Perlu 3)")
+
+    # --- TEST 4: Whole files compile, and survive pickling (st.cache_data) ---
+    def test_04_compile_csv_rows(self):
+        data_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+        df = load_and_clean_data(os.path.join(data_folder, 'tvet_requirements.csv'))
+        compiled = compile_requirements(df)
+        self.assertEqual(len(compiled), len(df))
+        self.assertLess(len(set(map(id, compiled))), len(df))
+        self.assertIs(pickle.loads(pickle.dumps(compiled[0])), compiled[0])
+
+    # --- TEST 5: Fast mode agrees with the audited verdict ---
+    def test_05_fast_mode(self):
+        self.assertFalse(is_eligible(self.student, self.req))
+        self.student.grades['math'] = 'C'
+        self.assertTrue(is_eligible(self.student, self.req))
+        self.assertEqual(is_eligible(self.student, self.req), check_eligibility(self.student, self.req)[0])
+
+    # --- TEST 6: Lazy audit is built on first read ---
+    def test_06_lazy_audit(self):
+        is_ok, audit = check_eligibility(self.student, self.req, lazy=True)
+        self.assertFalse(is_ok)
+        self.assertIsNone(audit._items)
+        self.assertEqual(audit, check_eligibility(self.student, self.req)[1])
+        self.assertEqual([log['reason'] for log in audit if not log['passed']], ["Hanya 2 Kredit (Perlu 3)"])
+
+    # --- TEST 7: Rule stats reorder the fast path, never the verdict or audit ---
+    def test_07_adaptive_rule_order(self):
+        compiled = compile_requirement(self.req)
+        stats = RuleStats()
+        stats.record(self.student, compiled)
+        self.assertEqual(stats.counts['min_credits'], [1, 1])
+        self.assertEqual(stats.counts['pass_bm'], [1, 0])
+        self.assertEqual(stats.order()[0], 'min_credits')
+
+        before = check_eligibility(self.student, compiled)
+        set_rule_order(stats.order())
+        try:
+            self.assertEqual(rule_order()[0], 'min_credits')
+            self.assertIs(compiled.tests[0], compiled.academics[-1].test)
+            self.assertFalse(compiled.is_met(self.student))
+            self.assertEqual(check_eligibility(self.student, compiled), before)
+        finally:
+            set_rule_order(None)
+        self.assertIs(compiled.tests[0], compiled.gatekeepers[0].test)
+        self.assertEqual(RuleStats.from_dict(stats.to_dict()).counts, stats.counts)
+
+    # --- TEST 8: The app's sampled recorder adds to the saved counts ---
+    def test_08_sampled_recorder(self):
+        rules = [compile_requirement(self.req)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'rule_stats.json')
+            off = RuleStatsRecorder(path, sample=0.0)
+            off.maybe_record(self.student, rules)
+            self.assertEqual(off.flush().counts['min_credits'], [0, 0])
+
+            recorder = RuleStatsRecorder(path, sample=1.0, interval=60).start()
+            for _ in range(3):
+                recorder.maybe_record(self.student, rules)
+            recorder.stop()   # flushes
+            recorder.maybe_record(self.student, rules)
+            recorder.flush()
+            self.assertEqual(RuleStats.load(path).counts['min_credits'], [4, 4])
+            self.assertEqual(recorder.pending.counts['min_credits'], [0, 0])
+        print("✅ Compiler: sampled rule stats accumulate in the saved file")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.description import DEFAULT_PATH, DescriptionStore, get_course_details
+
+def read_all(path):
+    entries = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            entry = json.loads(line)
+            entries[entry.pop('course_id')] = entry
+    return entries
+
+class TestDescriptions(unittest.TestCase):
+
+    # --- TEST 1: Every course reads back from its offset; unknown ones get the placeholder ---
+    def test_01_lookup_and_fallback(self):
+        expected = read_all(DEFAULT_PATH)
+        store = DescriptionStore(cache_size=8)
+        self.assertEqual(len(store), len(expected))
+        for cid, entry in expected.items():
+            self.assertEqual(get_course_details(cid, "Nama", store), entry)
+        self.assertEqual(len(store.cache), 8)
+        self.assertTrue(any('pathway' in entry for entry in expected.values()))
+        placeholder = get_course_details('NO-SUCH-COURSE', "Kursus Baru", store)
+        self.assertEqual(placeholder['headline'], "Kursus Baru")
+        self.assertEqual(get_course_details('POLY-DIP-001', "x")['headline'], expected['POLY-DIP-001']['headline'])
+        print("\n✅ Descriptions: read on demand, placeholder for unknown courses")
+
+    # --- TEST 2: An edited file is re-indexed instead of returning the wrong line ---
+    def test_02_file_edited_after_indexing(self):
+        folder = tempfile.mkdtemp()
+        try:
+            path = os.path.join(folder, 'descriptions.jsonl')
+            shutil.copy(DEFAULT_PATH, path)
+            store = DescriptionStore(path)
+            store.offsets()
+            with open(path, encoding='utf-8') as f:
+                lines = f.readlines()
+            with open(path, 'w', encoding='utf-8') as f:
+                f.writelines(lines[1:] + lines[:1])   # every offset moves
+            last = json.loads(lines[-1])['course_id']
+            self.assertEqual(store.get(last), read_all(path)[last])
+            self.assertIsNone(DescriptionStore(os.path.join(folder, 'missing.jsonl')).get(last))
+        finally:
+            shutil.rmtree(folder)
+        print("✅ Descriptions: edits are re-indexed, a missing file falls back")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import SUBJECTS, load_and_clean_data
+from src.incremental import IncrementalEvaluator
+from src.index import RequirementIndex
+from test_vector import GRADES, random_cohort
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+CHOICES = {
+    'gender': ['Lelaki', 'Perempuan'], 'nationality': ['Warganegara', 'Bukan Warganegara'],
+    'colorblind': ['Tidak', 'Ya'], 'disability': ['Tidak', 'Ya'],
+    'other_tech': [False, True], 'other_voc': [False, True],
+}
+
+class TestIncrementalEvaluator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.indexes = [RequirementIndex(load_and_clean_data(os.path.join(DATA_FOLDER, f)))
+                       for f in ['requirements.csv', 'tvet_requirements.csv']]
+
+    # --- TEST 1: A chain of single-field edits tracks a full re-check ---
+    def test_01_what_if_chain(self):
+        rnd = random.Random(5)
+        for index in self.indexes:
+            for student in random_cohort(25, seed=21):
+                evaluator = IncrementalEvaluator(index, student)
+                for _ in range(30):
+                    field = rnd.choice(SUBJECTS + list(CHOICES))
+                    value = rnd.choice(CHOICES.get(field, GRADES))
+                    evaluator.update(field, value)
+                    if field in CHOICES:
+                        setattr(student, field, value)
+                    else:
+                        student.set_grade(field, value)
+                    self.assertEqual(evaluator.eligible_rows(), index.eligible_rows(student))
+                    self.assertEqual(evaluator.eligible_courses(), index.eligible_courses(student))
+
+    # --- TEST 2: sync() picks up whatever changed, caller's profile untouched ---
+    def test_02_sync(self):
+        index = self.indexes[0]
+        student = random_cohort(1, seed=3)[0]
+        evaluator = IncrementalEvaluator(index, student)
+        student.set_grade('bm', 'A')
+        student.set_grade('math', 'C')
+        student.colorblind = 'Ya'
+        evaluator.sync(student)
+        self.assertIsNot(evaluator.student, student)
+        self.assertEqual(evaluator.eligible_count(), len(index.eligible_courses(student)))
+        print(f"\n🔹 INCREMENTAL: {evaluator.eligible_count()} courses after sync")
+
+if __name__ == '__main__':
+    unittest.main()
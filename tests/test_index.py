@@ -0,0 +1,114 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import StudentProfile, check_eligibility, load_and_clean_data
+from src.index import RequirementIndex
+from src.stats import RuleSetStats
+from test_vector import random_cohort
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class TestRequirementIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tables = {f: load_and_clean_data(os.path.join(DATA_FOLDER, f))
+                      for f in ['requirements.csv', 'tvet_requirements.csv']}
+        cls.students = random_cohort(200, seed=7)
+
+    # --- TEST 1: Duplicate offerings collapse to one rule set ---
+    def test_01_signatures_deduplicated(self):
+        for filename, df in self.tables.items():
+            index = RequirementIndex(df)
+            print(f"\n🔹 INDEX: {filename}: {len(index)} rows -> {len(index.rules)} distinct rule sets")
+            self.assertEqual(len(index.rules), df['signature'].nunique())
+            self.assertEqual(sorted(i for m in index.members for i in m), list(range(len(df))))
+
+    # --- TEST 2: Fan-out gives the same rows as checking every row ---
+    def test_02_matches_row_by_row(self):
+        for df in self.tables.values():
+            index = RequirementIndex(df)
+            for student in self.students:
+                expected = [i for i, req in enumerate(index.rows) if check_eligibility(student, req)[0]]
+                self.assertEqual(index.eligible_rows(student), expected)
+
+    # --- TEST 3: Course ids come back once each ---
+    def test_03_unique_courses(self):
+        index = RequirementIndex(self.tables['tvet_requirements.csv'])
+        for student in self.students:
+            ids = index.eligible_courses(student)
+            self.assertEqual(len(ids), len(set(ids)))
+
+    # --- TEST 4: Closed gates are never visited, reasons still available ---
+    def test_04_gatekeeper_partitions(self):
+        index = RequirementIndex(self.tables['requirements.csv'])
+        student = StudentProfile(
+            grades={'bm': 'A', 'hist': 'A', 'math': 'A', 'phy': 'A'},
+            gender='Perempuan', nationality='Warganegara', colorblind='Ya', disability='Tidak'
+        )
+        visited = {index.rules[i].signature[:5] for i in index.open_rules(student)}
+        print(f"\n🔹 INDEX: colour-blind female visits {len(index.open_rules(student))} of {len(index.rules)} rule sets")
+        for gate in visited:
+            self.assertFalse(gate[1] or gate[3], f"visited a male-only / no_colorblind partition: {gate}")
+
+        blocked = next(i for i, req in enumerate(index.rows) if req['no_colorblind'] == 1)
+        self.assertNotIn(blocked, index.eligible_rows(student))
+        is_ok, audit = index.explain(student, blocked)
+        self.assertFalse(is_ok)
+        self.assertEqual(audit[-1]['reason'], "Tidak boleh rabun warna")
+
+    # --- TEST 5: Threshold pre-filter only drops rule sets that would fail ---
+    def test_05_threshold_candidates(self):
+        for df in self.tables.values():
+            index = RequirementIndex(df)
+            for student in self.students:
+                candidates = set(index.candidates(student))
+                for i in set(index.open_rules(student)) - candidates:
+                    self.assertFalse(index.rules[i].is_met(student))
+
+        weak = StudentProfile(
+            grades={'bm': 'G', 'math': 'G', 'hist': 'G', 'eng': 'G'},
+            gender='Lelaki', nationality='Warganegara', colorblind='Tidak', disability='Tidak'
+        )
+        index = RequirementIndex(self.tables['requirements.csv'])
+        self.assertEqual(index.candidates(weak), [])
+
+    # --- TEST 6: One verdict per course, naming the alternative that qualified ---
+    def test_06_course_verdicts(self):
+        for df in self.tables.values():
+            index = RequirementIndex(df)
+            for student in self.students:
+                rows = set(index.eligible_rows(student))
+                for course, row in index.course_verdicts(student).items():
+                    course_rows = {i for i, req in enumerate(index.rows) if req['course_id'] == course}
+                    if row is None:
+                        self.assertFalse(rows & course_rows)
+                    else:
+                        self.assertIn(row, rows & course_rows)
+
+    # --- TEST 7: Recorded pass rates reorder alternatives ---
+    def test_07_alternatives_by_pass_rate(self):
+        index = RequirementIndex(self.tables['tvet_requirements.csv'])
+        stats = RuleSetStats()
+        for student in self.students:
+            index.course_verdicts(student, stats)
+        evaluated = sum(e for e, _ in stats.counts.values())
+        print(f"\n🔹 INDEX: {evaluated} rule-set checks for {len(self.students)} students")
+        self.assertLessEqual(evaluated, len(self.students) * len(index.rules))
+
+        index.order_alternatives(RuleSetStats.from_dict(stats.to_dict()))
+        for alts in index.alternatives.values():
+            rates = [stats.pass_rate(index.keys[slot]) for slot, _ in alts]
+            self.assertEqual(rates, sorted(rates, reverse=True))
+        for student in self.students[:50]:
+            expected = [c for c in index.courses
+                        if any(check_eligibility(student, index.rows[i])[0]
+                               for i in range(len(index)) if index.rows[i]['course_id'] == c)]
+            self.assertEqual(index.eligible_courses(student), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import compile_requirement, is_eligible, load_and_clean_data, requirement_signature
+from src.index import RequirementIndex
+from src.lattice import IMPLIES, Lattice, redundant_rows, subsumes
+from test_vector import random_cohort
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class TestSubsumptionLattice(unittest.TestCase):
+
+    # --- TEST 1: Every implication holds for real students ---
+    def test_01_implications_are_sound(self):
+        cohort = random_cohort(3000, seed=13)
+        for strong, implied in IMPLIES.items():
+            for weak in implied:
+                a, b = compile_requirement({strong: 1}), compile_requirement({weak: 1})
+                self.assertTrue(subsumes(a.signature, b.signature))
+                for s in cohort:
+                    if a.is_met(s):
+                        self.assertTrue(b.is_met(s), f"{strong} passed but {weak} failed")
+        print("\n✅ Lattice: implications hold")
+
+    # --- TEST 2: Settled verdicts agree with a full check of every row ---
+    def test_02_index_uses_lattice(self):
+        for f in ['requirements.csv', 'tvet_requirements.csv']:
+            rows = load_and_clean_data(os.path.join(DATA_FOLDER, f)).to_dict('records')
+            index = RequirementIndex(rows)
+            self.assertIsInstance(index.lattice, Lattice)
+            for s in random_cohort(300, seed=17):
+                expected = [i for i, req in enumerate(rows) if is_eligible(s, req)]
+                self.assertEqual(index.eligible_rows(s), expected)
+        print("✅ Lattice: index verdicts unchanged")
+
+    # --- TEST 3: Redundant-row report ---
+    def test_03_redundant_rows(self):
+        rows = [
+            {'course_id': 'A', 'min_credits': 3, 'pass_bm': 1},
+            {'course_id': 'A', 'min_credits': 5, 'credit_bm': 1},                 # stronger than row 0
+            {'course_id': 'A', 'min_credits': 3, 'pass_bm': 1, 'remarks': 'x'},   # duplicate of row 0
+            {'course_id': 'B', 'min_credits': 5, 'credit_bm': 1},                 # other course: kept
+        ]
+        report = redundant_rows(rows)
+        self.assertEqual([(r['row'], r['covered_by'], r['reason']) for r in report],
+                         [(1, 0, 'stronger'), (2, 0, 'duplicate')])
+        # Credit BM already guarantees Pass BM, so these two are the same rule set
+        self.assertTrue(subsumes(requirement_signature({'credit_bm': 1}),
+                                 requirement_signature({'credit_bm': 1, 'pass_bm': 1})))
+        print("✅ Lattice: redundant rows reported")
+
+if __name__ == '__main__':
+    unittest.main()
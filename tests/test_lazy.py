@@ -0,0 +1,62 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lazy import RULE_GROUP, TEXT_COLUMNS, LazyCatalogue
+from src.loader import FILES, load_catalogue
+from src.snapshot import build_snapshot
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class TestLazyCatalogue(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.expected = load_catalogue(DATA_FOLDER)
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        for filename in FILES.values():
+            shutil.copy(os.path.join(DATA_FOLDER, filename), self.folder)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def assert_parts(self, tables):
+        for name in FILES:
+            full = getattr(self.expected, name)
+            text = TEXT_COLUMNS.get(name, [])
+            pd.testing.assert_frame_equal(getattr(tables, name), full.drop(columns=text), obj=name)
+            if text:
+                pd.testing.assert_frame_equal(tables.text(name), full[['course_id'] + text], obj=name)
+        for name in ['requirements', 'tvet_requirements']:
+            full = getattr(self.expected, name)
+            pd.testing.assert_frame_equal(tables.rules(name), full[[c for c in full.columns if c in RULE_GROUP]], obj=name)
+
+    # --- TEST 1: Nothing is read until asked for, then only that part ---
+    def test_01_reads_on_demand(self):
+        tables = LazyCatalogue(self.folder)
+        self.assertEqual(tables.loaded(), [])
+        tables.rules('requirements')
+        tables.tvet_courses
+        self.assertEqual(tables.loaded(), [('requirements', 'rules'), ('tvet_courses', 'table')])
+        self.assertNotIn('description', tables.tvet_courses.columns)
+        self.assertLess(tables.nbytes(), self.expected.tvet_courses.memory_usage(deep=True).sum())
+        print("\n✅ Lazy: only the parts asked for are read")
+
+    # --- TEST 2: Every part matches the eager loader, from the CSVs and from the snapshot ---
+    def test_02_parts_match_loader(self):
+        self.assert_parts(LazyCatalogue(self.folder))
+        build_snapshot(self.folder)
+        self.assert_parts(LazyCatalogue(self.folder))
+        print("✅ Lazy: column groups equal the full tables (CSV and snapshot)")
+
+if __name__ == '__main__':
+    unittest.main()
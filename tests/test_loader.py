@@ -0,0 +1,82 @@
+import unittest
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import FLAG_COLUMNS, load_and_clean_data
+from src.loader import SchemaError, invalid_counts, invalid_flags, load_catalogue, read_raw, read_table
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class TestLoader(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data = load_catalogue(DATA_FOLDER)
+
+    # --- TEST 1: Every table comes back with the compact types ---
+    def test_01_typed_tables(self):
+        for name in ['requirements', 'tvet_requirements']:
+            df = getattr(self.data, name)
+            for col in FLAG_COLUMNS + ['min_credits', 'min_pass']:
+                if col in df.columns:
+                    self.assertEqual(str(df[col].dtype), 'int8', (name, col))
+            self.assertEqual(str(df['course_id'].dtype), 'category')
+            self.assertIn('signature', df.columns)
+        self.assertEqual(str(self.data.tvet_institutions['state'].dtype), 'category')
+        self.assertIn('monthly_allowance', self.data.tvet_requirements.columns)
+        # utf-8 text stays intact, latin1 files still load
+        self.assertTrue(self.data.tvet_courses['description'].str.contains('–').any())
+        self.assertEqual(len(self.data.tvet_institutions), 55)
+        print("\n✅ Loader: compact typed tables")
+
+    # --- TEST 2: The engine's loader and the app's dicts see the same rows ---
+    def test_02_shared_by_engine(self):
+        df = load_and_clean_data(os.path.join(DATA_FOLDER, 'requirements.csv'))
+        self.assertEqual(df.to_dict('records'), self.data.requirements.to_dict('records'))
+        self.assertIsInstance(self.data.requirements.to_dict('records')[0]['course_id'], str)
+        print("✅ Loader: engine and app share one reader")
+
+    # --- TEST 3: Missing columns, blanks and junk values ---
+    def test_03_schema_and_coercion(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'links.csv')
+            with open(path, 'w') as f:
+                f.write("\ufeffCourse_ID ,Pass_BM\n X1 ,Yes\n")
+            with self.assertRaises(SchemaError):
+                read_table(path)
+            with open(path, 'w') as f:
+                f.write("\ufeffCourse_ID ,Institution_ID,Pass_BM,Min_Credits\n X1 , I1,1,\n X2,I2, ,3\n")
+            df = read_table(path)
+            self.assertEqual(df.to_dict('records'), [{'course_id': 'X1', 'institution_id': 'I1', 'pass_bm': 1, 'min_credits': 0},
+                                                     {'course_id': 'X2', 'institution_id': 'I2', 'pass_bm': 0, 'min_credits': 3}])
+            # Textual or out-of-range flags are reported, not read as 0
+            for bad in ["Yes,3", "2,3", "1,lima"]:
+                with open(path, 'w') as f:
+                    f.write(f"Course_ID,Institution_ID,Pass_BM,Min_Credits\nX1,I1,1,3\nX2,I2,{bad}\n")
+                with self.assertRaises(SchemaError) as raised:
+                    read_table(path)
+                self.assertIn("[3]", str(raised.exception))
+            self.assertEqual(read_raw(path).loc[1, 'min_credits'], 'lima')
+            # The audit flags exactly the cells the loader rejects
+            raw = read_raw(path)
+            self.assertEqual(invalid_counts(raw['min_credits']).tolist(), [False, True])
+            self.assertEqual(invalid_counts(pd.Series(['3', '3.0', '200', ''])).tolist(), [False, False, True, False])
+            self.assertEqual(invalid_flags(pd.Series(['1', '1.0', '0', ' ', 'Yes', '2'])).tolist(),
+                             [False, False, False, False, True, True])
+            # Display-only flags keep their old reading: yes/true count as set, the file still loads
+            with open(path, 'w') as f:
+                f.write("Course_ID,Institution_ID,Req_Interview,Free_Hostel\nX1,I1,Yes,TRUE\nX2,I2,0,tiada\nX3,I3,1,\n")
+            df = read_table(path)
+            self.assertEqual(df['req_interview'].tolist(), [1, 0, 1])
+            self.assertEqual(df['free_hostel'].tolist(), [1, 0, 0])
+            self.assertEqual(str(df['req_interview'].dtype), 'int8')
+        print("✅ Loader: schema checks, blanks as 0, bad engine values rejected")
+
+if __name__ == '__main__':
+    unittest.main()
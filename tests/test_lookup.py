@@ -0,0 +1,65 @@
+import unittest
+import tempfile
+import sys
+import os
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import load_and_clean_data
+from src.index import RequirementIndex
+from src.lookup import COUNT_MAX, LookupTable, build_lookup, class_key, load_lookup
+from test_vector import random_cohort
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class TestLookupTable(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.indexes = [RequirementIndex(load_and_clean_data(os.path.join(DATA_FOLDER, f)))
+                       for f in ['requirements.csv', 'tvet_requirements.csv']]
+        cls.tables = [build_lookup(index) for index in cls.indexes]
+        cls.students = random_cohort(500, seed=11)
+
+    # --- TEST 1: Every student lands in a known class with the right answer ---
+    def test_01_matches_index(self):
+        for index, table in zip(self.indexes, self.tables):
+            print(f"\n🔹 LOOKUP: {len(table)} classes, {len(table.sets)} distinct course sets")
+            for student in self.students:
+                self.assertEqual(table.lookup(student), index.eligible_courses(student))
+
+    # --- TEST 2: Save / load round trip, attached to the index ---
+    def test_02_round_trip(self):
+        index, table = self.indexes[1], self.tables[1]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'tvet.npz')
+            table.save(path)
+            loaded = LookupTable.load(path, index)
+            expected = [index.eligible_courses(s) for s in self.students[:50]]
+            index.attach_lookup(loaded)
+            try:
+                self.assertEqual([index.eligible_courses(s) for s in self.students[:50]], expected)
+            finally:
+                index.attach_lookup(None)
+
+    # --- TEST 3: Tables from other data are refused ---
+    def test_03_stale_table(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'poly.npz')
+            self.tables[0].save(path)
+            with self.assertRaises(ValueError):
+                LookupTable.load(path, self.indexes[1])
+            self.assertIsNone(load_lookup(path, self.indexes[1]))
+            self.assertIsNone(load_lookup(os.path.join(tmp, 'missing.npz'), self.indexes[0]))
+
+    # --- TEST 4: Thresholds too big for the packed key are refused, not collided ---
+    def test_04_key_width(self):
+        rows = load_and_clean_data(os.path.join(DATA_FOLDER, 'requirements.csv')).to_dict('records')
+        rows[0]['min_credits'] = COUNT_MAX + 1
+        with self.assertRaises(ValueError):
+            build_lookup(RequirementIndex(rows))
+        self.assertNotEqual(class_key(1, COUNT_MAX, 0), class_key(0, 0, COUNT_MAX))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import csv
+import json
+import os
+import sys
+import tempfile
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cohort import Screener, load_indexes, read_records, screen_records
+from src.engine import SUBJECTS
+from src.pipeline import run_pipeline
+from test_vector import GRADES
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class Interrupted(Exception):
+    pass
+
+def write_applicants(path, n, student_id=lambda i: f"A{i}"):
+    header = ['student_id'] + SUBJECTS + ['gender', 'nationality', 'other_voc']
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator="\n", quoting=csv.QUOTE_ALL)
+        writer.writerow(header)
+        for i in range(n):
+            grades = [GRADES[(i * 5 + k * 7) % len(GRADES)] if (i + k) % 3 else '' for k in range(len(SUBJECTS))]
+            nationality = 'Bukan Warganegara' if i % 17 == 0 else 'Warganegara'
+            writer.writerow([student_id(i)] + grades + [['Lelaki', 'Perempuan'][i % 2], nationality, str(i % 4 == 0)])
+
+class TestChunkedPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.tmp.name, "applicants.csv")
+        self.output = os.path.join(self.tmp.name, "results.ndjson")
+        write_applicants(self.input, 250)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    # --- TEST 1: Same results as the per-student cohort screener ---
+    def test_01_matches_cohort(self):
+        state = run_pipeline(self.input, self.output, chunk_size=60, data_folder=DATA_FOLDER, progress=None)
+        self.assertEqual((state['chunks'], state['students']), (5, 250))
+        with open(self.input, newline='') as f:
+            expected = list(screen_records(read_records(f, 'csv'), Screener(load_indexes(DATA_FOLDER))))
+        with open(self.output) as f:
+            self.assertEqual([json.loads(line) for line in f], expected)
+        self.assertFalse(os.path.exists(self.output + ".checkpoint.json"))
+        print("\n✅ Pipeline: chunked results match the cohort screener")
+
+    # --- TEST 2: Resume after an interruption, discarding the half-written chunk ---
+    def test_02_resume(self):
+        def stop_after_two(state, elapsed):
+            if state['chunks'] == 2:
+                raise Interrupted()
+        with self.assertRaises(Interrupted):
+            run_pipeline(self.input, self.output, chunk_size=60, data_folder=DATA_FOLDER, progress=stop_after_two)
+        with open(self.output, 'a') as f:
+            f.write('{"student_id": "A12')   # a crash mid-write
+        seen = []
+        state = run_pipeline(self.input, self.output, chunk_size=60, data_folder=DATA_FOLDER,
+                             progress=lambda state, elapsed: seen.append(state['chunks']))
+        self.assertEqual(seen, [3, 4, 5])
+        with open(self.output) as f:
+            resumed = f.read()
+        run_pipeline(self.input, self.output, chunk_size=60, data_folder=DATA_FOLDER, progress=None)
+        with open(self.output) as f:
+            self.assertEqual(resumed, f.read())
+        with self.assertRaises(ValueError):
+            with self.assertRaises(Interrupted):
+                run_pipeline(self.input, self.output, chunk_size=60, data_folder=DATA_FOLDER, progress=stop_after_two)
+            run_pipeline(self.input, self.output, chunk_size=50, data_folder=DATA_FOLDER, progress=None)
+        print("✅ Pipeline: resumes from the last completed chunk")
+
+    # --- TEST 3: Resuming counts records, not lines ---
+    def test_03_resume_with_multiline_records(self):
+        write_applicants(self.input, 250, lambda i: f"A{i}\nlama" if i % 7 == 0 else f"A{i}")
+        run_pipeline(self.input, self.output, chunk_size=60, data_folder=DATA_FOLDER, progress=None)
+        with open(self.output) as f:
+            expected = f.read()
+
+        def stop_after_two(state, elapsed):
+            if state['chunks'] == 2:
+                raise Interrupted()
+        with self.assertRaises(Interrupted):
+            run_pipeline(self.input, self.output, chunk_size=60, data_folder=DATA_FOLDER, progress=stop_after_two)
+        run_pipeline(self.input, self.output, chunk_size=60, data_folder=DATA_FOLDER, progress=None)
+        with open(self.output) as f:
+            self.assertEqual(f.read(), expected)
+        print("✅ Pipeline: resume skips whole records when ids span lines")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add parent directory to path to import src
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'scripts'))
+
+from src import predicates
+from src.codegen import generate
+from src.engine import is_eligible, load_and_clean_data
+from build_predicates import OUTPUT, TRACKS, build
+from test_vector import random_cohort
+
+DATA_FOLDER = os.path.join(ROOT, 'data')
+
+class TestGeneratedPredicates(unittest.TestCase):
+
+    # --- TEST 1: The committed module matches the committed data ---
+    def test_01_up_to_date(self):
+        with open(OUTPUT) as f:
+            committed = f.read()
+        self.assertEqual(committed, build(DATA_FOLDER),
+                         "src/predicates.py is stale, run scripts/build_predicates.py")
+        print("\n✅ Codegen: src/predicates.py up to date")
+
+    # --- TEST 2: Every dispatch entry answers like check_eligibility over all its rows ---
+    def test_02_matches_engine(self):
+        cohort = random_cohort(300, seed=31)
+        for table_name, (filename, key_columns) in TRACKS.items():
+            table = getattr(predicates, table_name)
+            rows = load_and_clean_data(os.path.join(DATA_FOLDER, filename)).to_dict('records')
+            assert_matches_engine(self, predicates, table, rows, key_columns, cohort)
+        print("✅ Codegen: generated predicates match the engine")
+
+    # --- TEST 3: A course with two alternatives passes through either one ---
+    def test_03_alternatives(self):
+        cohort = random_cohort(300, seed=37)
+        rows = load_and_clean_data(os.path.join(DATA_FOLDER, 'requirements.csv')).to_dict('records')
+        # A strict row and a looser one some student passes while failing the strict one
+        strict, loose = next((a, b) for a in rows for b in rows
+                             if any(is_eligible(s, b) and not is_eligible(s, a) for s in cohort))
+        fixture = [strict, dict(loose, course_id=strict['course_id'])]
+        module = {}
+        exec(generate({'POLY': (fixture, ['course_id'])}), module)
+        module = SimpleNamespace(**module)
+        self.assertEqual(len(module.POLY[strict['course_id']]), 2)
+        assert_matches_engine(self, module, module.POLY, fixture, ['course_id'], cohort)
+        print("✅ Codegen: alternatives are OR-ed like the engine")
+
+def assert_matches_engine(test, module, table, rows, key_columns, cohort):
+    """module.check(table, key) against is_eligible on any of the key's rows."""
+    by_key = {}
+    for req in rows:
+        key = tuple(str(req[col]).strip() for col in key_columns)
+        by_key.setdefault(key[0] if len(key) == 1 else key, []).append(req)
+    test.assertEqual(set(table), set(by_key))
+    for key, reqs in by_key.items():
+        for s in cohort:
+            test.assertEqual(module.check(table, key, s), any(is_eligible(s, req) for req in reqs), key)
+
+if __name__ == '__main__':
+    unittest.main()
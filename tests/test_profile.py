@@ -0,0 +1,50 @@
+import unittest
+import pickle
+import sys
+import os
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import StudentProfile
+
+class TestStudentProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.student = StudentProfile(
+            grades={'bm': 'C', 'math': 'G', 'chem': 'D', 'rc': 'B', 'geo': 'Tidak Ambil', 'pa': 'A'},
+            gender='Lelaki', nationality='Warganegara', colorblind='Tidak', disability='Tidak'
+        )
+
+    # --- TEST 1: Aggregates worked out at construction ---
+    def test_01_precomputed_aggregates(self):
+        s = self.student
+        self.assertEqual((s.credits, s.passes), (3, 4))  # bm, rc, pa credits; + chem pass
+        self.assertTrue(s.three_m)
+        self.assertTrue(s.pure_sci_pass)
+        self.assertFalse(s.pure_sci_credit)
+        self.assertTrue(s.sci_tech_credit)
+
+    # --- TEST 2: Grades read back as a dict-like view ---
+    def test_02_grade_view(self):
+        g = self.student.grades
+        self.assertEqual(g.get('bm'), 'C')
+        self.assertIsNone(g.get('geo'))  # 'Tidak Ambil' is not stored
+        self.assertEqual(dict(g.items()), {'bm': 'C', 'math': 'G', 'chem': 'D', 'rc': 'B', 'pa': 'A'})
+
+    # --- TEST 3: Writing a grade refreshes counts and groups ---
+    def test_03_write_through(self):
+        self.student.grades['chem'] = 'A'
+        self.student.grades['bm'] = 'Tidak Ambil'
+        self.assertEqual((self.student.credits, self.student.passes), (3, 3))
+        self.assertTrue(self.student.pure_sci_credit)
+        self.assertFalse(self.student.three_m)
+
+    # --- TEST 4: Compact and picklable ---
+    def test_04_slots(self):
+        self.assertFalse(hasattr(self.student, '__dict__'))
+        copy = pickle.loads(pickle.dumps(self.student))
+        self.assertEqual(dict(copy.grades.items()), dict(self.student.grades.items()))
+
+if __name__ == '__main__':
+    unittest.main()
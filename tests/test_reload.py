@@ -0,0 +1,133 @@
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lazy import StaleDataError
+from src.loader import FILES
+from src.reload import DataStore
+from src.snapshot import read_manifest, snapshot_dir
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+def edit_csv(folder, filename, change):
+    path = os.path.join(folder, filename)
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    change(df)
+    df.to_csv(path, index=False)
+
+class TestReload(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        for filename in FILES.values():
+            shutil.copy(os.path.join(DATA_FOLDER, filename), self.folder)
+        self.store = DataStore(self.folder)
+
+    def tearDown(self):
+        self.store.stop()
+        shutil.rmtree(self.folder)
+
+    # --- TEST 1: Only the changed file is re-read, only its index rebuilt ---
+    def test_01_partial_reload(self):
+        before = self.store.current
+        courses, requirements = before.tables.courses, before.tables.requirements
+        os.utime(os.path.join(self.folder, 'requirements.csv'), (0, 0))
+        self.assertEqual(self.store.check(), [])
+
+        def raise_credits(df):
+            df['min_credits'] = 9
+        edit_csv(self.folder, 'requirements.csv', raise_credits)
+        self.assertEqual(self.store.check(), ['requirements.csv'])
+        after = self.store.current
+        self.assertNotEqual(after.version, before.version)
+        self.assertIsNot(after.poly_index, before.poly_index)
+        self.assertIs(after.tvet_index, before.tvet_index)
+        self.assertIs(after.tables.courses, courses)
+        self.assertEqual(int(after.tables.requirements['min_credits'].max()), 9)
+        # What the old Dataset had loaded is untouched, for sessions still using it
+        self.assertIs(before.tables.requirements, requirements)
+        self.assertLess(int(requirements['min_credits'].max()), 9)
+        print("\n✅ Reload: changed file swapped in, the rest reused")
+
+    # --- TEST 2: A broken file keeps the last good version; the watcher picks up the fix ---
+    def test_02_bad_file_and_watcher(self):
+        before = self.store.current
+        links = len(before.tables.links)
+        edit_csv(self.folder, 'links.csv', lambda df: df.drop(columns=['institution_id'], inplace=True))
+        self.assertEqual(self.store.check(), [])
+        self.assertIs(self.store.current, before)
+        self.assertIn('links.csv', self.store.error)
+
+        shutil.copy(os.path.join(DATA_FOLDER, 'links.csv'), self.folder)
+        edit_csv(self.folder, 'links.csv', lambda df: df.drop(index=0, inplace=True))
+        self.store.interval = 0.05
+        self.store.start()
+        deadline = time.time() + 5
+        while self.store.current is before and time.time() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(len(self.store.current.tables.links), links - 1)
+        self.assertIsNone(self.store.error)
+        print("✅ Reload: bad file ignored, background watcher loads the fix")
+
+    # --- TEST 3: Descriptions are optional and reloaded on their own ---
+    def test_03_descriptions(self):
+        before = self.store.current
+        self.assertIsNone(before.files['descriptions.jsonl'])
+        self.assertEqual(before.descriptions.get('POLY-DIP-001'), None)
+        with open(os.path.join(self.folder, 'descriptions.jsonl'), 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'course_id': 'POLY-DIP-001', 'headline': 'Baru', 'synopsis': '', 'jobs': []}) + "\n")
+        self.assertEqual(self.store.check(), ['descriptions.jsonl'])
+        after = self.store.current
+        self.assertEqual(after.descriptions.get('POLY-DIP-001')['headline'], 'Baru')
+        self.assertIs(after.tables, before.tables)
+        self.assertIs(after.poly_index, before.poly_index)
+        print("✅ Reload: new descriptions file picked up without touching the tables")
+
+    # --- TEST 4: A changed file is validated even if its table was never loaded ---
+    def test_04_unloaded_file_validated(self):
+        before = self.store.current
+        self.assertNotIn(('courses', 'table'), before.tables.loaded())
+        edit_csv(self.folder, 'courses.csv', lambda df: df.drop(columns=['course'], inplace=True))
+        self.assertEqual(self.store.check(), [])
+        self.assertIs(self.store.current, before)
+        self.assertIn('courses.csv', self.store.error)
+        print("✅ Reload: a broken file is caught before the swap, loaded or not")
+
+    # --- TEST 5: An old Dataset never reads the new files ---
+    def test_05_old_dataset_reads_old_content(self):
+        self.assertIsNone(read_manifest(self.folder))   # not built on the startup path
+        self.store.start()
+        deadline = time.time() + 10
+        while read_manifest(self.folder) is None and time.time() < deadline:
+            time.sleep(0.05)
+        self.store.stop()
+        before = self.store.current
+        rules = before.tables.rules('requirements')   # loaded; courses are not
+        old = pd.read_csv(os.path.join(self.folder, 'courses.csv'), encoding='utf-8-sig').loc[0, 'course']
+
+        def rename(df):
+            df.loc[0, 'course'] = 'Kursus Baru'
+        edit_csv(self.folder, 'courses.csv', rename)
+        self.assertEqual(self.store.check(), ['courses.csv'])
+        self.assertEqual(self.store.current.tables.courses.loc[0, 'course'], 'Kursus Baru')
+        self.assertEqual(before.tables.courses.loc[0, 'course'], old)   # from the snapshot of the old file
+
+        shutil.rmtree(snapshot_dir(self.folder))
+        edit_csv(self.folder, 'links.csv', lambda df: df.drop(index=0, inplace=True))
+        self.assertEqual(self.store.check(), ['links.csv'])
+        with self.assertRaises(StaleDataError):
+            before.tables.links
+        self.assertIs(before.tables.rules('requirements'), rules)
+        print("✅ Reload: old versions read old content or refuse, never the new files")
+
+if __name__ == '__main__':
+    unittest.main()
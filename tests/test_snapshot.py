@@ -0,0 +1,78 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.loader import FILES, load_catalogue
+from src import snapshot
+from src.snapshot import build_snapshot, load_snapshot, refresh_snapshot
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        for filename in FILES.values():
+            shutil.copy(os.path.join(DATA_FOLDER, filename), self.folder)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    # --- TEST 1: The snapshot gives back exactly the CSV tables ---
+    def test_01_round_trip(self):
+        expected = load_catalogue(self.folder)
+        build_snapshot(self.folder)
+        loaded = load_snapshot(self.folder)
+        for name, want, got in zip(expected._fields, expected, loaded):
+            pd.testing.assert_frame_equal(got, want, obj=name)
+        print("\n✅ Snapshot: all tables round-trip with their dtypes")
+
+    # --- TEST 2: Touching a CSV keeps the snapshot, editing it does not ---
+    def test_02_invalidation(self):
+        self.assertIsNone(load_snapshot(self.folder))
+        self.assertTrue(refresh_snapshot(self.folder))   # builds it
+        self.assertIsNotNone(load_snapshot(self.folder))
+
+        path = os.path.join(self.folder, 'requirements.csv')
+        os.utime(path, (0, 0))
+        self.assertIsNotNone(load_snapshot(self.folder))
+
+        df = pd.read_csv(path, encoding='utf-8-sig')
+        df.loc[0, 'min_credits'] = 9
+        df.to_csv(path, index=False)
+        self.assertIsNone(load_snapshot(self.folder))
+        self.assertTrue(refresh_snapshot(self.folder))
+        self.assertEqual(int(load_snapshot(self.folder).requirements.loc[0, 'min_credits']), 9)
+        print("✅ Snapshot: rebuilt only when a CSV's content changes")
+
+    # --- TEST 3: A CSV edited while the snapshot is built is not stored under its new hash ---
+    def test_03_edit_during_build(self):
+        path = os.path.join(self.folder, 'requirements.csv')
+        parsed = []
+        def load_then_edit(data_folder):
+            catalogue = load_catalogue(data_folder)
+            if not parsed:
+                df = pd.read_csv(path, encoding='utf-8-sig')
+                df.loc[0, 'min_credits'] = 9
+                df.to_csv(path, index=False)
+            parsed.append(catalogue)
+            return catalogue
+        original = snapshot.load_catalogue
+        snapshot.load_catalogue = load_then_edit
+        try:
+            self.assertIsNotNone(build_snapshot(self.folder))
+        finally:
+            snapshot.load_catalogue = original
+        self.assertEqual(len(parsed), 2)
+        self.assertEqual(int(load_snapshot(self.folder).requirements.loc[0, 'min_credits']), 9)
+        print("✅ Snapshot: a mid-build edit makes the build start over")
+
+if __name__ == '__main__':
+    unittest.main()
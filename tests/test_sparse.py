@@ -0,0 +1,95 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.pipeline import SparseOutput, run_pipeline
+from src.sparse import SparseEligibility
+from test_pipeline import Interrupted, write_applicants
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class TestSparseEligibility(unittest.TestCase):
+
+    # --- TEST 1: Set questions on a small matrix ---
+    def test_01_queries(self):
+        matrix = np.array([[1, 1, 0], [0, 1, 0], [1, 0, 1], [0, 0, 0]], dtype=bool)
+        e = SparseEligibility.from_matrix(matrix, ['POLY-A', 'POLY-B', 'IKBN-C'], ['s1', 's2', 's3', 's4'])
+        self.assertEqual(e.nnz, 5)
+        self.assertEqual(e.eligible('POLY-A').tolist(), [0, 2])
+        self.assertEqual(e.difference('POLY-B', 'POLY-A').tolist(), [1])
+        self.assertEqual(e.any_of(e.courses_like('POLY')).tolist(), [0, 1, 2])
+        self.assertEqual(e.all_of(['POLY-A', 'IKBN-C']).tolist(), [2])
+        self.assertEqual(e.ids(e.any_of(['IKBN-C'])), ['s3'])
+        self.assertEqual(e.student_courses(0), ['POLY-A', 'POLY-B'])
+        np.testing.assert_array_equal(np.unpackbits(e.bitmap('POLY-A'), count=4).astype(bool), matrix[:, 0])
+        self.assertEqual(e.course_counts(), {'POLY-A': 2, 'POLY-B': 2, 'IKBN-C': 1})
+        print("\n✅ Sparse: set queries")
+
+    # --- TEST 2: Pipeline writes the same matrix as its NDJSON, across a resume ---
+    def test_02_pipeline_sparse_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            applicants = os.path.join(tmp, "applicants.csv")
+            write_applicants(applicants, 230)
+            run_pipeline(applicants, os.path.join(tmp, "r.ndjson"), 50, DATA_FOLDER, progress=None)
+
+            def stop(state, elapsed):
+                if state['chunks'] == 3: raise Interrupted()
+            out = os.path.join(tmp, "r.npz")
+            with self.assertRaises(Interrupted):
+                run_pipeline(applicants, out, 50, DATA_FOLDER, progress=stop, fmt='sparse')
+            run_pipeline(applicants, out, 50, DATA_FOLDER, progress=None, fmt='sparse')
+            self.assertEqual(sorted(os.listdir(tmp)), ["applicants.csv", "r.ndjson", "r.npz"])
+
+            e = SparseEligibility.load(out)
+            with open(os.path.join(tmp, "r.ndjson")) as f:
+                results = [json.loads(line) for line in f]
+            self.assertEqual(e.students.tolist(), [r['student_id'] for r in results])
+            for i, r in enumerate(results):
+                self.assertEqual(sorted(e.student_courses(i)), sorted(r['poly'] + r['kk'] + r['tvet']))
+        print("✅ Sparse: pipeline output matches NDJSON")
+
+    # --- TEST 3: Packing in small blocks gives the same CSR as the in-memory build ---
+    def test_03_streamed_packing(self):
+        rng = np.random.default_rng(5)
+        matrix = rng.random((97, 6)) < 0.3
+        tables = {'poly': SimpleNamespace(courses=['P1', 'P2', 'P3', 'P4']), 'tvet': SimpleNamespace(courses=['T1', 'T2'])}
+        ids = [f"S{i}" * (1 + i % 3) for i in range(len(matrix))]
+        with tempfile.TemporaryDirectory() as tmp:
+            out = SparseOutput(os.path.join(tmp, "r.npz"), tables)
+            students, courses = np.nonzero(matrix)
+            with open(out.paths[0], 'wb') as f:
+                f.write(np.column_stack([courses, students]).astype(np.int32).tobytes())
+            with open(out.paths[1], 'w', encoding='utf-8') as f:
+                f.write("".join(sid + "\n" for sid in ids))
+            out.finish(block=7)
+            self.assertEqual(sorted(os.listdir(tmp)), ["r.npz"])
+            e = SparseEligibility.load(out.path)
+        expected = SparseEligibility.from_matrix(matrix, out.courses, ids)
+        np.testing.assert_array_equal(e.indptr, expected.indptr)
+        np.testing.assert_array_equal(e.indices, expected.indices)
+        self.assertEqual(e.students.tolist(), ids)
+        print("✅ Sparse: streamed packing matches the in-memory CSR")
+
+    # --- TEST 4: Ids with line breaks stay one student each ---
+    def test_04_ids_with_line_breaks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            applicants = os.path.join(tmp, "applicants.csv")
+            write_applicants(applicants, 40, lambda i: ["A\rB", "C\nD", "E\r\nF"][i % 3] + str(i))
+            out = os.path.join(tmp, "r.npz")
+            run_pipeline(applicants, out, 15, DATA_FOLDER, progress=None, fmt='sparse')
+            e = SparseEligibility.load(out)
+        self.assertEqual(len(e.students), 40)
+        self.assertEqual(e.students.tolist()[:3], ["A B0", "C D1", "E  F2"])
+        self.assertEqual(len(e.indptr), len(e.courses) + 1)
+        print("✅ Sparse: ids with line breaks keep the students aligned")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import random
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path to import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine import SUBJECTS, StudentProfile, check_eligibility, load_and_clean_data
+from src.vector import eligibility_matrix, encode_requirements, encode_students
+
+GRADES = ["A+", "A", "A-", "B+", "B", "C+", "C", "D", "E", "G", "Tidak Ambil"]
+
+def random_cohort(n, seed=2024):
+    """Deterministic cohort that covers every grade, demographic and checkbox."""
+    rnd = random.Random(seed)
+    students = []
+    for _ in range(n):
+        grades = {s: rnd.choice(GRADES) for s in SUBJECTS if rnd.random() < 0.7}
+        students.append(StudentProfile(
+            grades=grades,
+            gender=rnd.choice(['Lelaki', 'Perempuan']),
+            nationality=rnd.choice(['Warganegara', 'Warganegara', 'Bukan Warganegara']),
+            colorblind=rnd.choice(['Tidak', 'Tidak', 'Ya']),
+            disability=rnd.choice(['Tidak', 'Tidak', 'Ya']),
+            other_tech=rnd.random() < 0.2, other_voc=rnd.random() < 0.2
+        ))
+    return students
+
+class TestVectorEngine(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        data_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+        cls.df = pd.concat([load_and_clean_data(os.path.join(data_folder, f))
+                            for f in ['requirements.csv', 'tvet_requirements.csv']], ignore_index=True)
+        cls.rows = cls.df.to_dict('records')
+        cls.students = random_cohort(300)
+
+    # --- TEST 1: Matrix matches the scalar engine cell by cell ---
+    def test_01_matches_scalar_engine(self):
+        matrix = eligibility_matrix(self.students, self.df)
+        expected = np.array([[check_eligibility(s, req)[0] for req in self.rows] for s in self.students])
+
+        print("\n🔹 VECTOR ENGINE: Students x Rows")
+        print(f"   Shape: {matrix.shape} | Eligible cells: {int(matrix.sum())}")
+        self.assertEqual(matrix.shape, expected.shape)
+        self.assertTrue((matrix == expected).all(), f"{int((matrix != expected).sum())} cells differ")
+
+    # --- TEST 2: Pre-encoded arrays give the same answer ---
+    def test_02_encoded_inputs(self):
+        matrix = eligibility_matrix(encode_students(self.students), encode_requirements(self.rows))
+        self.assertTrue((matrix == eligibility_matrix(self.students, self.rows)).all())
+
+    # --- TEST 3: Unknown subject keys still count towards credits ---
+    def test_03_counts_from_profile(self):
+        student = StudentProfile({'A+': 'A+', 'A': 'A', 'C': 'C'}, 'Lelaki', 'Warganegara', 'Tidak', 'Tidak')
+        req = {'min_credits': 3}
+        self.assertTrue(eligibility_matrix([student], [req])[0, 0])
+        self.assertEqual(eligibility_matrix([student], [req])[0, 0], check_eligibility(student, req)[0])
+
+if __name__ == '__main__':
+    unittest.main()